@@ -76,8 +76,20 @@ class ChessGameModel():
     # Take Opponent Turn
     def computeBestMove(self) -> MoveCommand:
         if self.currOpeningMove and self.currOpeningMove.hasSubsequentCmd():
+            self.game_engine.stop_ponder()
             return self.currOpeningMove.randomSubsequentCmd()
         
-        # Rust Compute Next Move
+        # Rust Compute Next Move - Resumes the Ponder Search on a Ponder Hit
         uci_move = self.game_engine.compute_next_move(self.returnChessMoves())
         return self.chessBoard.uci_to_move_command(uci_move)
+
+    # Search the Predicted Reply on the Opponent's Time
+    def startPondering(self):
+        if self.currOpeningMove and self.currOpeningMove.hasSubsequentCmd():
+            return
+
+        self.game_engine.start_ponder(self.returnChessMoves())
+
+    # Abandon the Ponder Search
+    def stopPondering(self):
+        self.game_engine.stop_ponder()
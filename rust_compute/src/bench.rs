@@ -0,0 +1,161 @@
+use std::sync::atomic::AtomicUsize;
+use std::sync::{Arc, Mutex};
+
+use crate::chess_board::*;
+use crate::chess_game::*;
+use crate::engine_options::*;
+use crate::nnue_network::*;
+use crate::parser::*;
+use crate::search_control::*;
+use crate::search_worker::*;
+use crate::time_manager::*;
+use crate::transposition_table::*;
+
+// Default bench depth - A few seconds per run on the Mac M4 Pro
+pub const BENCH_DEPTH: i32 = 8;
+
+// Fixed suite covering the opening, sharp middlegames and pawn / rook endgames.
+// Changing it changes the node signature.
+pub const BENCH_FENS: [&str; 10] = [
+    START_FEN,
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "4rrk1/pp1n3p/3q2pQ/2p1pb2/2PP4/2P3N1/P2B2PP/4RRK1 b - - 7 19",
+    "r3r1k1/2p2ppp/p1p1bn2/8/1q2P3/2NPQN2/PPP3PP/R4RK1 b - - 2 15",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1",
+    "8/8/8/8/5kp1/P7/8/1K1N4 w - - 0 1",
+];
+
+// One position searched to the bench depth
+struct BenchPosition {
+    best_move: String,
+    nodes: usize,
+    elapsed_ms: u128,
+    // Elapsed time when each depth completed, starting at depth 1
+    time_to_depth_ms: Vec<u128>,
+}
+
+// The suite at one thread count
+struct BenchRun {
+    threads: usize,
+    positions: Vec<BenchPosition>,
+}
+
+impl BenchRun {
+    fn nodes(&self) -> usize {
+        self.positions.iter().map(|position| position.nodes).sum()
+    }
+
+    fn elapsed_ms(&self) -> u128 {
+        self.positions.iter().map(|position| position.elapsed_ms).sum()
+    }
+
+    fn nps(&self) -> u128 {
+        self.nodes() as u128 * 1000 / self.elapsed_ms().max(1)
+    }
+
+    // Summed over the suite - Depths a search didn't reach are left out
+    fn time_to_depth_ms(&self, depth: i32) -> Vec<u128> {
+        (0..depth as usize)
+            .map(|index| {
+                self.positions.iter()
+                    .filter_map(|position| position.time_to_depth_ms.get(index))
+                    .sum()
+            })
+            .collect()
+    }
+
+    fn to_json(&self, depth: i32) -> String {
+        let positions: Vec<String> = self.positions.iter()
+            .zip(BENCH_FENS)
+            .map(|(position, fen)| format!(
+                "{{\"fen\": \"{}\", \"best_move\": \"{}\", \"nodes\": {}, \"time_ms\": {}}}",
+                fen, position.best_move, position.nodes, position.elapsed_ms
+            ))
+            .collect();
+
+        format!(
+            "{{\"threads\": {}, \"nodes\": {}, \"time_ms\": {}, \"nps\": {}, \"time_to_depth_ms\": {}, \"positions\": [{}]}}",
+            self.threads, self.nodes(), self.elapsed_ms(), self.nps(),
+            json_list(&self.time_to_depth_ms(depth)), positions.join(", ")
+        )
+    }
+}
+
+// Regression bench - The suite is searched to a fixed depth single threaded, then on
+// options.threads threads, always with a single PV. Every position starts from a cleared transposition table,
+// so the single threaded node count is deterministic and doubles as a signature of
+// the search: any change to pruning, ordering or evaluation changes it.
+pub fn run_bench(nnue_network: &'static NnueNetwork, options: &EngineOptions, depth: i32) -> String {
+    let depth = depth.clamp(1, MAX_DEPTH - 1);
+    let transposition_table = Arc::new(TranspositionTable::new(options.hash_mb));
+
+    let mut thread_counts = vec![1];
+    if options.threads > 1 {
+        thread_counts.push(options.threads);
+    }
+
+    let runs: Vec<BenchRun> = thread_counts.into_iter()
+        .map(|threads| {
+            // One line per position, and the single threaded run never defers moves
+            let run_options = EngineOptions {
+                threads,
+                multi_pv: 1,
+                abdada: options.abdada && threads > 1,
+                ..options.clone()
+            };
+            BenchRun {
+                threads,
+                positions: BENCH_FENS.iter()
+                    .map(|fen| bench_position(&transposition_table, nnue_network, &run_options, fen, depth))
+                    .collect(),
+            }
+        })
+        .collect();
+
+    let runs_json: Vec<String> = runs.iter().map(|run| run.to_json(depth)).collect();
+    format!(
+        "{{\"depth\": {}, \"positions\": {}, \"signature\": {}, \"runs\": [{}]}}",
+        depth, BENCH_FENS.len(), runs[0].nodes(), runs_json.join(", ")
+    )
+}
+
+fn bench_position(
+    transposition_table: &Arc<TranspositionTable>,
+    nnue_network: &'static NnueNetwork,
+    options: &EngineOptions,
+    fen: &str,
+    depth: i32,
+) -> BenchPosition {
+    transposition_table.clear();
+
+    let time_to_depth = Arc::new(Mutex::new(Vec::new()));
+    let callback_time_to_depth = Arc::clone(&time_to_depth);
+
+    let limits = SearchLimits { depth: Some(depth), ..SearchLimits::default() };
+    let control = SearchControl::new(limits, false).with_info_callback(move |info| {
+        callback_time_to_depth.lock().unwrap().push(info.elapsed.as_millis());
+    });
+
+    let mut root_worker = SearchWorker::from_fen(Arc::clone(transposition_table), nnue_network, fen)
+        .expect("bench FENs are valid");
+    let outcome = search_position(
+        transposition_table, &mut root_worker, &control, &AtomicUsize::new(0), options
+    );
+
+    let time_to_depth_ms = time_to_depth.lock().unwrap().clone();
+    BenchPosition {
+        best_move: outcome.best_move.map_or(String::new(), parse_uci),
+        nodes: outcome.nodes_processed,
+        elapsed_ms: outcome.elapsed_ms,
+        time_to_depth_ms,
+    }
+}
+
+fn json_list(values: &[u128]) -> String {
+    let values: Vec<String> = values.iter().map(|value| value.to_string()).collect();
+    format!("[{}]", values.join(", "))
+}
@@ -0,0 +1,16 @@
+use rust_compute::chess_game::init_attack_tables;
+use rust_compute::uci::UciEngine;
+
+fn main() {
+    init_attack_tables();
+    let mut engine = UciEngine::new();
+
+    // rust_compute_uci bench [depth] [threads] - Run a single command and exit (CI / regression checks)
+    let args: Vec<String> = std::env::args().skip(1).collect();
+    if !args.is_empty() {
+        engine.handle_command(&args.join(" "));
+        return;
+    }
+
+    engine.run();
+}
@@ -1,7 +1,7 @@
 use std::sync::LazyLock;
 use crate::move_command::*;
 use crate::chess_board::*;
-use arrayvec::ArrayVec;
+use crate::move_list::*;
 
 // Mask the Irrelevant Bits no in the Diagonal Path
 pub const BISHOP_MASKS: [u64; 64] = {
@@ -208,7 +208,7 @@ pub fn compute_bishop_magic(sq: usize) -> u64 {
 }
 
 pub fn bishop_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index: usize,
-    moves: &mut ArrayVec::<ForwardMove, 256>)  {
+    moves: &mut MoveList)  {
 
     let mut bishop_bitboard = chess_board.bishops[player_index];
 
@@ -221,9 +221,7 @@ pub fn bishop_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index
 
         while bishop_moves != 0 {
             let target = bishop_moves.trailing_zeros() as usize;
-            moves.push(ForwardMove { 
-                start_sq: bishop, end_sq: target, move_type: MoveFlag::MOVE, pv_score: 1000
-            });
+            moves.push(ForwardMove::new(bishop, target, MoveFlag::MOVE), 1000);
             bishop_moves &= bishop_moves - 1;
         }
 
@@ -233,9 +231,7 @@ pub fn bishop_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index
             let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
             let pv_score = 100 - (captured_piece_val * 10) + 2; 
 
-            moves.push(ForwardMove { 
-                start_sq: bishop, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score
-            });
+            moves.push(ForwardMove::new(bishop, target, MoveFlag::CAPTURE), pv_score);
             bishop_captures &= bishop_captures - 1;
         }
 
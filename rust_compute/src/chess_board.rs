@@ -1,15 +1,16 @@
 use crate::bishop_mask::*;
 use crate::king_mask::*;
+use crate::line_mask::*;
 use crate::knight_mask::*;
 use crate::pawn_mask::*;
 use crate::rook_mask::*;
 use crate::queen_mask::*;
 use crate::move_command::*;
+use crate::move_list::*;
 use crate::zobrist_hash::*;
 use crate::chess_game::*;
 use crate::board_accumlator::*;
 use crate::nnue_network::*;
-use arrayvec::ArrayVec;
 
 // 0 -> White / 1 -> Black
 #[derive(Debug, Clone)] 
@@ -29,14 +30,21 @@ pub struct ChessBoard {
     castling_rights: u8,
     en_passant: u64,
     active_player: Side,
+    // Plies since the last capture or pawn move - Fifty-move rule and repetition window
+    halfmove_clock: u32,
 
     // Zobrist Hash
     zobrist_hash: u64,
 
-    // --- INTEGRATED NNUE ACCUMULATOR BASE ---
-    accumulators: Box<[BoardAccumulators; 256]>, 
+    // --- INTEGRATED NNUE ACCUMULATOR STACK ---
+    // Slot 0 is the root position - Moves played before it are folded in by reroot_accumulators
+    accumulators: Box<[BoardAccumulators; MAX_PLY]>, 
     ply: usize,
 
+    // --- PER-PLY LEGALITY CACHE ---
+    ply_states: Box<[PlyState; PLY_STATE_SIZE]>,
+    state_ply: usize,
+
     nnue_network: &'static NnueNetwork,
 }
 
@@ -45,6 +53,41 @@ pub const WHITE_QUEENSIDE: u8 = 0b0010; // 2
 pub const BLACK_KINGSIDE: u8 = 0b0100; // 4
 pub const BLACK_QUEENSIDE: u8 = 0b1000; // 8
 
+// b1, d1, ..., a2, c2, ... - Bishops on these squares never attack the other colour
+const LIGHT_SQUARES: u64 = 0x55AA_55AA_55AA_55AA;
+
+// Legality of the side to move's moves - Computed once per node, so a
+// pseudo-legal move is checked with a few bitwise tests instead of make / unmake
+#[derive(Debug, Clone, Copy)]
+pub struct LegalMasks {
+    pub king_sq: usize,
+    // Opponent pieces giving check
+    pub checkers: u64,
+    // Own pieces pinned against the king
+    pub pinned: u64,
+    // Squares attacked by the opponent, sliders seeing through the king
+    pub king_danger: u64,
+    // Non-king moves must land here - The check ray when in check, nowhere in double check
+    pub evasion_mask: u64,
+}
+
+// Depth of the per-ply cache - Deeper plies wrap around, and the hash tag catches the reuse
+const PLY_STATE_SIZE: usize = 128;
+
+// Attack, check and pin information of one position, filled on first use.
+// execute_move opens a fresh slot and unexecute_move returns to the parent's,
+// whose masks are still valid - So they are computed at most once per node.
+#[derive(Debug, Clone, Copy, Default)]
+struct PlyState {
+    zobrist_hash: u64,
+    legal_masks: Option<LegalMasks>,
+}
+
+pub const START_FEN: &str = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1";
+
+// 75-move rule - A game ends before more reversible moves can be played
+const MAX_HALFMOVE_CLOCK: u32 = 150;
+
 impl ChessBoard {
     // A constructor-like associated function
     // [0] - White / [1] - Black
@@ -65,17 +108,59 @@ impl ChessBoard {
             castling_rights: 0b1111,
             en_passant: 0,
             active_player: Side::WHITE,
+            halfmove_clock: 0,
 
             mailbox: [BoardPiece::NONE; 64],
             zobrist_hash: 0,
 
-            accumulators: Box::new([BoardAccumulators::default(); 256]),
+            accumulators: Box::new([BoardAccumulators::default(); MAX_PLY]),
             ply: 0,
 
+            ply_states: Box::new([PlyState::default(); PLY_STATE_SIZE]),
+            state_ply: 0,
+
             nnue_network,
         }
     }
 
+    // Become a copy of other without reallocating - Only the current accumulator and
+    // legality cache slot are copied, the plies below the root are never read again
+    pub fn copy_position_from(&mut self, other: &ChessBoard) {
+        self.pawns = other.pawns;
+        self.knights = other.knights;
+        self.bishops = other.bishops;
+        self.rooks = other.rooks;
+        self.queens = other.queens;
+        self.kings = other.kings;
+
+        self.all_pieces = other.all_pieces;
+        self.occupied = other.occupied;
+        self.mailbox = other.mailbox;
+
+        self.castling_rights = other.castling_rights;
+        self.en_passant = other.en_passant;
+        self.active_player = other.active_player;
+        self.halfmove_clock = other.halfmove_clock;
+        self.zobrist_hash = other.zobrist_hash;
+
+        self.ply = other.ply;
+        self.accumulators[other.ply] = other.accumulators[other.ply];
+
+        self.state_ply = other.state_ply;
+        self.ply_states[other.state_ply % PLY_STATE_SIZE] = other.ply_states[other.state_ply % PLY_STATE_SIZE];
+
+        self.nnue_network = other.nnue_network;
+    }
+
+    pub fn nnue_network(&self) -> &'static NnueNetwork {
+        self.nnue_network
+    }
+
+    // Same weights at another address (a NUMA replica) - The accumulators stay valid
+    pub fn set_nnue_network(&mut self, nnue_network: &'static NnueNetwork) {
+        self.nnue_network = nnue_network;
+    }
+
     pub fn init_board(&mut self) {
         for color in 0..2 {
             // Ranks: White = 0 & 1, Black = 6 & 7
@@ -121,6 +206,127 @@ impl ChessBoard {
         self.create_accumlator_from_scratch();    
     }
 
+    // Load a position from Forsyth-Edwards Notation - The board is left untouched on error.
+    // The halfmove clock is optional and defaults to 0, the fullmove number is ignored.
+    pub fn load_fen(&mut self, fen: &str) -> Result<(), String> {
+        let fields: Vec<&str> = fen.split_whitespace().collect();
+        if !(4..=6).contains(&fields.len()) {
+            return Err(format!("Invalid FEN, expected 4 to 6 fields: {}", fen));
+        }
+
+        let mut board = ChessBoard::new(self.nnue_network);
+        board.castling_rights = 0;
+
+        // 1. Piece Placement - Rank 8 first, file a first
+        let ranks: Vec<&str> = fields[0].split('/').collect();
+        if ranks.len() != 8 {
+            return Err(format!("Invalid FEN, expected 8 ranks: {}", fen));
+        }
+
+        for (rank_offset, rank_str) in ranks.iter().enumerate() {
+            let rank = 7 - rank_offset;
+            let mut file = 0;
+
+            for piece_char in rank_str.chars() {
+                if let Some(empty_squares) = piece_char.to_digit(10) {
+                    file += empty_squares as usize;
+                    continue;
+                }
+
+                let piece = piece_from_fen(piece_char)
+                    .ok_or_else(|| format!("Invalid FEN piece '{}': {}", piece_char, fen))?;
+                if file >= 8 || (is_pawn(piece) && (rank == 0 || rank == 7)) {
+                    return Err(format!("Invalid FEN rank {}: {}", rank + 1, fen));
+                }
+
+                board._place_piece(rank * 8 + file, piece);
+                file += 1;
+            }
+
+            if file != 8 {
+                return Err(format!("Invalid FEN rank {}: {}", rank + 1, fen));
+            }
+        }
+
+        if board.kings[0].count_ones() != 1 || board.kings[1].count_ones() != 1 {
+            return Err(format!("Invalid FEN, each side needs exactly one king: {}", fen));
+        }
+
+        // 2. Side to Move
+        board.active_player = match fields[1] {
+            "w" => Side::WHITE,
+            "b" => Side::BLACK,
+            _ => return Err(format!("Invalid FEN side to move: {}", fen)),
+        };
+
+        // 3. Castling - Rights are dropped when the king or rook is not on its home square
+        if fields[2] != "-" {
+            for castle_char in fields[2].chars() {
+                let (castle_right, king_sq, rook_sq, king, rook) = match castle_char {
+                    'K' => (WHITE_KINGSIDE, 4, 7, BoardPiece::WKING, BoardPiece::WROOK),
+                    'Q' => (WHITE_QUEENSIDE, 4, 0, BoardPiece::WKING, BoardPiece::WROOK),
+                    'k' => (BLACK_KINGSIDE, 60, 63, BoardPiece::BKING, BoardPiece::BROOK),
+                    'q' => (BLACK_QUEENSIDE, 60, 56, BoardPiece::BKING, BoardPiece::BROOK),
+                    _ => return Err(format!("Invalid FEN castling rights: {}", fen)),
+                };
+
+                if board.mailbox[king_sq] == king && board.mailbox[rook_sq] == rook {
+                    board.castling_rights |= castle_right;
+                }
+            }
+        }
+
+        // 4. En Passant - Target square behind the pawn that just moved two squares
+        if fields[3] != "-" {
+            let target: Vec<char> = fields[3].chars().collect();
+            let expected_rank = match board.active_player {
+                Side::WHITE => '6',
+                Side::BLACK => '3',
+            };
+
+            if target.len() != 2 || !('a'..='h').contains(&target[0]) || target[1] != expected_rank {
+                return Err(format!("Invalid FEN en passant square: {}", fen));
+            }
+
+            let ep_sq = (target[1] as u8 - b'1') as usize * 8 + (target[0] as u8 - b'a') as usize;
+            board.en_passant = 1u64 << ep_sq;
+        }
+
+        // 5. Halfmove Clock / Fullmove Number
+        if fields[4..].iter().any(|counter| counter.parse::<u32>().is_err()) {
+            return Err(format!("Invalid FEN move counters: {}", fen));
+        }
+        board.halfmove_clock = fields.get(4).map_or(0, |counter| counter.parse().unwrap_or(0));
+        if board.halfmove_clock > MAX_HALFMOVE_CLOCK {
+            return Err(format!("Invalid FEN, halfmove clock above {}: {}", MAX_HALFMOVE_CLOCK, fen));
+        }
+
+        // The side that just moved cannot have left its king in check
+        if board.is_previous_player_king_in_check() {
+            return Err(format!("Invalid FEN, side to move can capture the king: {}", fen));
+        }
+
+        board.zobrist_hash = board.compute_init_zobrist();
+        board.create_accumlator_from_scratch();
+
+        *self = board;
+        Ok(())
+    }
+
+    // Dead position - Bare kings, a single minor piece, or only bishops all on one square colour
+    pub fn is_insufficient_material(&self) -> bool {
+        let pawns_and_majors = self.pawns[0] | self.pawns[1] | self.rooks[0] | self.rooks[1]
+            | self.queens[0] | self.queens[1];
+        if pawns_and_majors != 0 {
+            return false;
+        }
+
+        let knights = self.knights[0] | self.knights[1];
+        let bishops = self.bishops[0] | self.bishops[1];
+        (knights | bishops).count_ones() <= 1
+            || (knights == 0 && (bishops & LIGHT_SQUARES == 0 || bishops & !LIGHT_SQUARES == 0))
+    }
+
     // Null Move Pruning Zugzwang
     pub fn has_major_pieces(&self) -> bool {
         let side_idx = self.active_player as usize;
@@ -188,6 +394,10 @@ impl ChessBoard {
         self.en_passant
     }
 
+    pub fn halfmove_clock(&self) -> u32 {
+        self.halfmove_clock
+    }
+
     // Return Zobrist Hash
     pub fn zobrist_hash(&self) -> u64 {   
         self.zobrist_hash
@@ -205,10 +415,13 @@ impl ChessBoard {
 
     // Used to Calculate Castling / King Safety
     pub fn compute_attack_targets(&self, attacking_side: Side) -> u64 {
+        self.attack_targets_with(attacking_side, self.occupied)
+    }
+
+    // Attack map for a given occupancy - Sliders stop at the first occupied square
+    fn attack_targets_with(&self, attacking_side: Side, occ: u64) -> u64 {
         let mut attacks = 0u64;
         let index = self.player_index(attacking_side);
-        
-        let occ = self.occupied;
 
         // 1. Pawns
         let pawns = self.pawns[index];
@@ -258,25 +471,182 @@ impl ChessBoard {
 
     // Check if current board is in check
     pub fn is_in_check(&mut self) -> bool {
-        let _curr_opp_attack_targets = self.compute_attack_targets(self.opponent_player());
+        self.legal_masks().checkers != 0
+    }
 
-        let current_player_index = self.player_index(self.active_player);
-        (self.kings[current_player_index] & _curr_opp_attack_targets) != 0
+    // Unordered pseudo-legal moves - The generators' scores are the default ordering
+    pub fn generate_pseudo_moves(&mut self, gen_moves: &mut MoveList) {
+        // King danger squares only drop king moves that are illegal anyway
+        let king_danger = self.legal_masks().king_danger;
+        self.generate_piece_moves(gen_moves, king_danger, true);
     }
 
-    // Generate Pseudo-Moves - Only Validate King Safety for Castle / King Movement
-    pub fn generate_moves(&mut self, 
-        gen_moves: &mut ArrayVec::<ForwardMove, 256>, 
-        pv_move_hint: Option<ForwardMove>,
-        depth: i32,
-        killer_move_table: &[[Option<ForwardMove>; MAX_DEPTH as usize]; 2]
-    ) {        
+    // Unordered legal moves - Nothing has to be made to be validated
+    pub fn generate_legal_moves(&mut self,
+        gen_moves: &mut MoveList,
+        legal_masks: &LegalMasks
+    ) {
+        // Double check - Only the king can move
+        let double_check = legal_masks.checkers.count_ones() > 1;
+        self.generate_piece_moves(gen_moves, legal_masks.king_danger, !double_check);
+
+        // King moves are already safe - Pins, checks and en passant remain
+        if legal_masks.pinned != 0 || legal_masks.checkers != 0 || self.en_passant != 0 {
+            gen_moves.retain(|mv| self.is_legal(mv, legal_masks));
+        }
+    }
+
+    // Checkers, pins and king danger squares of the side to move - Cached per ply
+    pub fn legal_masks(&mut self) -> LegalMasks {
+        let ply_state = &self.ply_states[self.state_ply % PLY_STATE_SIZE];
+        if let Some(legal_masks) = ply_state.legal_masks.filter(|_| ply_state.zobrist_hash == self.zobrist_hash) {
+            return legal_masks;
+        }
+
+        let legal_masks = self.compute_legal_masks();
+        self.ply_states[self.state_ply % PLY_STATE_SIZE] = PlyState {
+            zobrist_hash: self.zobrist_hash,
+            legal_masks: Some(legal_masks),
+        };
+        legal_masks
+    }
+
+    fn compute_legal_masks(&self) -> LegalMasks {
+        let player_index = self.player_index(self.active_player);
+        let opp_index = self.player_index(self.opponent_player());
+        let king_sq = self.kings[player_index].trailing_zeros() as usize & 63;
+
+        let opp_diagonal = self.bishops[opp_index] | self.queens[opp_index];
+        let opp_orthogonal = self.rooks[opp_index] | self.queens[opp_index];
+
+        let king_pawn_attacks = match self.active_player {
+            Side::WHITE => white_pawn_attacks(1u64 << king_sq),
+            Side::BLACK => black_pawn_attacks(1u64 << king_sq),
+        };
+        let mut checkers = (king_pawn_attacks & self.pawns[opp_index])
+            | (KNIGHT_ATTACKS[king_sq] & self.knights[opp_index]);
+
+        // Sliders seen through our own pieces - One own piece in between is pinned
+        let mut pinned = 0u64;
+        let mut snipers = (bishop_attack_paths(king_sq, self.all_pieces[opp_index]) & opp_diagonal)
+            | (rook_attack_paths(king_sq, self.all_pieces[opp_index]) & opp_orthogonal);
+        while snipers != 0 {
+            let sniper = snipers.trailing_zeros() as usize;
+            let blockers = BETWEEN_SQUARES[king_sq][sniper] & self.occupied;
+
+            if blockers == 0 {
+                checkers |= 1u64 << sniper;
+            } else if blockers & (blockers - 1) == 0 {
+                pinned |= blockers & self.all_pieces[player_index];
+            }
+            snipers &= snipers - 1;
+        }
+
+        let evasion_mask = match checkers.count_ones() {
+            0 => u64::MAX,
+            1 => checkers | BETWEEN_SQUARES[king_sq][checkers.trailing_zeros() as usize],
+            _ => 0,
+        };
+
+        LegalMasks {
+            king_sq,
+            checkers,
+            pinned,
+            king_danger: self.attack_targets_with(
+                self.opponent_player(), self.occupied & !self.kings[player_index]
+            ),
+            evasion_mask,
+        }
+    }
+
+    // Is a pseudo-legal move legal? The masks must belong to the current position
+    pub fn is_legal(&self, forward_move: ForwardMove, legal_masks: &LegalMasks) -> bool {
+        let (start_sq, end_sq) = (forward_move.start_sq(), forward_move.end_sq());
+
+        if start_sq == legal_masks.king_sq {
+            // Castling through or out of check is already excluded by the generator
+            return match forward_move.move_type() {
+                MoveFlag::KINGSIDECASTLE | MoveFlag::QUEENSIDECASTLE => legal_masks.checkers == 0,
+                _ => legal_masks.king_danger & (1u64 << end_sq) == 0,
+            };
+        }
+
+        if forward_move.move_type() == MoveFlag::ENPASSANT {
+            return self.is_legal_en_passant(forward_move, legal_masks);
+        }
+
+        legal_masks.evasion_mask & (1u64 << end_sq) != 0
+            && (legal_masks.pinned & (1u64 << start_sq) == 0
+                || LINE_THROUGH[legal_masks.king_sq][start_sq] & (1u64 << end_sq) != 0)
+    }
+
+    // Two pawns leave the board at once - Replay the slider attacks on the king
+    fn is_legal_en_passant(&self, forward_move: ForwardMove, legal_masks: &LegalMasks) -> bool {
+        let opp_index = self.player_index(self.opponent_player());
+        let captured_sq = match self.active_player {
+            Side::WHITE => forward_move.end_sq() - 8,
+            Side::BLACK => forward_move.end_sq() + 8,
+        };
+        let captured_bb = 1u64 << captured_sq;
+
+        // A knight or another pawn still gives check
+        if legal_masks.checkers & !captured_bb & (self.knights[opp_index] | self.pawns[opp_index]) != 0 {
+            return false;
+        }
+
+        let occupied = (self.occupied & !captured_bb & !(1u64 << forward_move.start_sq()))
+            | (1u64 << forward_move.end_sq());
+        let king_sq = legal_masks.king_sq;
+
+        bishop_attack_paths(king_sq, occupied) & (self.bishops[opp_index] | self.queens[opp_index]) == 0
+            && rook_attack_paths(king_sq, occupied) & (self.rooks[opp_index] | self.queens[opp_index]) == 0
+    }
+
+    // Does a legal move check the opponent king? Direct and discovered checks - Castling,
+    // en passant and promotions are assumed to check, so callers never prune them by mistake
+    pub fn gives_check(&self, forward_move: ForwardMove) -> bool {
+        if !matches!(forward_move.move_type(), MoveFlag::MOVE | MoveFlag::PAWNOPENMOVE | MoveFlag::CAPTURE) {
+            return true;
+        }
+
+        let player_index = self.player_index(self.active_player);
+        let king_sq = self.kings[self.player_index(self.opponent_player())].trailing_zeros() as usize;
+        let (start_bb, end_bb) = (1u64 << forward_move.start_sq(), 1u64 << forward_move.end_sq());
+        let occupied = (self.occupied & !start_bb) | end_bb;
+
+        // Sliders after the move - Covers the moved slider and any piece it uncovered
+        let relocate = |pieces: u64| if pieces & start_bb != 0 { (pieces & !start_bb) | end_bb } else { pieces };
+        let diagonal_sliders = relocate(self.bishops[player_index] | self.queens[player_index]);
+        let orthogonal_sliders = relocate(self.rooks[player_index] | self.queens[player_index]);
+
+        if bishop_attack_paths(king_sq, occupied) & diagonal_sliders != 0
+            || rook_attack_paths(king_sq, occupied) & orthogonal_sliders != 0 {
+            return true;
+        }
+
+        match self.mailbox[forward_move.start_sq()] {
+            BoardPiece::WKNIGHT | BoardPiece::BKNIGHT => KNIGHT_ATTACKS[king_sq] & end_bb != 0,
+            BoardPiece::WPAWN => white_pawn_attacks(end_bb) & (1u64 << king_sq) != 0,
+            BoardPiece::BPAWN => black_pawn_attacks(end_bb) & (1u64 << king_sq) != 0,
+            _ => false,
+        }
+    }
+
+    // Run the piece generators - Everything but the king is skipped in double check
+    fn generate_piece_moves(&mut self,
+        gen_moves: &mut MoveList,
+        king_danger: u64,
+        non_king_moves: bool
+    ) {
         let player_index = self.player_index(self.active_player);
         let opp_index = self.player_index(self.opponent_player());
-        let _opponent_attack_targets = self.compute_attack_targets(self.opponent_player());
 
         // Generate Moves
-        king_moves(self, player_index, opp_index, _opponent_attack_targets, gen_moves);
+        king_moves(self, player_index, opp_index, king_danger, gen_moves);
+
+        if !non_king_moves {
+            return;
+        }
 
         knight_moves(self, player_index, opp_index, gen_moves);
 
@@ -294,90 +664,143 @@ impl ChessBoard {
                 black_pawn_moves(self, player_index, opp_index, gen_moves);
             }
         }
-        
-        if depth >= 0 {
-            // 1. Allocate PV Move in Front (Highest Priority)
-            if let Some(hint) = pv_move_hint {
-                // Rust automatically uses your custom PartialEq logic via ==
-                if let Some(cmd) = gen_moves.iter_mut().find(|m| **m == hint) {
-                    cmd.pv_score = -2_000_000; 
-                }
-            }
-            // 2. Allocate Killer Moves (High Priority, but below PV move)
+    }
 
-            // Primary Killer
-            let killer_0 = killer_move_table[0][depth as usize];
-            if killer_0 != pv_move_hint {
-                if let Some(cmd) = gen_moves.iter_mut().find(|m| Some(**m) == killer_0) {
-                    cmd.pv_score = 200;
-                }
-            }
+    // Would generate_pseudo_moves produce this move? Validates Transposition Table and
+    // killer moves without generating - Hash collisions can hand us any packed move.
+    pub fn is_pseudo_legal(&mut self, forward_move: ForwardMove) -> bool {
+        let (start_sq, end_sq) = (forward_move.start_sq(), forward_move.end_sq());
+        if start_sq >= 64 || end_sq >= 64 || start_sq == end_sq {
+            return false;
+        }
 
-            // Secondary Killer
-            let killer_1 = killer_move_table[1][depth as usize];
-            if killer_1 != pv_move_hint {
-                if let Some(cmd) = gen_moves.iter_mut().find(|m| Some(**m) == killer_1) {
-                    cmd.pv_score = 210;
-                }
-            }
+        let piece = self.mailbox[start_sq];
+        if is_none(piece) || piece_player(piece) != self.active_player {
+            return false;
+        }
+
+        let player_index = self.player_index(self.active_player);
+        let opp_index = self.player_index(self.opponent_player());
+        let end_bb = 1u64 << end_sq;
+        if self.all_pieces[player_index] & end_bb != 0 {
+            return false;
         }
+        let is_capture = self.all_pieces[opp_index] & end_bb != 0;
 
-        gen_moves.sort_unstable_by_key(|cmd| cmd.pv_score);
+        if matches!(piece, BoardPiece::WPAWN | BoardPiece::BPAWN) {
+            let (push_sq, start_rank, promotion_rank, attacks) = match self.active_player {
+                Side::WHITE => (start_sq + 8, 1, 7, white_pawn_attacks(1u64 << start_sq)),
+                Side::BLACK => (start_sq.wrapping_sub(8), 6, 0, black_pawn_attacks(1u64 << start_sq)),
+            };
+            let is_push = end_sq == push_sq && !is_capture;
+            let is_attack = attacks & end_bb != 0 && is_capture;
+            let is_promotion = end_sq / 8 == promotion_rank;
+
+            return match forward_move.move_type() {
+                MoveFlag::MOVE => is_push && !is_promotion,
+                MoveFlag::CAPTURE => is_attack && !is_promotion,
+                MoveFlag::PAWNOPENMOVE => {
+                    let double_sq = match self.active_player {
+                        Side::WHITE => start_sq + 16,
+                        Side::BLACK => start_sq.wrapping_sub(16),
+                    };
+                    start_sq / 8 == start_rank && end_sq == double_sq
+                        && (self.occupied & ((1u64 << push_sq) | end_bb)) == 0
+                },
+                MoveFlag::ENPASSANT => attacks & end_bb & self.en_passant != 0,
+                MoveFlag::PROMOTIONQUEEN | MoveFlag::PROMOTIONROOK |
+                MoveFlag::PROMOTIONBISHOP | MoveFlag::PROMOTIONKNIGHT => is_promotion && (is_push || is_attack),
+                _ => false,
+            };
+        }
+
+        if matches!(piece, BoardPiece::WKING | BoardPiece::BKING)
+            && matches!(forward_move.move_type(), MoveFlag::KINGSIDECASTLE | MoveFlag::QUEENSIDECASTLE) {
+            // Same conditions as king_moves
+            let (home_sq, right, path, move_path) = match (self.active_player, forward_move.move_type()) {
+                (Side::WHITE, MoveFlag::KINGSIDECASTLE) => (4, WHITE_KINGSIDE, WHITE_KINGSIDE_PATH, WHITE_KINGSIDE_MOVE_PATH),
+                (Side::WHITE, _) => (4, WHITE_QUEENSIDE, WHITE_QUEENSIDE_PATH, WHITE_QUEENSIDE_MOVE_PATH),
+                (Side::BLACK, MoveFlag::KINGSIDECASTLE) => (60, BLACK_KINGSIDE, BLACK_KINGSIDE_PATH, BLACK_KINGSIDE_MOVE_PATH),
+                (Side::BLACK, _) => (60, BLACK_QUEENSIDE, BLACK_QUEENSIDE_PATH, BLACK_QUEENSIDE_MOVE_PATH),
+            };
+            let castle_sq = if forward_move.move_type() == MoveFlag::KINGSIDECASTLE { home_sq + 2 } else { home_sq - 2 };
+
+            return start_sq == home_sq && end_sq == castle_sq
+                && self.castling_rights & right != 0
+                && self.occupied & move_path == 0
+                && self.legal_masks().king_danger & path == 0;
+        }
+
+        let reachable = match piece {
+            BoardPiece::WKNIGHT | BoardPiece::BKNIGHT => KNIGHT_ATTACKS[start_sq],
+            BoardPiece::WBISHOP | BoardPiece::BBISHOP => bishop_attack_paths(start_sq, self.occupied),
+            BoardPiece::WROOK | BoardPiece::BROOK => rook_attack_paths(start_sq, self.occupied),
+            BoardPiece::WQUEEN | BoardPiece::BQUEEN => {
+                bishop_attack_paths(start_sq, self.occupied) | rook_attack_paths(start_sq, self.occupied)
+            },
+            _ => KING_ATTACKS[start_sq],
+        };
+
+        reachable & end_bb != 0 && match forward_move.move_type() {
+            MoveFlag::MOVE => !is_capture,
+            MoveFlag::CAPTURE => is_capture,
+            _ => false,
+        }
     }
 
     // helper method for move piece
     fn _move_piece(&mut self, move_command: ForwardMove) {
         // Remove Start Piece / Add End Piece
-        let piece_type = piece_type_zobrist(self.mailbox[move_command.start_sq]);
+        let piece_type = piece_type_zobrist(self.mailbox[move_command.start_sq()]);
 
-        self.zobrist_hash ^= ZOBRIST_TABLE_MAP[piece_type][move_command.start_sq];
-        self.zobrist_hash ^= ZOBRIST_TABLE_MAP[piece_type][move_command.end_sq];
+        self.zobrist_hash ^= ZOBRIST_TABLE_MAP[piece_type][move_command.start_sq()];
+        self.zobrist_hash ^= ZOBRIST_TABLE_MAP[piece_type][move_command.end_sq()];
 
-        let move_piece = self.mailbox[move_command.start_sq];
+        let move_piece = self.mailbox[move_command.start_sq()];
         let player_index = self.player_index(piece_player(move_piece));
 
         match move_piece {
             BoardPiece::WPAWN => {
-                self.pawns[player_index] ^= 1u64 << move_command.start_sq;
-                self.pawns[player_index] ^= 1u64 << move_command.end_sq;
+                self.pawns[player_index] ^= 1u64 << move_command.start_sq();
+                self.pawns[player_index] ^= 1u64 << move_command.end_sq();
             },
             BoardPiece::BPAWN => {
-                self.pawns[player_index] ^= 1u64 << move_command.start_sq;
-                self.pawns[player_index] ^= 1u64 << move_command.end_sq;
+                self.pawns[player_index] ^= 1u64 << move_command.start_sq();
+                self.pawns[player_index] ^= 1u64 << move_command.end_sq();
             },
             BoardPiece::WBISHOP | BoardPiece::BBISHOP => {
-                self.bishops[player_index] ^= 1u64 << move_command.start_sq;
-                self.bishops[player_index] ^= 1u64 << move_command.end_sq;
+                self.bishops[player_index] ^= 1u64 << move_command.start_sq();
+                self.bishops[player_index] ^= 1u64 << move_command.end_sq();
             },
             BoardPiece::WKNIGHT | BoardPiece::BKNIGHT => {
-                self.knights[player_index] ^= 1u64 << move_command.start_sq;
-                self.knights[player_index] ^= 1u64 << move_command.end_sq;
+                self.knights[player_index] ^= 1u64 << move_command.start_sq();
+                self.knights[player_index] ^= 1u64 << move_command.end_sq();
             },
             BoardPiece::WROOK | BoardPiece::BROOK => {
-                self.rooks[player_index] ^= 1u64 << move_command.start_sq;
-                self.rooks[player_index] ^= 1u64 << move_command.end_sq;
+                self.rooks[player_index] ^= 1u64 << move_command.start_sq();
+                self.rooks[player_index] ^= 1u64 << move_command.end_sq();
             },
             BoardPiece::WQUEEN | BoardPiece::BQUEEN => {
-                self.queens[player_index] ^= 1u64 << move_command.start_sq;
-                self.queens[player_index] ^= 1u64 << move_command.end_sq;
+                self.queens[player_index] ^= 1u64 << move_command.start_sq();
+                self.queens[player_index] ^= 1u64 << move_command.end_sq();
             },
             BoardPiece::WKING | BoardPiece::BKING=> {
-                self.kings[player_index] ^= 1u64 << move_command.start_sq;
-                self.kings[player_index] ^= 1u64 << move_command.end_sq;
+                self.kings[player_index] ^= 1u64 << move_command.start_sq();
+                self.kings[player_index] ^= 1u64 << move_command.end_sq();
             },
             BoardPiece::NONE => {
-                println!("Tried to move empty");
+                eprintln!("Tried to move empty");
             },
         }
 
-        self.mailbox[move_command.start_sq] = BoardPiece::NONE;
-        self.mailbox[move_command.end_sq] = move_piece;
+        self.mailbox[move_command.start_sq()] = BoardPiece::NONE;
+        self.mailbox[move_command.end_sq()] = move_piece;
 
-        self.all_pieces[player_index] &= !(1u64 << move_command.start_sq);
-        self.all_pieces[player_index] |= 1u64 << move_command.end_sq;
+        self.all_pieces[player_index] &= !(1u64 << move_command.start_sq());
+        self.all_pieces[player_index] |= 1u64 << move_command.end_sq();
 
-        self.occupied &= !(1u64 << move_command.start_sq);
-        self.occupied |= 1u64 << move_command.end_sq;
+        self.occupied &= !(1u64 << move_command.start_sq());
+        self.occupied |= 1u64 << move_command.end_sq();
     }
 
     // helper method for remove piece
@@ -409,7 +832,7 @@ impl ChessBoard {
                 self.kings[player_index] ^= 1u64 << remove_sq;
             },
             BoardPiece::NONE => {
-                println!("Tried to remove empty");
+                eprintln!("Tried to remove empty");
             },
         }
 
@@ -463,26 +886,33 @@ impl ChessBoard {
     }
 
     pub fn execute_move(&mut self, move_command: ForwardMove) -> Option<BoardPiece> {
+        // The child position starts without cached masks
+        self.state_ply += 1;
+        self.ply_states[self.state_ply % PLY_STATE_SIZE].legal_masks = None;
+
         // XOR the current State for Castle, En Passant and Side to Move
         self.zobrist_xor();
 
+        let is_pawn_move = move_command.move_type() != MoveFlag::NULL
+            && is_pawn(self.mailbox[move_command.start_sq()]);
+
         let mut remove_piece = None;
         // Store Removed Piece / No bitboard Operations
-        match move_command.move_type { 
+        match move_command.move_type() { 
             MoveFlag::CAPTURE | MoveFlag::PROMOTIONQUEEN |
             MoveFlag::PROMOTIONROOK | MoveFlag::PROMOTIONBISHOP | 
             MoveFlag::PROMOTIONKNIGHT => {
-                if self.mailbox[move_command.end_sq] != BoardPiece::NONE {
-                    remove_piece = Some(self.mailbox[move_command.end_sq]);
+                if self.mailbox[move_command.end_sq()] != BoardPiece::NONE {
+                    remove_piece = Some(self.mailbox[move_command.end_sq()]);
                 }
             },
             MoveFlag::ENPASSANT => {
                 match self.active_player {
                     Side::WHITE => {
-                        remove_piece = Some(self.mailbox[move_command.end_sq - 8]);
+                        remove_piece = Some(self.mailbox[move_command.end_sq() - 8]);
                     },
                     Side::BLACK => {
-                        remove_piece = Some(self.mailbox[move_command.end_sq + 8]);
+                        remove_piece = Some(self.mailbox[move_command.end_sq() + 8]);
                     },
                 }
             },
@@ -493,7 +923,7 @@ impl ChessBoard {
         self.en_passant = 0;
 
         // Update Castling
-        match move_command.start_sq {
+        match move_command.start_sq() {
             4  => self.castling_rights &= !(WHITE_KINGSIDE | WHITE_QUEENSIDE),
             60 => self.castling_rights &= !(BLACK_KINGSIDE | BLACK_QUEENSIDE),
             7  => self.castling_rights &= !WHITE_KINGSIDE,
@@ -502,7 +932,7 @@ impl ChessBoard {
             56 => self.castling_rights &= !BLACK_QUEENSIDE,
             _ => {}
         }
-        match move_command.end_sq {
+        match move_command.end_sq() {
             7  => self.castling_rights &= !WHITE_KINGSIDE,
             0  => self.castling_rights &= !WHITE_QUEENSIDE,
             63 => self.castling_rights &= !BLACK_KINGSIDE,
@@ -510,21 +940,21 @@ impl ChessBoard {
             _ => {}
         }
 
-        match move_command.move_type {
+        match move_command.move_type() {
             MoveFlag::MOVE => {
                 self._move_piece(move_command);
             },
             MoveFlag::PAWNOPENMOVE => {
                 // Update En Passant
-                let piece = self.mailbox[move_command.start_sq];
+                let piece = self.mailbox[move_command.start_sq()];
                 if (piece == BoardPiece::WPAWN || piece == BoardPiece::BPAWN) && 
-                (move_command.start_sq as i8 - move_command.end_sq as i8).abs() == 16 {
+                (move_command.start_sq() as i8 - move_command.end_sq() as i8).abs() == 16 {
                     match self.active_player {
                         Side::WHITE => {
-                            self.en_passant = 1u64 << (move_command.start_sq + 8);
+                            self.en_passant = 1u64 << (move_command.start_sq() + 8);
                         },
                         Side::BLACK => {
-                            self.en_passant = 1u64 << (move_command.start_sq - 8);
+                            self.en_passant = 1u64 << (move_command.start_sq() - 8);
                         },
                     }
                 }
@@ -534,25 +964,17 @@ impl ChessBoard {
             MoveFlag::KINGSIDECASTLE => {
                 match self.active_player {
                     Side::WHITE => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 4, end_sq: 6, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let king_move_cmd = ForwardMove::new(4, 6, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 7, end_sq: 5, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let rook_move_cmd = ForwardMove::new(7, 5, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                     Side::BLACK => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 60, end_sq: 62, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let king_move_cmd = ForwardMove::new(60, 62, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 63, end_sq: 61, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let rook_move_cmd = ForwardMove::new(63, 61, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                 }
@@ -560,46 +982,38 @@ impl ChessBoard {
             MoveFlag::QUEENSIDECASTLE => {
                 match self.active_player {
                     Side::WHITE => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 4, end_sq: 2, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let king_move_cmd = ForwardMove::new(4, 2, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 0, end_sq: 3, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let rook_move_cmd = ForwardMove::new(0, 3, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                     Side::BLACK => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 60, end_sq: 58, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let king_move_cmd = ForwardMove::new(60, 58, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 56, end_sq: 59, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let rook_move_cmd = ForwardMove::new(56, 59, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                 }
             },
             MoveFlag::PROMOTIONQUEEN | MoveFlag::PROMOTIONROOK |
             MoveFlag::PROMOTIONBISHOP | MoveFlag::PROMOTIONKNIGHT => {
-                self._remove_piece(move_command.start_sq);
+                self._remove_piece(move_command.start_sq());
 
                 if remove_piece.is_some() {
-                    self._remove_piece(move_command.end_sq);
+                    self._remove_piece(move_command.end_sq());
                 }
 
                 match self.active_player {
                     Side::WHITE => {
-                        self._place_piece(move_command.end_sq, 
-                            white_promotion_piece(move_command.move_type)
+                        self._place_piece(move_command.end_sq(), 
+                            white_promotion_piece(move_command.move_type())
                         );
                     },
                     Side::BLACK => {
-                        self._place_piece(move_command.end_sq, 
-                            black_promotion_piece(move_command.move_type)
+                        self._place_piece(move_command.end_sq(), 
+                            black_promotion_piece(move_command.move_type())
                         );
                     },
                 }
@@ -608,20 +1022,21 @@ impl ChessBoard {
                 self._move_piece(move_command);
                 match self.active_player {
                     Side::WHITE => {
-                        self._remove_piece(move_command.end_sq - 8);
+                        self._remove_piece(move_command.end_sq() - 8);
                     },
                     Side::BLACK => {
-                        self._remove_piece(move_command.end_sq + 8);
+                        self._remove_piece(move_command.end_sq() + 8);
                     },
                 }
             },
             MoveFlag::CAPTURE => {
-                self._remove_piece(move_command.end_sq);
+                self._remove_piece(move_command.end_sq());
                 self._move_piece(move_command);
             },
             MoveFlag::NULL => {},
         }
 
+        self.halfmove_clock = if is_pawn_move || remove_piece.is_some() { 0 } else { self.halfmove_clock.saturating_add(1) };
         self.active_player = self.opponent_player();
 
         // XOR in current state for Castle, En Passant and Side to Move
@@ -632,6 +1047,10 @@ impl ChessBoard {
 
     // Undo Move
     pub fn unexecute_move(&mut self, undo_move_cmd: UndoMove) {
+        // Back to the parent's slot - Its masks describe the restored position
+        self.ply_states[self.state_ply % PLY_STATE_SIZE].legal_masks = None;
+        self.state_ply = self.state_ply.wrapping_sub(1);
+
         // XOR the current State for Castle, En Passant and Side to Move
         self.zobrist_xor();
 
@@ -641,37 +1060,24 @@ impl ChessBoard {
         // Undo Move
         match undo_move_cmd.move_type {
             MoveFlag::MOVE | MoveFlag::CAPTURE | MoveFlag::PAWNOPENMOVE | MoveFlag::ENPASSANT=> {
-                let undo_command = ForwardMove { 
-                    start_sq: undo_move_cmd.end_sq, 
-                    end_sq: undo_move_cmd.start_sq, 
-                    move_type: MoveFlag::MOVE, 
-                    pv_score: 0,
-                };
+                let undo_command = ForwardMove::new(undo_move_cmd.end_sq, undo_move_cmd.start_sq, MoveFlag::MOVE);
                 self._move_piece(undo_command);
           
             },
             MoveFlag::KINGSIDECASTLE => {
                 match self.active_player {
                     Side::WHITE => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 6, end_sq: 4, move_type: MoveFlag::MOVE, pv_score: 0 
-                        };
+                        let king_move_cmd = ForwardMove::new(6, 4, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 5, end_sq: 7, move_type: MoveFlag::MOVE, pv_score: 0 
-                        };
+                        let rook_move_cmd = ForwardMove::new(5, 7, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                     Side::BLACK => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 62, end_sq: 60, move_type: MoveFlag::MOVE, pv_score: 0  
-                        };
+                        let king_move_cmd = ForwardMove::new(62, 60, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 61, end_sq: 63, move_type: MoveFlag::MOVE, pv_score: 0 
-                        };
+                        let rook_move_cmd = ForwardMove::new(61, 63, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                 }
@@ -679,25 +1085,17 @@ impl ChessBoard {
             MoveFlag::QUEENSIDECASTLE => {
                 match self.active_player {
                     Side::WHITE => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 2, end_sq: 4, move_type: MoveFlag::MOVE, pv_score: 0 
-                        };
+                        let king_move_cmd = ForwardMove::new(2, 4, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 3, end_sq: 0, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let rook_move_cmd = ForwardMove::new(3, 0, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                     Side::BLACK => {
-                        let king_move_cmd = ForwardMove { 
-                            start_sq: 58, end_sq: 60, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let king_move_cmd = ForwardMove::new(58, 60, MoveFlag::MOVE);
                         self._move_piece(king_move_cmd);
 
-                        let rook_move_cmd = ForwardMove { 
-                            start_sq: 59, end_sq: 56, move_type: MoveFlag::MOVE, pv_score: 0
-                        };
+                        let rook_move_cmd = ForwardMove::new(59, 56, MoveFlag::MOVE);
                         self._move_piece(rook_move_cmd);
                     },
                 }
@@ -738,6 +1136,7 @@ impl ChessBoard {
         // Restore En Passant
         self.en_passant = undo_move_cmd.prev_en_passant;
         self.castling_rights = undo_move_cmd.prev_castle_rights;
+        self.halfmove_clock = undo_move_cmd.prev_halfmove_clock;
 
         // XOR in current state for Castle, En Passant and Side to Move
         self.zobrist_xor();
@@ -883,11 +1282,11 @@ impl ChessBoard {
         let w_king_sq = self.kings[Side::WHITE as usize].trailing_zeros() as usize;
         let b_king_sq = self.kings[Side::BLACK as usize].trailing_zeros() as usize;
 
-        let move_piece: BoardPiece = self.mailbox[mv.start_sq];
+        let move_piece: BoardPiece = self.mailbox[mv.start_sq()];
 
         // --- 1. Identify Target Added Piece (Handles Promotions) ---
         let mut added_piece = move_piece;
-        match mv.move_type {
+        match mv.move_type() {
             MoveFlag::PROMOTIONQUEEN => {
                 added_piece = if move_piece == BoardPiece::WPAWN { BoardPiece::WQUEEN } else { BoardPiece::BQUEEN };
             }
@@ -904,23 +1303,23 @@ impl ChessBoard {
         }
 
         // --- 2. Identify Captured Piece & Coordinate (Handles En Passant) ---
-        let (captured_sq, captured_piece) = if mv.move_type == MoveFlag::ENPASSANT {
+        let (captured_sq, captured_piece) = if mv.move_type() == MoveFlag::ENPASSANT {
             let sq = if move_piece == BoardPiece::WPAWN {
-                mv.end_sq - 8 
+                mv.end_sq() - 8 
             } else {
-                mv.end_sq + 8 
+                mv.end_sq() + 8 
             };
             (sq, self.mailbox[sq])
         } else {
-            (mv.end_sq, self.mailbox[mv.end_sq])
+            (mv.end_sq(), self.mailbox[mv.end_sq()])
         };
 
         // --- 3. Compute Sparse Feature Indices ---
-        let w_remove = get_feature_index(w_king_sq, move_piece, mv.start_sq, false);
-        let b_remove = get_feature_index(b_king_sq, move_piece, mv.start_sq, true);
+        let w_remove = get_feature_index(w_king_sq, move_piece, mv.start_sq(), false);
+        let b_remove = get_feature_index(b_king_sq, move_piece, mv.start_sq(), true);
 
-        let w_add = get_feature_index(w_king_sq, added_piece, mv.end_sq, false);
-        let b_add = get_feature_index(b_king_sq, added_piece, mv.end_sq, true);
+        let w_add = get_feature_index(w_king_sq, added_piece, mv.end_sq(), false);
+        let b_add = get_feature_index(b_king_sq, added_piece, mv.end_sq(), true);
 
         // Get basic rows
         let w_rem_row = &self.nnue_network.l1_weights[w_remove][..256];
@@ -981,16 +1380,118 @@ impl ChessBoard {
         }
     }
 
-    pub fn unmake_move(&mut self) {
-        if self.ply > 0 {
-            self.ply -= 1; 
-        } else {
-            eprintln!("Warning: Attempted to unmake_move at ply 0!");
+    // Returns false at the root slot - The accumulators below it were folded in,
+    // so the position being returned to has to be created from scratch
+    pub fn unmake_move(&mut self) -> bool {
+        if self.ply == 0 {
+            return false;
         }
+        self.ply -= 1;
+        true
     }
 
     pub fn increment_ply(&mut self) {
         self.ply += 1;
     }
+
+    // Null move - No piece moves, so the child evaluates the parent's accumulator
+    pub fn push_null_accumulator(&mut self) {
+        self.accumulators[self.ply + 1] = self.accumulators[self.ply];
+        self.increment_ply();
+    }
+
+    // Make the current position the root slot - Called after every move played outside
+    // the search, so the stack only ever holds the search plies however long the game runs
+    pub fn reroot_accumulators(&mut self) {
+        if self.ply > 0 {
+            self.accumulators[0] = self.accumulators[self.ply];
+            self.ply = 0;
+        }
+    }
 }
 
+
+#[cfg(test)]
+mod tests {
+    use std::sync::Arc;
+
+    use super::*;
+    use crate::nnue_network::test_network;
+    use crate::search_worker::SearchWorker;
+    use crate::transposition_table::TranspositionTable;
+
+    fn assert_rejected(fen: &str) {
+        let mut board = ChessBoard::new(test_network());
+        board.load_fen(START_FEN).unwrap();
+        let zobrist_hash = board.zobrist_hash();
+
+        assert!(board.load_fen(fen).is_err(), "accepted {}", fen);
+        assert_eq!(board.zobrist_hash(), zobrist_hash, "{} changed the board", fen);
+    }
+
+    #[test]
+    fn rejects_bad_rank_count() {
+        assert_rejected("rnbqkbnr/pppppppp/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1");
+        assert_rejected("rnbqkbnr/pppppppp/8/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1");
+        assert_rejected("rnbqkbnr/ppppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1");
+    }
+
+    #[test]
+    fn rejects_two_kings_of_one_colour() {
+        assert_rejected("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBKKBNR w kq - 0 1");
+        assert_rejected("rnbq1bnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQ - 0 1");
+    }
+
+    #[test]
+    fn rejects_side_not_to_move_in_check() {
+        assert_rejected("4k3/8/8/8/8/8/8/r3K3 b - - 0 1");
+        assert_rejected("4k3/8/8/8/8/5n2/8/4K3 b - - 0 1");
+    }
+
+    #[test]
+    fn rejects_en_passant_square_off_rank_3_or_6() {
+        assert_rejected("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e4 0 1");
+        // Rank 3 with white to move - Only black can have just pushed two squares
+        assert_rejected("rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e3 0 2");
+        assert_rejected("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq i3 0 1");
+    }
+
+    #[test]
+    fn rejects_halfmove_clock_out_of_range() {
+        assert_rejected("4k3/8/8/8/8/8/8/4K3 w - - 151 90");
+        assert_rejected("4k3/8/8/8/8/8/8/4K3 w - - -1 1");
+        assert_rejected("4k3/8/8/8/8/8/8/4K3 w - - x 1");
+
+        let mut board = ChessBoard::new(test_network());
+        board.load_fen("4k3/8/8/8/8/8/8/4K3 w - - 150 90").unwrap();
+        assert_eq!(board.halfmove_clock(), MAX_HALFMOVE_CLOCK);
+        board.load_fen("4k3/8/8/8/8/8/8/4K3 w - -").unwrap();
+        assert_eq!(board.halfmove_clock(), 0);
+    }
+
+    // Captures, en passant and both castles, played through the search's incremental updates
+    #[test]
+    fn fen_matches_position_played_from_startpos() {
+        let moves = ["e2e4", "g8f6", "e4e5", "d7d5", "e5d6", "e7d6", "g1f3", "f8e7", "f1c4", "e8g8", "e1g1"];
+        let fen = "rnbq1rk1/ppp1bppp/3p1n2/8/2B5/5N2/PPPP1PPP/RNBQ1RK1 b - - 5 6";
+
+        let mut search_worker = SearchWorker::new(Arc::new(TranspositionTable::new(1)), test_network());
+        for uci_move in moves {
+            search_worker.push_uci_move(uci_move).unwrap();
+        }
+        let played = search_worker.chess_board();
+
+        let mut loaded = ChessBoard::new(test_network());
+        loaded.load_fen(fen).unwrap();
+
+        assert_eq!(played.zobrist_hash(), loaded.zobrist_hash());
+        assert_eq!(played.mailbox, loaded.mailbox);
+        assert_eq!(played.castling_rights, loaded.castling_rights);
+        assert_eq!(played.en_passant, loaded.en_passant);
+        assert_eq!(played.halfmove_clock, loaded.halfmove_clock);
+
+        let (played_accumulators, loaded_accumulators) = (&played.accumulators[played.ply], &loaded.accumulators[loaded.ply]);
+        assert_eq!(played_accumulators.white.vals, loaded_accumulators.white.vals);
+        assert_eq!(played_accumulators.black.vals, loaded_accumulators.black.vals);
+    }
+}
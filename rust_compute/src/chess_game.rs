@@ -1,25 +1,52 @@
-use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::Instant;
+#[cfg(feature = "python")]
 use pyo3::prelude::*;
+#[cfg(feature = "python")]
 use pyo3::types::PyString;
+#[cfg(feature = "python")]
+use pyo3::exceptions::{PyIOError, PyValueError};
 use std::sync::Arc;
-use std::thread;
-use std::time::Instant;
+#[cfg(feature = "python")]
+use std::sync::Mutex;
 
 use crate::bishop_mask::*;
 use crate::rook_mask::*;
 use crate::lmr_table::*;
 use crate::transposition_table::*;
 use crate::search_worker::*;
-use crate::parser::*;
+use crate::move_command::*;
+#[cfg(feature = "python")]
 use crate::nnue_network::*;
-
+use crate::search_handle::*;
+use crate::search_control::*;
+#[cfg(feature = "python")]
+use crate::time_manager::*;
+use crate::engine_options::*;
+use crate::thread_affinity::*;
+use crate::thread_pool::*;
+#[cfg(feature = "python")]
+use crate::parser::*;
+#[cfg(feature = "python")]
+use crate::game_session::*;
+#[cfg(feature = "python")]
+use crate::chess_board::*;
+#[cfg(feature = "python")]
+use crate::perft::*;
+#[cfg(feature = "python")]
+use crate::bench::*;
+
+// Default depth limit when the search limits don't set one
 pub const PV_DEPTH: i32 = 18;
 pub const MAX_DEPTH: i32 = 22;
 
-// When a thread finishes, if it exceeds the time, it will send the 
-// termination signal to the other threads.
+// Plies below the search root - Negamax stops at MAX_DEPTH and the quiescence search one
+// ply after it. Sizes the per-thread accumulator and undo stacks.
+pub const MAX_PLY: usize = MAX_DEPTH as usize + 4;
 
-// The other threads the single every 2048 executions
+// Default time budget (seconds) when the search limits set no clock.
+// The master thread stops early once the best move is stable across iterations,
+// and every thread polls the hard deadline every POLL_INTERVAL nodes.
 pub const SEARCH_TIME_LIMIT: u64 = 10;
 
 pub const INFINITY: i32 = 32000;
@@ -27,6 +54,11 @@ pub const MATE_VALUE: i32 = 30000;
 
 pub const MATE_THRESHOLD: i32 = MATE_VALUE - (MAX_DEPTH * 2);
 
+// Lazy SMP voting - Added to every thread's score above the worst one, so even that thread gets a vote
+pub const VOTE_SCORE_OFFSET: i32 = 14;
+
+// Defaults for EngineOptions - Threads, Hash (MB) and EvalFile are configurable at runtime
+
 // This is tuned for the Mac M4 Pro Chip
 // Thread Count is set to the number of Performance Cores to avoid 
 // Heterogeneous Thread Migration between Performance and Efficiency
@@ -38,117 +70,530 @@ pub const CACHE_SIZE: usize = 64;
 // Model path
 pub const MODEL_PATH: &str = "nnue-training/nnue_weights.bin";
 
+// MultiPV line for Python - (uci, score, depth, pv)
+#[cfg(feature = "python")]
+type PvLineTuple = (String, i32, i32, Vec<String>);
+
+// Search running on the opponent's time, rooted after the predicted reply
+#[cfg(feature = "python")]
+struct PonderSearch {
+    task: Arc<SearchTask>,
+    ponder_line: Vec<String>,
+}
+
+// Options and the resources built from them - Swapped in place by set_option
+// and shared with the GameSessions created by the game
+#[cfg(feature = "python")]
+pub(crate) struct EngineState {
+    options: EngineOptions,
+    transposition_table: Arc<TranspositionTable>,
+    nnue_network: &'static NnueNetwork,
+}
+
+#[cfg(feature = "python")]
+impl EngineState {
+    // Resources for the next search
+    pub(crate) fn snapshot(&self) -> (EngineOptions, Arc<TranspositionTable>, &'static NnueNetwork) {
+        (self.options.clone(), Arc::clone(&self.transposition_table), self.nnue_network)
+    }
+}
+
+#[cfg(feature = "python")]
 #[pyclass]
 pub struct ChessGame {
     nodes_processed: Arc<AtomicUsize>,
-    transposition_table: Arc<TranspositionTable>,
-    nnue_network: &'static NnueNetwork, 
+    engine: Arc<Mutex<EngineState>>,
+
+    // Position the prev_moves of every search are played from
+    root_fen: Mutex<String>,
+
+    // Last searched game line extended by the best move and the predicted reply
+    predicted_line: Arc<Mutex<Option<Vec<String>>>>,
+    ponder_search: Mutex<Option<PonderSearch>>,
 }
 
+#[cfg(feature = "python")]
 #[pymethods]
 impl ChessGame {
     #[new]
-    fn new() -> Self {
-        // 1. Safely stream the 25MB packed matrix from disk straight onto the heap
-        let network_box = NnueNetwork::load_from_file(MODEL_PATH)
-            .expect("Catastrophic Initializer Failure: Could not load NNUE model file matrices");
+    #[pyo3(signature = (options=None))]
+    fn new(options: Option<EngineOptions>) -> PyResult<Self> {
+        let options = options.unwrap_or_default();
+        options.validate().map_err(PyValueError::new_err)?;
 
-        // 2. Leak the Box memory to acquire an immutable reference for all search threads
-        let network_static: &'static NnueNetwork = Box::leak(network_box);
+        // Stream the 25MB packed matrix from disk onto the heap, shared by all search threads
+        let network_static = load_network(&options.nnue_path)?;
 
-        Self {
+        Ok(Self {
             nodes_processed: Arc::new(AtomicUsize::new(0)),
-            transposition_table: Arc::new(TranspositionTable::new(CACHE_SIZE)),
-            nnue_network: network_static,
+            engine: Arc::new(Mutex::new(EngineState {
+                transposition_table: Arc::new(TranspositionTable::new(options.hash_mb)),
+                nnue_network: network_static,
+                options,
+            })),
+
+            root_fen: Mutex::new(START_FEN.to_string()),
+
+            predicted_line: Arc::new(Mutex::new(None)),
+            ponder_search: Mutex::new(None),
+        })
+    }
+
+    pub fn options(&self) -> EngineOptions {
+        self.engine.lock().unwrap().options.clone()
+    }
+
+    // Threads / Hash / EvalFile / PinThreads - Applied from the next search onwards.
+    // A running search keeps the table and network it started with.
+    pub fn set_option(&self, name: &str, value: &Bound<'_, PyAny>) -> PyResult<()> {
+        let value = value.str()?.to_string();
+
+        let mut engine = self.engine.lock().unwrap();
+        let mut options = engine.options.clone();
+        options.set_option(name, &value).map_err(PyValueError::new_err)?;
+
+        if options.nnue_path != engine.options.nnue_path {
+            engine.nnue_network = load_network(&options.nnue_path)?;
+        }
+        if options.hash_mb != engine.options.hash_mb {
+            engine.transposition_table = Arc::new(TranspositionTable::new(options.hash_mb));
+        }
+        engine.options = options;
+
+        Ok(())
+    }
+
+    // Root position for the following searches - prev_moves are played from it.
+    // Raises ValueError on an invalid FEN, the previous position is kept.
+    pub fn set_position_fen(&self, py: Python<'_>, fen: &str) -> PyResult<()> {
+        self.root_worker(fen).map_err(PyValueError::new_err)?;
+
+        // The predicted line was searched from the old root
+        py.detach(|| self.stop_ponder_search());
+        *self.predicted_line.lock().unwrap() = None;
+        *self.root_fen.lock().unwrap() = fen.to_string();
+
+        Ok(())
+    }
+
+    pub fn position_fen(&self) -> String {
+        self.root_fen.lock().unwrap().clone()
+    }
+
+    // Persistent game state driven by packed moves - Shares this game's options,
+    // transposition table and network. Starts from the given FEN or the game's root position.
+    #[pyo3(signature = (fen=None))]
+    pub fn new_session(&self, fen: Option<&str>) -> PyResult<GameSession> {
+        let fen = fen.map_or_else(|| self.position_fen(), str::to_string);
+        let root_worker = self.root_worker(&fen).map_err(PyValueError::new_err)?;
+
+        Ok(GameSession::new(Arc::clone(&self.engine), root_worker))
+    }
+
+    // Batch analysis - Best Move (UCI) of each FEN, None if the side to move has no legal move.
+    // Positions are searched one after another, each with every search thread.
+    // All FENs are validated before the first search starts.
+    #[pyo3(signature = (fens, limits=None))]
+    pub fn search_fens(
+        &self,
+        py: Python<'_>,
+        fens: Vec<String>,
+        limits: Option<SearchLimits>,
+    ) -> PyResult<Vec<Option<String>>> {
+        let limits = limits.unwrap_or_default();
+
+        let mut root_workers = Vec::with_capacity(fens.len());
+        for (index, fen) in fens.iter().enumerate() {
+            let root_worker = self.root_worker(fen)
+                .map_err(|err| PyValueError::new_err(format!("FEN {}: {}", index, err)))?;
+            root_workers.push(root_worker);
+        }
+
+        py.detach(|| {
+            self.stop_ponder_search();
+            let (options, transposition_table, _) = self.engine.lock().unwrap().snapshot();
+
+            Ok(root_workers.iter_mut()
+                .map(|root_worker| {
+                    let control = SearchControl::new(limits.clone(), false);
+                    let outcome = search_position(
+                        &transposition_table, root_worker, &control, &self.nodes_processed, &options
+                    );
+                    outcome.best_move.map(parse_uci)
+                })
+                .collect())
+        })
+    }
+
+    // Move generation throughput from the given FEN or the game's root position.
+    // Runs with the GIL released on the game's thread count unless threads is set.
+    #[pyo3(signature = (depth, threads=None, hash_mb=PERFT_HASH_MB, fen=None))]
+    pub fn perft(
+        &self,
+        py: Python<'_>,
+        depth: i32,
+        threads: Option<usize>,
+        hash_mb: usize,
+        fen: Option<&str>,
+    ) -> PyResult<PerftReport> {
+        if !(0..=MAX_DEPTH).contains(&depth) {
+            return Err(PyValueError::new_err(format!("depth must be between 0 and {}", MAX_DEPTH)));
+        }
+
+        let (options, _, network_ref) = self.engine.lock().unwrap().snapshot();
+        let fen = fen.map_or_else(|| self.position_fen(), str::to_string);
+
+        let mut chess_board = ChessBoard::new(network_ref);
+        chess_board.load_fen(&fen).map_err(PyValueError::new_err)?;
+
+        let threads = threads.unwrap_or(options.threads).clamp(1, MAX_THREADS);
+        Ok(py.detach(|| perft(&chess_board, depth, threads, hash_mb.min(MAX_HASH_MB))))
+    }
+
+    // Regression bench on a fixed FEN suite - JSON report with nodes, NPS, time-to-depth
+    // and the single threaded node signature. Uses its own transposition table.
+    #[pyo3(signature = (depth=BENCH_DEPTH))]
+    pub fn bench(&self, py: Python<'_>, depth: i32) -> String {
+        let (options, _, network_ref) = self.engine.lock().unwrap().snapshot();
+        py.detach(|| {
+            self.stop_ponder_search();
+            run_bench(network_ref, &options, depth)
+        })
+    }
+
+    // MultiPV analysis of the position after prev_moves - The best multi_pv root moves
+    // as (uci, score, depth, pv) tuples, best first. Scores are centipawns from the
+    // side to move. One iterative deepening loop and TT serve every line.
+    #[pyo3(signature = (prev_moves, multi_pv, limits=None))]
+    pub fn analyse(
+        &self,
+        py: Python<'_>,
+        prev_moves: Vec<String>,
+        multi_pv: usize,
+        limits: Option<SearchLimits>,
+    ) -> PyResult<Vec<PvLineTuple>> {
+        let (mut options, transposition_table, _) = self.engine.lock().unwrap().snapshot();
+        options.multi_pv = multi_pv;
+        options.validate().map_err(PyValueError::new_err)?;
+
+        let mut root_worker = self.root_worker(&self.position_fen()).map_err(PyValueError::new_err)?;
+        for uci_move in &prev_moves {
+            root_worker.push_uci_move(uci_move).map_err(PyValueError::new_err)?;
         }
+
+        let outcome = py.detach(|| {
+            self.stop_ponder_search();
+            let control = SearchControl::new(limits.unwrap_or_default(), false);
+            search_position(&transposition_table, &mut root_worker, &control, &self.nodes_processed, &options)
+        });
+
+        Ok(outcome.pv_lines.iter()
+            .map(|pv_line| (
+                parse_uci(pv_line.best_move),
+                pv_line.score,
+                pv_line.depth,
+                pv_line.pv.iter().map(|mv| parse_uci(*mv)).collect(),
+            ))
+            .collect())
     }
 
     // Prev Moves provided in UCI Format
+    // The search runs with the GIL released so the Qt event loop keeps running
+    #[pyo3(signature = (prev_moves, limits=None))]
     pub fn compute_next_move<'py>(
         &self,
         py: Python<'py>, 
-        prev_moves: Vec<String>
+        prev_moves: Vec<String>,
+        limits: Option<SearchLimits>,
     ) -> PyResult<Bound<'py, PyString>> {
-        let mut final_best_move = None;
+        let outcome = py.detach(|| {
+            self.resume_or_spawn_search(prev_moves, limits).wait()
+        });
 
-        // Search Time
-        let start_time = Instant::now();
+        Ok(PyString::new(py, &outcome.best_move_uci()))
+    }
 
-        self.nodes_processed.store(0, Ordering::Relaxed);
-        let network_ref = self.nnue_network;
+    // Non-blocking variant of compute_next_move
+    #[pyo3(signature = (prev_moves, limits=None))]
+    pub fn start_search(
+        &self,
+        py: Python<'_>,
+        prev_moves: Vec<String>,
+        limits: Option<SearchLimits>,
+    ) -> SearchHandle {
+        SearchHandle::new(py.detach(|| {
+            self.resume_or_spawn_search(prev_moves, limits)
+        }))
+    }
+
+    // Prev Moves end with the engine's own move - Search the position after the
+    // predicted reply until the opponent moves. Returns false if there is no prediction.
+    // The limits apply from the ponder hit onwards, the clock counts the pondering time -
+    // Unless the search call that hits the ponder passes its own, which run from the hit.
+    #[pyo3(signature = (prev_moves, limits=None))]
+    pub fn start_ponder(
+        &self,
+        py: Python<'_>,
+        prev_moves: Vec<String>,
+        limits: Option<SearchLimits>,
+    ) -> bool {
+        py.detach(|| self.stop_ponder_search());
+
+        // Only ponder if the engine's best move was actually played in the searched position
+        let ponder_line = match self.predicted_line.lock().unwrap().take() {
+            Some(line) if line[..line.len() - 1] == prev_moves[..] => line,
+            _ => return false,
+        };
+
+        let task = self.spawn_search(ponder_line.clone(), limits.unwrap_or_default(), true);
+        *self.ponder_search.lock().unwrap() = Some(PonderSearch { task, ponder_line });
+        true
+    }
 
-        // Shared stop signal across all M4 Pro performance cores
-        let stop_search = Arc::new(AtomicBool::new(false));
+    // Abandon the ponder search - Transposition Table entries are kept
+    pub fn stop_ponder(&self, py: Python<'_>) {
+        py.detach(|| self.stop_ponder_search());
+    }
 
-        let tt_ref = &*self.transposition_table; 
-        let nodes_counter_ref = &*self.nodes_processed;
-        
-        // Clone Search Worker
-        let mut clone_search_worker = SearchWorker::new(tt_ref, network_ref);
-        clone_search_worker.process_moves(prev_moves);
+    // Predicted reply the engine would ponder on
+    pub fn ponder_move(&self) -> Option<String> {
+        self.predicted_line.lock().unwrap()
+            .as_ref()
+            .and_then(|line| line.last().cloned())
+    }
 
-        // Reset Count
-        let worker_source_ptr: &SearchWorker<'_> = &clone_search_worker;
+    pub fn is_pondering(&self) -> bool {
+        self.ponder_search.lock().unwrap()
+            .as_ref()
+            .is_some_and(|ponder_search| ponder_search.task.is_pondering())
+    }
+}
 
-        thread::scope(|s| {
-            let mut handlers = Vec::new();
+#[cfg(feature = "python")]
+impl ChessGame {
+    // Ponder Hit: the opponent played the predicted move, continue the search on the clock.
+    // Ponder Miss: stop the ponder search and start over from the actual position.
+    fn resume_or_spawn_search(&self, prev_moves: Vec<String>, limits: Option<SearchLimits>) -> Arc<SearchTask> {
+        let ponder_search = self.ponder_search.lock().unwrap().take();
+        *self.predicted_line.lock().unwrap() = None;
+
+        let task = match ponder_search {
+            Some(ponder_search) if ponder_search.ponder_line == prev_moves => {
+                match limits {
+                    Some(limits) => ponder_search.task.ponderhit_with(limits),
+                    None => ponder_search.task.ponderhit(),
+                }
+                ponder_search.task
+            },
+            Some(ponder_search) => {
+                ponder_search.task.stop();
+                ponder_search.task.wait();
+                self.spawn_search(prev_moves.clone(), limits.unwrap_or_default(), false)
+            },
+            None => self.spawn_search(prev_moves.clone(), limits.unwrap_or_default(), false),
+        };
+
+        // Remember the predicted line for the next start_ponder call
+        let predicted_line = Arc::clone(&self.predicted_line);
+        task.on_complete(move |outcome| {
+            if let (Some(best_move), Some(ponder_move)) = (outcome.best_move, outcome.ponder_move) {
+                let mut line = prev_moves;
+                line.push(parse_uci(best_move));
+                line.push(parse_uci(ponder_move));
+                *predicted_line.lock().unwrap() = Some(line);
+            }
+        });
 
-            for thread_id in 0..NUM_THREADS {
-                let worker_ref = worker_source_ptr; 
+        task
+    }
 
-                let thread_stop_signal = Arc::clone(&stop_search);
+    // Search root at the given FEN with the current table and network
+    fn root_worker(&self, fen: &str) -> Result<SearchWorker, String> {
+        let (_, transposition_table, network_ref) = self.engine.lock().unwrap().snapshot();
+        SearchWorker::from_fen(transposition_table, network_ref, fen)
+    }
 
-                let handle = s.spawn(move || {
-                    let mut search_worker = SearchWorker::from_game_state(
-                        tt_ref, worker_ref, thread_id
-                    );
+    fn stop_ponder_search(&self) {
+        let ponder_search = self.ponder_search.lock().unwrap().take();
 
-                    let (thread_best_move, nodes_processed) = search_worker.root_search(
-                        PV_DEPTH, 
-                        &thread_stop_signal
-                    );
+        if let Some(ponder_search) = ponder_search {
+            ponder_search.task.stop();
+            ponder_search.task.wait();
+        }
+    }
 
-                    nodes_counter_ref.fetch_add(nodes_processed, Ordering::Relaxed);
+    fn spawn_search(
+        &self,
+        prev_moves: Vec<String>,
+        limits: SearchLimits,
+        pondering: bool,
+    ) -> Arc<SearchTask> {
+        // Shared stop signal across all search threads
+        let control = Arc::new(SearchControl::new(limits, pondering));
+
+        let (options, transposition_table, network_ref) = self.engine.lock().unwrap().snapshot();
+        let root_fen = self.position_fen();
+        let nodes_processed = Arc::clone(&self.nodes_processed);
+        let thread_control = Arc::clone(&control);
+
+        SearchTask::spawn(control, move || {
+            // Clone Search Worker - The root FEN was validated by set_position_fen
+            let mut root_worker = SearchWorker::from_fen(
+                Arc::clone(&transposition_table), network_ref, &root_fen
+            ).expect("root FEN was validated when it was set");
+            root_worker.process_moves(prev_moves);
+
+            search_position(
+                &transposition_table, &mut root_worker, &thread_control, &nodes_processed, &options
+            )
+        })
+    }
+}
 
-                    (thread_id, thread_best_move)
-                });
+// Runs on the coordinator thread of a SearchTask
+pub fn search_position(
+    tt_ref: &Arc<TranspositionTable>,
+    root_worker: &mut SearchWorker,
+    control: &SearchControl,
+    nodes_counter_ref: &AtomicUsize,
+    options: &EngineOptions,
+) -> SearchOutcome {
+    // Search Time
+    let start_time = Instant::now();
+    nodes_counter_ref.store(0, Ordering::Relaxed);
+    control.start_clock(root_worker.active_player());
+
+    let pv_lines = lazy_smp_search(
+        tt_ref, root_worker, control, nodes_counter_ref, options
+    );
+    let best_move = pv_lines.first().map(|pv_line| pv_line.best_move);
+
+    // Second move of the principal variation is the reply to ponder on
+    let predicted_reply = best_move.and_then(|mv| {
+        root_worker.principal_variation(mv, 2).get(1).copied()
+    });
+
+    SearchOutcome {
+        best_move,
+        ponder_move: predicted_reply,
+        pv_lines,
+        nodes_processed: nodes_counter_ref.load(Ordering::Relaxed),
+        elapsed_ms: start_time.elapsed().as_millis(),
+    }
+}
 
-                handlers.push(handle);
-            }
+// Lazy SMP - Every thread searches the root position and shares the Transposition Table.
+// With options.abdada the threads search the same depths and defer each other's busy moves.
+// Only the master thread searches options.multi_pv lines, so its lines are returned for
+// MultiPV. A single line is picked by depth and score weighted voting across the threads.
+pub fn lazy_smp_search(
+    tt_ref: &Arc<TranspositionTable>,
+    root_worker: &SearchWorker,
+    control: &SearchControl,
+    nodes_counter_ref: &AtomicUsize,
+    options: &EngineOptions,
+) -> Vec<PvLine> {
+    // Pinned threads are spread over the NUMA nodes - With more than one node, every
+    // node searches on its own replica of the network weights
+    let placement = if options.pin_threads { thread_placement(options.threads) } else { Vec::new() };
+    let numa_replicas = placement.iter().any(|(_, numa_node)| *numa_node > 0);
+    control.start_threads(options.threads);
+
+    let thread_jobs: Vec<_> = (0..options.threads as i32)
+        .map(|thread_id| {
+            let thread_tt = Arc::clone(tt_ref);
+            let thread_placement = placement.get(thread_id as usize).copied();
+
+            move |pooled_worker: &mut Option<SearchWorker>| {
+                if let Some((core_id, _)) = thread_placement {
+                    pin_current_thread(core_id);
+                }
 
-            // Aggregate Responses (Fixed Scoped Handle Join API)
-            for handle in handlers {
-                let (thread_id, best_move) = handle.join().unwrap(); 
-                
-                if thread_id == 0 {
-                    final_best_move = best_move;
+                // Reuse the pooled thread's worker - Only its first search allocates one
+                let search_worker = match pooled_worker {
+                    Some(search_worker) => {
+                        search_worker.reset_from_game_state(thread_tt, root_worker, thread_id);
+                        search_worker
+                    },
+                    None => pooled_worker.insert(SearchWorker::from_game_state(thread_tt, root_worker, thread_id)),
+                };
+                search_worker.set_pruning_params(options.pruning);
+                search_worker.set_abdada(options.abdada && options.threads > 1);
+                if let (true, Some((_, numa_node))) = (numa_replicas, thread_placement) {
+                    let root_network = root_worker.chess_board().nnue_network();
+                    search_worker.set_nnue_network(root_network.replica_for_node(numa_node));
                 }
+
+                let multi_pv = if thread_id == 0 { options.multi_pv } else { 1 };
+                search_worker.root_search(control.max_depth(), control, multi_pv)
             }
-        });
+        })
+        .collect();
 
-        let elapsed_time = start_time.elapsed();
-        let node_procesed =  self.nodes_processed.load(Ordering::Relaxed);
-        println!("{} Nodes Procesed in {} milliseconds", 
-            node_procesed, elapsed_time.as_millis());
-                
-        if let Some(mv) = final_best_move {
-            let uci = parse_uci(mv);
+    // Results come back in thread_id order - Node counts are only summed here, once
+    let (mut thread_results, thread_nodes): (Vec<Vec<PvLine>>, Vec<usize>) =
+        search_thread_pool().run(thread_jobs).into_iter().unzip();
+    nodes_counter_ref.store(thread_nodes.iter().sum(), Ordering::Relaxed);
 
-            // Step 1: Bound<PyString>
-            let py_str = PyString::new(py, &uci);
+    if options.multi_pv > 1 {
+        return thread_results.into_iter().next().unwrap_or_default();
+    }
 
-            // Step 2: Bound<PyString> → Py<PyString>
-            let py_obj = py_str.into_pyobject(py)?.unbind();
+    let best_lines: Vec<Option<&PvLine>> = thread_results.iter()
+        .map(|pv_lines| pv_lines.first())
+        .collect();
+    match vote_best_thread(&best_lines) {
+        Some(best_thread) => thread_results.swap_remove(best_thread),
+        None => Vec::new(),
+    }
+}
 
-            // Step 3: Py<PyString> → Bound<PyAny>
-            Ok(py_obj.into_bound(py))
+// Each thread votes for its best move with (score - worst score + VOTE_SCORE_OFFSET) * depth,
+// so deeper and better scored results weigh more. The first thread whose move has the most
+// votes wins - Unless a thread proved a mate, then the fastest mate wins.
+fn vote_best_thread(best_lines: &[Option<&PvLine>]) -> Option<usize> {
+    let completed: Vec<(usize, &PvLine)> = best_lines.iter()
+        .enumerate()
+        .filter_map(|(index, pv_line)| pv_line.map(|pv_line| (index, pv_line)))
+        .collect();
+    let min_score = completed.iter().map(|(_, pv_line)| pv_line.score).min()?;
+
+    let mut votes: Vec<(ForwardMove, i64)> = Vec::new();
+    for (_, pv_line) in completed.iter() {
+        let weight = (pv_line.score - min_score + VOTE_SCORE_OFFSET) as i64 * pv_line.depth.max(1) as i64;
+        match votes.iter_mut().find(|(mv, _)| *mv == pv_line.best_move) {
+            Some((_, count)) => *count += weight,
+            None => votes.push((pv_line.best_move, weight)),
+        }
+    }
+    let votes_for = |pv_line: &PvLine| votes.iter()
+        .find(|(mv, _)| *mv == pv_line.best_move)
+        .map_or(0, |(_, count)| *count);
+
+    let (mut best_index, mut best_line) = completed[0];
+    for &(index, pv_line) in completed.iter().skip(1) {
+        let better = if best_line.score >= MATE_THRESHOLD || pv_line.score >= MATE_THRESHOLD {
+            pv_line.score > best_line.score
         } else {
-            Ok(PyString::new(py, ""))
+            pv_line.score > -MATE_THRESHOLD && votes_for(pv_line) > votes_for(best_line)
+        };
+
+        if better {
+            (best_index, best_line) = (index, pv_line);
         }
     }
+
+    Some(best_index)
+}
+
+#[cfg(feature = "python")]
+fn load_network(path: &str) -> PyResult<&'static NnueNetwork> {
+    NnueNetwork::load_shared(path).map_err(|err| {
+        PyIOError::new_err(format!("Could not load NNUE model file {}: {}", path, err))
+    })
 }
 
-#[pyfunction]
+#[cfg_attr(feature = "python", pyfunction)]
 pub fn init_attack_tables() {
     let _ = *BISHOP_ATTACKS;
     let _ = *ROOK_ATTACKS;
@@ -0,0 +1,117 @@
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+#[cfg(feature = "python")]
+use pyo3::exceptions::PyValueError;
+
+use crate::chess_game::*;
+use crate::pruning_params::*;
+
+pub const MAX_THREADS: usize = 512;
+pub const MAX_HASH_MB: usize = 1 << 16;
+pub const MAX_MULTI_PV: usize = 256;
+
+// Engine configuration - Defaults are tuned for the Mac M4 Pro
+#[cfg_attr(feature = "python", pyclass(get_all, set_all))]
+#[derive(Debug, Clone)]
+pub struct EngineOptions {
+    pub threads: usize,
+    pub hash_mb: usize,
+    pub nnue_path: String,
+    // Pin each search thread to its own core, spread over the NUMA nodes with a network
+    // replica per node (Linux only)
+    pub pin_threads: bool,
+    // Number of best root moves searched and reported
+    pub multi_pv: usize,
+    // Parallel search - ABDADA defers moves busy on other threads, instead of Lazy SMP depth skipping
+    pub abdada: bool,
+    // Reverse futility, futility, razoring and late move pruning margins
+    pub pruning: PruningParams,
+}
+
+impl Default for EngineOptions {
+    fn default() -> Self {
+        Self {
+            threads: NUM_THREADS as usize,
+            hash_mb: CACHE_SIZE,
+            nnue_path: MODEL_PATH.to_string(),
+            pin_threads: false,
+            multi_pv: 1,
+            abdada: false,
+            pruning: PruningParams::default(),
+        }
+    }
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl EngineOptions {
+    #[new]
+    #[pyo3(signature = (threads=None, hash_mb=None, nnue_path=None, pin_threads=false, multi_pv=1, abdada=false, pruning=None))]
+    fn py_new(
+        threads: Option<usize>,
+        hash_mb: Option<usize>,
+        nnue_path: Option<String>,
+        pin_threads: bool,
+        multi_pv: usize,
+        abdada: bool,
+        pruning: Option<PruningParams>,
+    ) -> PyResult<Self> {
+        let defaults = Self::default();
+        let options = Self {
+            threads: threads.unwrap_or(defaults.threads),
+            hash_mb: hash_mb.unwrap_or(defaults.hash_mb),
+            nnue_path: nnue_path.unwrap_or(defaults.nnue_path),
+            pin_threads,
+            multi_pv,
+            abdada,
+            pruning: pruning.unwrap_or_default(),
+        };
+
+        options.validate().map_err(PyValueError::new_err)?;
+        Ok(options)
+    }
+
+    fn __repr__(&self) -> String {
+        format!("{:?}", self)
+    }
+}
+
+impl EngineOptions {
+    pub fn validate(&self) -> Result<(), String> {
+        if !(1..=MAX_THREADS).contains(&self.threads) {
+            return Err(format!("threads must be between 1 and {}", MAX_THREADS));
+        }
+        if !(1..=MAX_HASH_MB).contains(&self.hash_mb) {
+            return Err(format!("hash_mb must be between 1 and {}", MAX_HASH_MB));
+        }
+        if !(1..=MAX_MULTI_PV).contains(&self.multi_pv) {
+            return Err(format!("multi_pv must be between 1 and {}", MAX_MULTI_PV));
+        }
+        self.pruning.validate()
+    }
+
+    // Accepts both the UCI option names and the attribute names
+    pub fn set_option(&mut self, name: &str, value: &str) -> Result<(), String> {
+        let value = value.trim();
+        let mut updated = self.clone();
+
+        match name.trim().to_ascii_lowercase().as_str() {
+            "threads" => updated.threads = parse_option(name, value)?,
+            "hash" | "hash_mb" => updated.hash_mb = parse_option(name, value)?,
+            "evalfile" | "nnue_path" => updated.nnue_path = value.to_string(),
+            "pinthreads" | "pin_threads" => updated.pin_threads = parse_option(name, &value.to_ascii_lowercase())?,
+            "multipv" | "multi_pv" => updated.multi_pv = parse_option(name, value)?,
+            "abdada" => updated.abdada = parse_option(name, &value.to_ascii_lowercase())?,
+            _ if updated.pruning.get(name).is_some() => updated.pruning.set(name, parse_option(name, value)?)?,
+            _ => return Err(format!("Unknown option: {}", name)),
+        }
+
+        updated.validate()?;
+        *self = updated;
+        Ok(())
+    }
+}
+
+fn parse_option<T: std::str::FromStr>(name: &str, value: &str) -> Result<T, String> {
+    value.parse().map_err(|_| format!("Invalid value for {}: {}", name, value))
+}
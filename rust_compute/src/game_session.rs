@@ -0,0 +1,129 @@
+use std::sync::atomic::AtomicUsize;
+use std::sync::{Arc, Mutex};
+use pyo3::prelude::*;
+use pyo3::exceptions::{PyIndexError, PyValueError};
+
+use crate::chess_game::*;
+use crate::move_command::*;
+use crate::parser::*;
+use crate::search_control::*;
+use crate::search_handle::*;
+use crate::search_worker::*;
+use crate::time_manager::*;
+
+// Highest MoveFlag value - Larger flags can't be unpacked
+const MAX_MOVE_FLAG: u16 = MoveFlag::PROMOTIONKNIGHT as u16;
+
+// Persistent game state driven by packed moves (the Transposition Table u16 format).
+// The root position is updated in place by push_move / pop_move instead of
+// replaying the full UCI move list before every search.
+#[pyclass]
+pub struct GameSession {
+    engine: Arc<Mutex<EngineState>>,
+    root_worker: Mutex<SearchWorker>,
+    nodes_processed: Arc<AtomicUsize>,
+}
+
+impl GameSession {
+    pub(crate) fn new(engine: Arc<Mutex<EngineState>>, root_worker: SearchWorker) -> Self {
+        Self {
+            engine,
+            root_worker: Mutex::new(root_worker),
+            nodes_processed: Arc::new(AtomicUsize::new(0)),
+        }
+    }
+
+    fn spawn_search(&self, limits: SearchLimits) -> Arc<SearchTask> {
+        let control = Arc::new(SearchControl::new(limits, false));
+        let (options, transposition_table, _) = self.engine.lock().unwrap().snapshot();
+
+        // Snapshot of the root - The session can keep moving while the search runs
+        let mut root_worker = SearchWorker::from_game_state(
+            Arc::clone(&transposition_table), &self.root_worker.lock().unwrap(), 0
+        );
+
+        let nodes_processed = Arc::clone(&self.nodes_processed);
+        let thread_control = Arc::clone(&control);
+
+        SearchTask::spawn(control, move || {
+            search_position(
+                &transposition_table, &mut root_worker, &thread_control, &nodes_processed, &options
+            )
+        })
+    }
+}
+
+#[pymethods]
+impl GameSession {
+    // Restart the session from the given FEN - The move history is cleared.
+    // Raises ValueError on an invalid FEN, the current position is kept.
+    pub fn set_position_fen(&self, fen: &str) -> PyResult<()> {
+        let (_, transposition_table, network_ref) = self.engine.lock().unwrap().snapshot();
+        let root_worker = SearchWorker::from_fen(transposition_table, network_ref, fen)
+            .map_err(PyValueError::new_err)?;
+
+        *self.root_worker.lock().unwrap() = root_worker;
+        Ok(())
+    }
+
+    // Raises ValueError if the move isn't legal in the current position
+    pub fn push_move(&self, packed_move: u16) -> PyResult<()> {
+        self.root_worker.lock().unwrap()
+            .push_packed_move(packed_move)
+            .map(|_| ())
+            .map_err(PyValueError::new_err)
+    }
+
+    // Undo and return the last move
+    pub fn pop_move(&self) -> PyResult<u16> {
+        self.root_worker.lock().unwrap()
+            .pop_move()
+            .map(|forward_move| forward_move.pack())
+            .ok_or_else(|| PyIndexError::new_err("pop_move at the root position"))
+    }
+
+    pub fn legal_moves(&self) -> Vec<u16> {
+        self.root_worker.lock().unwrap()
+            .legal_moves()
+            .iter()
+            .map(|forward_move| forward_move.pack())
+            .collect()
+    }
+
+    // Number of moves pushed since the root position
+    pub fn __len__(&self) -> usize {
+        self.root_worker.lock().unwrap().history_len()
+    }
+
+    // Best Move packed, or None if the side to move has no legal move.
+    // The search runs with the GIL released.
+    #[pyo3(signature = (limits=None))]
+    pub fn search(&self, py: Python<'_>, limits: Option<SearchLimits>) -> Option<u16> {
+        let outcome = py.detach(|| self.spawn_search(limits.unwrap_or_default()).wait());
+        outcome.best_move.map(|forward_move| forward_move.pack())
+    }
+
+    // Non-blocking variant of search - See SearchHandle.best_move_packed
+    #[pyo3(signature = (limits=None))]
+    pub fn start_search(&self, py: Python<'_>, limits: Option<SearchLimits>) -> SearchHandle {
+        SearchHandle::new(py.detach(|| self.spawn_search(limits.unwrap_or_default())))
+    }
+
+    // UCI move in the current position to its packed form
+    pub fn encode_move(&self, uci_move: &str) -> PyResult<u16> {
+        self.root_worker.lock().unwrap()
+            .legal_moves()
+            .iter()
+            .find(|forward_move| parse_uci(**forward_move) == uci_move)
+            .map(|forward_move| forward_move.pack())
+            .ok_or_else(|| PyValueError::new_err(format!("Illegal move: {}", uci_move)))
+    }
+
+    #[staticmethod]
+    pub fn decode_move(packed_move: u16) -> PyResult<String> {
+        if packed_move >> 12 > MAX_MOVE_FLAG {
+            return Err(PyValueError::new_err(format!("Invalid packed move: {:#06x}", packed_move)));
+        }
+        Ok(parse_uci(ForwardMove::unpack(packed_move)))
+    }
+}
@@ -1,20 +1,20 @@
 use crate::move_command::*;
 use crate::chess_board::*;
-use arrayvec::ArrayVec;
+use crate::move_list::*;
 
 // White: Rank 1 (Indices 0-7)
 // e1=4, f1=5, g1=6
-const WHITE_KINGSIDE_PATH: u64 = 0x70; 
+pub const WHITE_KINGSIDE_PATH: u64 = 0x70; 
 
 // e1=4, d1=3, c1=2
-const WHITE_QUEENSIDE_PATH: u64 = 0x1C; 
+pub const WHITE_QUEENSIDE_PATH: u64 = 0x1C; 
 
 // Black: Rank 8 (Indices 56-63)
 // e8=60, f8=61, g8=62
-const BLACK_KINGSIDE_PATH: u64 = 0x7000000000000000;
+pub const BLACK_KINGSIDE_PATH: u64 = 0x7000000000000000;
 
 // e8=60, d8=59, c8=58
-const BLACK_QUEENSIDE_PATH: u64 = 0x1C00000000000000;
+pub const BLACK_QUEENSIDE_PATH: u64 = 0x1C00000000000000;
 
  // Square e1 (bit 4)
 const WHITE_KING_START: u64 = 0x10;
@@ -23,16 +23,16 @@ const WHITE_KING_START: u64 = 0x10;
 const BLACK_KING_START: u64 = 0x1000000000000000;
 
 // f1, g1
-const WHITE_KINGSIDE_MOVE_PATH: u64 = WHITE_KINGSIDE_PATH & !WHITE_KING_START;
+pub const WHITE_KINGSIDE_MOVE_PATH: u64 = WHITE_KINGSIDE_PATH & !WHITE_KING_START;
 
  // b1, c1, d1
-const WHITE_QUEENSIDE_MOVE_PATH: u64 = 0x0E;
+pub const WHITE_QUEENSIDE_MOVE_PATH: u64 = 0x0E;
 
  // f8, g8
-const BLACK_KINGSIDE_MOVE_PATH: u64 = BLACK_KINGSIDE_PATH & !BLACK_KING_START;
+pub const BLACK_KINGSIDE_MOVE_PATH: u64 = BLACK_KINGSIDE_PATH & !BLACK_KING_START;
 
 // b8, c8, d8
-const BLACK_QUEENSIDE_MOVE_PATH: u64 =  0x0E00000000000000;
+pub const BLACK_QUEENSIDE_MOVE_PATH: u64 =  0x0E00000000000000;
 
 // Compute King Attack on Compile
 pub const KING_ATTACKS: [u64; 64] = {
@@ -64,7 +64,7 @@ pub const KING_ATTACKS: [u64; 64] = {
 };
 
 pub fn king_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index: usize,
-    opponent_attacks: u64, moves: &mut ArrayVec::<ForwardMove, 256>)  {
+    opponent_attacks: u64, moves: &mut MoveList)  {
 
     let mut king_bitboard = chess_board.kings[player_index];
 
@@ -80,9 +80,7 @@ pub fn king_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index:
 
         while king_moves != 0 {
             let target = king_moves.trailing_zeros() as usize;
-            moves.push(ForwardMove { 
-                start_sq: king, end_sq: target, move_type: MoveFlag::MOVE, pv_score: 1000
-            });
+            moves.push(ForwardMove::new(king, target, MoveFlag::MOVE), 1000);
             king_moves &= king_moves - 1;
         }
 
@@ -92,9 +90,7 @@ pub fn king_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index:
             let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
             let pv_score = 100 - (captured_piece_val * 10) + 5; 
 
-            moves.push(ForwardMove { 
-                start_sq: king, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score
-            });
+            moves.push(ForwardMove::new(king, target, MoveFlag::CAPTURE), pv_score);
             king_captures &= king_captures - 1;
         }
 
@@ -104,46 +100,26 @@ pub fn king_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index:
                 if (chess_board.castle_rights() & WHITE_KINGSIDE) != 0 
                     && (WHITE_KINGSIDE_PATH & opponent_attacks) == 0 
                         && (WHITE_KINGSIDE_MOVE_PATH & chess_board.occupied) == 0 {
-                            moves.push(
-                                ForwardMove { 
-                                    start_sq: king, end_sq: king + 2, 
-                                    move_type: MoveFlag::KINGSIDECASTLE, pv_score: 500
-                                }
-                            );
+                            moves.push(ForwardMove::new(king, king + 2, MoveFlag::KINGSIDECASTLE), 500);
                 }
 
                 if (chess_board.castle_rights() & WHITE_QUEENSIDE) != 0 
                     && (WHITE_QUEENSIDE_PATH & opponent_attacks) == 0
                         && (WHITE_QUEENSIDE_MOVE_PATH & chess_board.occupied) == 0 {
-                            moves.push(
-                                ForwardMove { 
-                                    start_sq: king, end_sq: king - 2, 
-                                    move_type: MoveFlag::QUEENSIDECASTLE, pv_score: 510
-                                }
-                            );
+                            moves.push(ForwardMove::new(king, king - 2, MoveFlag::QUEENSIDECASTLE), 510);
                 }
             },
             Side::BLACK => {
                 if (chess_board.castle_rights() & BLACK_KINGSIDE) != 0 
                     && (BLACK_KINGSIDE_PATH & opponent_attacks) == 0 
                         && (BLACK_KINGSIDE_MOVE_PATH & chess_board.occupied) == 0 {
-                            moves.push(
-                                ForwardMove { 
-                                    start_sq: king, end_sq: king + 2, 
-                                    move_type: MoveFlag::KINGSIDECASTLE, pv_score: 500 
-                                }
-                            );
+                            moves.push(ForwardMove::new(king, king + 2, MoveFlag::KINGSIDECASTLE), 500);
                 }
 
                 if (chess_board.castle_rights() & BLACK_QUEENSIDE) != 0 
                     && (BLACK_QUEENSIDE_PATH & opponent_attacks) == 0 
                         && (BLACK_QUEENSIDE_MOVE_PATH & chess_board.occupied) == 0 {
-                            moves.push(
-                                ForwardMove { 
-                                    start_sq: king, end_sq: king - 2, 
-                                    move_type: MoveFlag::QUEENSIDECASTLE, pv_score: 510 
-                                }
-                            );
+                            moves.push(ForwardMove::new(king, king - 2, MoveFlag::QUEENSIDECASTLE), 510);
                 }
             }
         }
@@ -1,6 +1,6 @@
 use crate::move_command::*;
 use crate::chess_board::*;
-use arrayvec::ArrayVec;
+use crate::move_list::*;
 
 // Compute Knight Attack on Compile
 pub const KNIGHT_ATTACKS: [u64; 64] = {
@@ -32,7 +32,7 @@ pub const KNIGHT_ATTACKS: [u64; 64] = {
 };
 
 pub fn knight_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index: usize,
-    moves: &mut ArrayVec::<ForwardMove, 256>)  {
+    moves: &mut MoveList)  {
 
     let mut knight_bitboard = chess_board.knights[player_index];
 
@@ -45,11 +45,7 @@ pub fn knight_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index
 
         while knight_moves != 0 {
             let target = knight_moves.trailing_zeros() as usize;
-            moves.push(
-                ForwardMove { 
-                    start_sq: knight, end_sq: target, move_type: MoveFlag::MOVE, pv_score: 1000
-                }
-            );
+            moves.push(ForwardMove::new(knight, target, MoveFlag::MOVE), 1000);
             knight_moves &= knight_moves - 1;
         }
 
@@ -59,11 +55,7 @@ pub fn knight_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index
             let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
             let pv_score = 100 - (captured_piece_val * 10) + 2; 
 
-            moves.push(
-                ForwardMove { 
-                    start_sq: knight, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score 
-                }
-            );
+            moves.push(ForwardMove::new(knight, target, MoveFlag::CAPTURE), pv_score);
             knight_captures &= knight_captures - 1;
         }
 
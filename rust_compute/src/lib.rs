@@ -1,3 +1,4 @@
+#[cfg(feature = "python")]
 use pyo3::prelude::*;
 
 pub mod bishop_mask;
@@ -6,9 +7,14 @@ pub mod knight_mask;
 pub mod pawn_mask;
 pub mod rook_mask;
 pub mod queen_mask;
+pub mod line_mask;
+pub mod static_exchange;
 pub mod lmr_table;
 
 pub mod move_command;
+pub mod move_list;
+pub mod move_picker;
+pub mod move_history;
 pub mod chess_board;
 pub mod chess_game;
 pub mod zobrist_hash;
@@ -17,14 +23,47 @@ pub mod search_worker;
 pub mod parser;
 pub mod nnue_network;
 pub mod board_accumlator;
+pub mod search_handle;
+pub mod search_control;
+pub mod time_manager;
+pub mod engine_options;
+pub mod pruning_params;
+pub mod thread_affinity;
+pub mod thread_pool;
+pub mod perft;
+pub mod bench;
+pub mod uci;
+#[cfg(feature = "python")]
+pub mod game_session;
 
+#[cfg(feature = "python")]
 use crate::chess_game::{init_attack_tables};
+#[cfg(feature = "python")]
 use crate::chess_game::ChessGame;
+#[cfg(feature = "python")]
+use crate::search_handle::SearchHandle;
+#[cfg(feature = "python")]
+use crate::time_manager::SearchLimits;
+#[cfg(feature = "python")]
+use crate::engine_options::EngineOptions;
+#[cfg(feature = "python")]
+use crate::pruning_params::PruningParams;
+#[cfg(feature = "python")]
+use crate::game_session::GameSession;
+#[cfg(feature = "python")]
+use crate::perft::PerftReport;
 
+#[cfg(feature = "python")]
 #[pymodule]
 fn rust_compute(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(init_attack_tables, m)?)?;
     m.add_class::<ChessGame>()?;
+    m.add_class::<SearchHandle>()?;
+    m.add_class::<SearchLimits>()?;
+    m.add_class::<EngineOptions>()?;
+    m.add_class::<PruningParams>()?;
+    m.add_class::<GameSession>()?;
+    m.add_class::<PerftReport>()?;
 
     Ok(())
 }
\ No newline at end of file
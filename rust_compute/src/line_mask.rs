@@ -0,0 +1,75 @@
+// Squares strictly between two aligned squares - Empty if not on a rank, file or diagonal
+pub static BETWEEN_SQUARES: [[u64; 64]; 64] = {
+    let mut between = [[0u64; 64]; 64];
+
+    let mut a = 0;
+    while a < 64 {
+        let mut b = 0;
+        while b < 64 {
+            between[a][b] = compute_line(a, b, false);
+            b += 1;
+        }
+        a += 1;
+    }
+
+    between
+};
+
+// Full board line through two aligned squares - Empty if not on a rank, file or diagonal
+pub static LINE_THROUGH: [[u64; 64]; 64] = {
+    let mut line = [[0u64; 64]; 64];
+
+    let mut a = 0;
+    while a < 64 {
+        let mut b = 0;
+        while b < 64 {
+            line[a][b] = compute_line(a, b, true);
+            b += 1;
+        }
+        a += 1;
+    }
+
+    line
+};
+
+// Walk from a towards b - Either the squares in between, or the whole line edge to edge
+const fn compute_line(a: usize, b: usize, full_line: bool) -> u64 {
+    if a == b {
+        return 0;
+    }
+
+    let (ar, af) = ((a / 8) as i8, (a % 8) as i8);
+    let (br, bf) = ((b / 8) as i8, (b % 8) as i8);
+    let (dr, df) = (br - ar, bf - af);
+
+    // Rank, file or diagonal only
+    if dr != 0 && df != 0 && dr.abs() != df.abs() {
+        return 0;
+    }
+
+    let (step_r, step_f) = (dr.signum(), df.signum());
+    let mut mask = 0u64;
+
+    if full_line {
+        // Back up to the edge, then walk to the opposite edge
+        let (mut cur_r, mut cur_f) = (ar, af);
+        while cur_r - step_r >= 0 && cur_r - step_r <= 7 && cur_f - step_f >= 0 && cur_f - step_f <= 7 {
+            cur_r -= step_r;
+            cur_f -= step_f;
+        }
+        while cur_r >= 0 && cur_r <= 7 && cur_f >= 0 && cur_f <= 7 {
+            mask |= 1u64 << (cur_r * 8 + cur_f);
+            cur_r += step_r;
+            cur_f += step_f;
+        }
+    } else {
+        let (mut cur_r, mut cur_f) = (ar + step_r, af + step_f);
+        while cur_r != br || cur_f != bf {
+            mask |= 1u64 << (cur_r * 8 + cur_f);
+            cur_r += step_r;
+            cur_f += step_f;
+        }
+    }
+
+    mask
+}
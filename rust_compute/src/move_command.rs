@@ -1,37 +1,42 @@
-#[derive(Debug, Clone, Copy)]
-pub struct ForwardMove {
-    pub start_sq: usize,
-    pub end_sq: usize,
-    pub move_type: MoveFlag,
-    pub pv_score: i32,
-}
+// Packed move - Start square in bits 0-5, end square in bits 6-11, MoveFlag in bits 12-15.
+// Same layout as the Transposition Table, ordering scores are kept apart in MoveList.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+#[repr(transparent)]
+pub struct ForwardMove(u16);
 
-// Packs the move into a single u16 for the Transposition Table
 impl ForwardMove {
-    pub fn pack(&self) -> u16 {
-        (self.start_sq as u16) | ((self.end_sq as u16) << 6) | ((self.move_type as u16) << 12)
+    #[inline(always)]
+    pub const fn new(start_sq: usize, end_sq: usize, move_type: MoveFlag) -> Self {
+        Self((start_sq as u16) | ((end_sq as u16) << 6) | ((move_type as u16) << 12))
     }
 
-    pub fn unpack(packed: u16) -> Self {
-        Self {
-            start_sq: (packed & 0x3F) as usize,
-            end_sq: ((packed >> 6) & 0x3F) as usize,
-            move_type: unsafe { std::mem::transmute::<u32, MoveFlag>((packed >> 12) as u32) }, 
-            pv_score: 0,
-        }
+    #[inline(always)]
+    pub const fn start_sq(self) -> usize {
+        (self.0 & 0x3F) as usize
     }
-}
 
-// Custom PartialEq to exclude pv_score from equality checks
-impl PartialEq for ForwardMove {
-    fn eq(&self, other: &Self) -> bool {
-        self.start_sq == other.start_sq 
-            && self.end_sq == other.end_sq 
-            && self.move_type == other.move_type
+    #[inline(always)]
+    pub const fn end_sq(self) -> usize {
+        ((self.0 >> 6) & 0x3F) as usize
     }
-}
 
-impl Eq for ForwardMove {}
+    #[inline(always)]
+    pub const fn move_type(self) -> MoveFlag {
+        // Every ForwardMove is built from a MoveFlag or unpacked from one
+        unsafe { std::mem::transmute::<u32, MoveFlag>((self.0 >> 12) as u32) }
+    }
+
+    #[inline(always)]
+    pub const fn pack(self) -> u16 {
+        self.0
+    }
+
+    // Callers validate the MoveFlag bits of packed moves that don't come from pack
+    #[inline(always)]
+    pub const fn unpack(packed: u16) -> Self {
+        Self(packed)
+    }
+}
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub struct UndoMove {
@@ -41,6 +46,7 @@ pub struct UndoMove {
     pub captured_piece: Option<BoardPiece>,
     pub prev_castle_rights: u8,
     pub prev_en_passant: u64,
+    pub prev_halfmove_clock: u32,
 }
 
 #[derive(Debug, Copy, Clone, PartialEq, Eq)]
@@ -210,6 +216,25 @@ pub fn is_none(piece: BoardPiece) -> bool {
     matches!(piece, BoardPiece::NONE)
 }
 
+// FEN piece letter - Uppercase for White
+pub fn piece_from_fen(piece_char: char) -> Option<BoardPiece> {
+    match piece_char {
+        'P' => Some(BoardPiece::WPAWN),
+        'B' => Some(BoardPiece::WBISHOP),
+        'N' => Some(BoardPiece::WKNIGHT),
+        'R' => Some(BoardPiece::WROOK),
+        'Q' => Some(BoardPiece::WQUEEN),
+        'K' => Some(BoardPiece::WKING),
+        'p' => Some(BoardPiece::BPAWN),
+        'b' => Some(BoardPiece::BBISHOP),
+        'n' => Some(BoardPiece::BKNIGHT),
+        'r' => Some(BoardPiece::BROOK),
+        'q' => Some(BoardPiece::BQUEEN),
+        'k' => Some(BoardPiece::BKING),
+        _ => None,
+    }
+}
+
 pub fn piece_value(piece_type: BoardPiece) -> i32 {
     match piece_type {
         BoardPiece::WPAWN | BoardPiece::BPAWN => {
@@ -0,0 +1,115 @@
+use crate::chess_board::*;
+use crate::move_command::*;
+
+// History scores are kept within +/- this bound by the gravity update
+pub const MAX_HISTORY: i32 = 16384;
+
+// Largest single update - Deep cutoffs count more, but can't saturate an entry at once
+const MAX_HISTORY_BONUS: i32 = 1600;
+
+// Captures are ordered by MVV-LVA first - Capture history only reorders within about one victim class
+pub const CAPTURE_ORDER_SCALE: i32 = 2048;
+
+// LMR shrinks (or grows) by one ply per this much quiet history
+pub const LMR_HISTORY_DIVISOR: i32 = 8192;
+
+// Per-thread move ordering statistics, learned from beta cutoffs during one search:
+// - butterfly[side][from][to] for quiet moves
+// - countermoves[piece][to] - The quiet reply that refuted the previous move
+// - capture_history[piece][to][captured piece type] for captures
+#[derive(Clone)]
+pub struct MoveHistory {
+    butterfly: [[[i16; 64]; 64]; 2],
+    countermoves: [[u16; 64]; 12],
+    capture_history: [[[i16; 6]; 64]; 12],
+}
+
+impl Default for MoveHistory {
+    fn default() -> Self {
+        Self {
+            butterfly: [[[0; 64]; 64]; 2],
+            countermoves: [[0; 64]; 12],
+            capture_history: [[[0; 6]; 64]; 12],
+        }
+    }
+}
+
+impl MoveHistory {
+    pub fn clear(&mut self) {
+        *self = Self::default();
+    }
+
+    #[inline(always)]
+    pub fn quiet_score(&self, side: Side, forward_move: ForwardMove) -> i32 {
+        self.butterfly[side as usize][forward_move.start_sq()][forward_move.end_sq()] as i32
+    }
+
+    // Zero for anything that isn't a capture of a piece - Queen promotions and en passant included
+    #[inline(always)]
+    pub fn capture_score(&self, chess_board: &ChessBoard, forward_move: ForwardMove) -> i32 {
+        capture_index(chess_board, forward_move)
+            .map_or(0, |(piece, to, victim)| self.capture_history[piece][to][victim] as i32)
+    }
+
+    // Quiet reply to the move that was just played on to_sq by piece
+    #[inline(always)]
+    pub fn countermove(&self, piece: BoardPiece, to_sq: usize) -> Option<ForwardMove> {
+        if is_none(piece) {
+            return None;
+        }
+
+        let packed_move = self.countermoves[piece.to_nnue_type()][to_sq];
+        (packed_move != 0).then(|| ForwardMove::unpack(packed_move))
+    }
+
+    pub fn store_countermove(&mut self, piece: BoardPiece, to_sq: usize, forward_move: ForwardMove) {
+        if is_some(piece) {
+            self.countermoves[piece.to_nnue_type()][to_sq] = forward_move.pack();
+        }
+    }
+
+    // Reward the quiet move that caused the cutoff, penalize the quiets searched before it
+    pub fn update_quiets(&mut self, side: Side, best_move: ForwardMove, tried: &[ForwardMove], depth: i32) {
+        let bonus = history_bonus(depth);
+        let table = &mut self.butterfly[side as usize];
+
+        apply_gravity(&mut table[best_move.start_sq()][best_move.end_sq()], bonus);
+        for forward_move in tried.iter().filter(|mv| **mv != best_move) {
+            apply_gravity(&mut table[forward_move.start_sq()][forward_move.end_sq()], -bonus);
+        }
+    }
+
+    // Same for captures - The board must be the position the captures were generated in
+    pub fn update_captures(&mut self, chess_board: &ChessBoard, best_move: Option<ForwardMove>,
+        tried: &[ForwardMove], depth: i32) {
+        let bonus = history_bonus(depth);
+
+        for forward_move in tried.iter() {
+            if let Some((piece, to, victim)) = capture_index(chess_board, *forward_move) {
+                let delta = if Some(*forward_move) == best_move { bonus } else { -bonus };
+                apply_gravity(&mut self.capture_history[piece][to][victim], delta);
+            }
+        }
+    }
+}
+
+#[inline(always)]
+fn history_bonus(depth: i32) -> i32 {
+    (32 * depth * depth).min(MAX_HISTORY_BONUS)
+}
+
+// Moves the entry towards +/- MAX_HISTORY, slower the closer it already is
+#[inline(always)]
+fn apply_gravity(entry: &mut i16, bonus: i32) {
+    let value = *entry as i32;
+    *entry = (value + bonus - value * bonus.abs() / MAX_HISTORY) as i16;
+}
+
+#[inline(always)]
+fn capture_index(chess_board: &ChessBoard, forward_move: ForwardMove) -> Option<(usize, usize, usize)> {
+    let piece = chess_board.mailbox_piece(forward_move.start_sq());
+    let victim = chess_board.mailbox_piece(forward_move.end_sq());
+
+    (is_some(piece) && is_some(victim))
+        .then(|| (piece.to_nnue_type(), forward_move.end_sq(), victim.to_nnue_type() % 6))
+}
@@ -0,0 +1,84 @@
+use std::ops::Deref;
+
+use arrayvec::ArrayVec;
+
+use crate::move_command::*;
+
+pub const MAX_MOVES: usize = 256;
+
+// Generated moves with their ordering scores in a parallel array - Lower scores are tried first.
+// Moves stay 2 bytes each, and the scores are only touched while moves are being ordered.
+// Reads go through the move slice, reordering goes through the list to keep both arrays in step.
+pub struct MoveList {
+    moves: ArrayVec<ForwardMove, MAX_MOVES>,
+    scores: ArrayVec<i32, MAX_MOVES>,
+}
+
+impl Default for MoveList {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl Deref for MoveList {
+    type Target = [ForwardMove];
+
+    #[inline(always)]
+    fn deref(&self) -> &[ForwardMove] {
+        &self.moves
+    }
+}
+
+impl MoveList {
+    pub fn new() -> Self {
+        Self {
+            moves: ArrayVec::new(),
+            scores: ArrayVec::new(),
+        }
+    }
+
+    #[inline(always)]
+    pub fn push(&mut self, forward_move: ForwardMove, score: i32) {
+        self.moves.push(forward_move);
+        self.scores.push(score);
+    }
+
+    #[inline(always)]
+    pub fn score(&self, index: usize) -> i32 {
+        self.scores[index]
+    }
+
+    #[inline(always)]
+    pub fn set_score(&mut self, index: usize, score: i32) {
+        self.scores[index] = score;
+    }
+
+    #[inline(always)]
+    pub fn swap(&mut self, a: usize, b: usize) {
+        self.moves.swap(a, b);
+        self.scores.swap(a, b);
+    }
+
+    // Keeps the order of the moves that are kept
+    pub fn retain<F>(&mut self, mut keep: F)
+    where
+        F: FnMut(ForwardMove) -> bool,
+    {
+        let mut kept = 0;
+        for index in 0..self.moves.len() {
+            if keep(self.moves[index]) {
+                self.moves[kept] = self.moves[index];
+                self.scores[kept] = self.scores[index];
+                kept += 1;
+            }
+        }
+        self.moves.truncate(kept);
+        self.scores.truncate(kept);
+    }
+
+    // Index of the lowest score in [start, end) - The first one on ties
+    #[inline(always)]
+    pub fn best_index(&self, start: usize, end: usize) -> usize {
+        (start..end).min_by_key(|index| self.scores[*index]).unwrap_or(start)
+    }
+}
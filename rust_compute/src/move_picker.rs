@@ -0,0 +1,221 @@
+use crate::chess_board::*;
+use crate::move_command::*;
+use crate::move_list::*;
+use crate::move_history::*;
+use crate::static_exchange::*;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum PickerStage {
+    TtMove,
+    GenerateMoves,
+    GoodCaptures,
+    Killers,
+    BadCaptures,
+    Quiets,
+    Done,
+}
+
+// Staged move ordering - Moves are handed out one at a time so a cutoff skips the rest:
+// 1. TT move, validated and played before any generation
+// 2. Good captures by MVV-LVA, then capture history
+// 3. Killer moves and the countermove
+// 4. Bad captures (losing material by static exchange evaluation)
+// 5. Quiet moves, selected on demand by butterfly history
+// Lower scores are picked first. Every move handed out is
+// legal - Nothing needs a king safety check after it is made.
+pub struct MovePicker {
+    stage: PickerStage,
+    tt_move: Option<ForwardMove>,
+    // Killers, then the countermove
+    refutations: [Option<ForwardMove>; 3],
+    // Quiescence search outside of check - Captures and queen promotions only,
+    // and losing captures are pruned instead of tried last
+    tactical_only: bool,
+    // Filled at the TT move stage - Shared by TT move validation and generation
+    legal_masks: Option<LegalMasks>,
+
+    // [0, good_end) good captures | [good_end, captures_end) bad captures | [captures_end, len) quiets
+    moves: MoveList,
+    cursor: usize,
+    refutation_index: usize,
+    good_end: usize,
+    captures_end: usize,
+    // Quiets left after the killers and countermove were swapped out
+    quiets_start: usize,
+}
+
+impl MovePicker {
+    pub fn new(tt_move: Option<ForwardMove>, killers: [Option<ForwardMove>; 2],
+        countermove: Option<ForwardMove>) -> Self {
+        Self {
+            stage: PickerStage::TtMove,
+            tt_move,
+            refutations: [killers[0], killers[1], countermove],
+            tactical_only: false,
+            legal_masks: None,
+
+            moves: MoveList::new(),
+            cursor: 0,
+            refutation_index: 0,
+            good_end: 0,
+            captures_end: 0,
+            quiets_start: 0,
+        }
+    }
+
+    // Captures, en passant and queen promotions - The TT move only if it is one of them
+    pub fn tactical(tt_move: Option<ForwardMove>) -> Self {
+        Self {
+            tactical_only: true,
+            ..Self::new(tt_move.filter(|mv| is_tactical(*mv)), [None; 2], None)
+        }
+    }
+
+    pub fn next_move(&mut self, chess_board: &mut ChessBoard, move_history: &MoveHistory) -> Option<ForwardMove> {
+        loop {
+            match self.stage {
+                PickerStage::TtMove => {
+                    self.stage = PickerStage::GenerateMoves;
+
+                    let legal_masks = *self.legal_masks.insert(chess_board.legal_masks());
+                    self.tt_move = self.tt_move.filter(|mv| {
+                        chess_board.is_pseudo_legal(*mv) && chess_board.is_legal(*mv, &legal_masks)
+                            && !(self.tactical_only && is_losing_capture(chess_board, *mv))
+                    });
+
+                    if self.tt_move.is_some() {
+                        return self.tt_move;
+                    }
+                },
+                PickerStage::GenerateMoves => {
+                    let legal_masks = self.legal_masks.unwrap_or_else(|| chess_board.legal_masks());
+                    chess_board.generate_legal_moves(&mut self.moves, &legal_masks);
+                    if self.tactical_only {
+                        self.moves.retain(is_tactical);
+                    }
+
+                    self.partition_moves(chess_board, move_history);
+                    self.stage = PickerStage::GoodCaptures;
+                },
+                PickerStage::GoodCaptures => {
+                    match self.select_best(self.good_end) {
+                        Some(mv) => return Some(mv),
+                        None if self.tactical_only => {
+                            self.stage = PickerStage::Done;
+                        },
+                        None => {
+                            self.cursor = self.captures_end;
+                            self.stage = PickerStage::Killers;
+                        },
+                    }
+                },
+                PickerStage::Killers => {
+                    // Killers and countermoves are quiet moves - Swap them to the front of the quiets.
+                    // Refutations already played are no longer in [cursor, len), so none is tried twice.
+                    while self.refutation_index < self.refutations.len() {
+                        let refutation = self.refutations[self.refutation_index];
+                        self.refutation_index += 1;
+
+                        let Some(refutation) = refutation.filter(|mv| Some(*mv) != self.tt_move) else {
+                            continue;
+                        };
+                        if let Some(index) = self.moves[self.cursor..].iter().position(|mv| *mv == refutation) {
+                            self.moves.swap(self.cursor, self.cursor + index);
+                            self.cursor += 1;
+                            return Some(self.moves[self.cursor - 1]);
+                        }
+                    }
+                    self.quiets_start = self.cursor;
+                    self.cursor = self.good_end;
+                    self.stage = PickerStage::BadCaptures;
+                },
+                PickerStage::BadCaptures => {
+                    match self.select_best(self.captures_end) {
+                        Some(mv) => return Some(mv),
+                        None => {
+                            self.cursor = self.quiets_start;
+                            self.stage = PickerStage::Quiets;
+                        },
+                    }
+                },
+                PickerStage::Quiets => {
+                    match self.select_best(self.moves.len()) {
+                        Some(mv) => return Some(mv),
+                        None => self.stage = PickerStage::Done,
+                    }
+                },
+                PickerStage::Done => return None,
+            }
+        }
+    }
+
+    // Selection sort step over [cursor, end) - Only the moves actually tried are sorted
+    fn select_best(&mut self, end: usize) -> Option<ForwardMove> {
+        while self.cursor < end {
+            let best_index = self.moves.best_index(self.cursor, end);
+            self.moves.swap(self.cursor, best_index);
+            let mv = self.moves[self.cursor];
+            self.cursor += 1;
+
+            if Some(mv) != self.tt_move {
+                return Some(mv);
+            }
+        }
+        None
+    }
+
+    // Score captures by MVV-LVA and capture history, quiets by butterfly history,
+    // and split the list into good captures, bad captures and quiets
+    fn partition_moves(&mut self, chess_board: &ChessBoard, move_history: &MoveHistory) {
+        let side = chess_board.active_player();
+
+        let mut captures_end = 0;
+        for index in 0..self.moves.len() {
+            let mv = self.moves[index];
+            if is_tactical(mv) {
+                self.moves.swap(captures_end, index);
+                captures_end += 1;
+            } else if matches!(mv.move_type(), MoveFlag::PROMOTIONROOK | MoveFlag::PROMOTIONBISHOP | MoveFlag::PROMOTIONKNIGHT) {
+                // Under-promotions stay behind every quiet move
+                self.moves.set_score(index, self.moves.score(index) + 2 * MAX_HISTORY);
+            } else {
+                self.moves.set_score(index, self.moves.score(index) - move_history.quiet_score(side, mv));
+            }
+        }
+
+        let mut good_end = 0;
+        for index in 0..captures_end {
+            let mv = self.moves[index];
+            let attacker = piece_value(chess_board.mailbox_piece(mv.start_sq()));
+            let victim = match mv.move_type() {
+                MoveFlag::ENPASSANT => 1,
+                _ => Some(chess_board.mailbox_piece(mv.end_sq())).filter(|piece| is_some(*piece)).map_or(0, piece_value),
+            };
+
+            // Most valuable victim first, then least valuable attacker - Queen promotions on top
+            let promotion_bonus = if mv.move_type() == MoveFlag::PROMOTIONQUEEN { 64 } else { 0 };
+            self.moves.set_score(index, (attacker - victim * 8 - promotion_bonus) * CAPTURE_ORDER_SCALE
+                - move_history.capture_score(chess_board, mv));
+
+            if !is_losing_capture(chess_board, mv) {
+                self.moves.swap(good_end, index);
+                good_end += 1;
+            }
+        }
+
+        self.good_end = good_end;
+        self.captures_end = captures_end;
+    }
+}
+
+// Moves searched by the quiescence search - Killers are never tactical
+pub fn is_tactical(forward_move: ForwardMove) -> bool {
+    matches!(forward_move.move_type(), MoveFlag::CAPTURE | MoveFlag::ENPASSANT | MoveFlag::PROMOTIONQUEEN)
+}
+
+// Captures that lose material after the recaptures - Promotions are never losing
+#[inline(always)]
+fn is_losing_capture(chess_board: &ChessBoard, forward_move: ForwardMove) -> bool {
+    matches!(forward_move.move_type(), MoveFlag::CAPTURE | MoveFlag::ENPASSANT)
+        && !see_ge(chess_board, forward_move, 0)
+}
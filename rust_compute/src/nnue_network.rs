@@ -1,5 +1,6 @@
 use std::fs::File;
 use std::io::{Read, BufReader};
+use std::sync::Mutex;
 
 /// Matches the exact memory layout of your exported Python binary.
 #[repr(C, align(64))]
@@ -69,6 +70,82 @@ impl NnueNetwork {
 
         Ok(network_box)
     }
+
+    // Search threads hold the network for the lifetime of the process, so every
+    // file is leaked at most once and shared between ChessGame instances
+    pub fn load_shared(path: &str) -> std::io::Result<&'static Self> {
+        static LOADED_NETWORKS: Mutex<Vec<(String, &'static NnueNetwork)>> = Mutex::new(Vec::new());
+
+        let mut loaded_networks = LOADED_NETWORKS.lock().unwrap();
+        if let Some((_, network)) = loaded_networks.iter().find(|(loaded_path, _)| loaded_path == path) {
+            return Ok(network);
+        }
+
+        let network: &'static Self = Box::leak(Self::load_from_file(path)?);
+        loaded_networks.push((path.to_string(), network));
+        Ok(network)
+    }
+
+    // Copy of a shared network for one NUMA node - Made by a search thread pinned to that
+    // node, so first touch places the weights in the node's local memory. Leaked like
+    // load_shared, at most once per network and node.
+    pub fn replica_for_node(&'static self, numa_node: usize) -> &'static Self {
+        static NODE_REPLICAS: Mutex<Vec<(usize, usize, &'static NnueNetwork)>> = Mutex::new(Vec::new());
+
+        let source = self as *const Self as usize;
+        let mut node_replicas = NODE_REPLICAS.lock().unwrap();
+        if let Some((_, _, replica)) = node_replicas.iter()
+            .find(|(replica_source, node, _)| *replica_source == source && *node == numa_node) {
+            return replica;
+        }
+
+        // Allocated untouched - The copy below is the first write to every page
+        let replica: &'static Self = unsafe {
+            let layout = std::alloc::Layout::new::<Self>();
+            let ptr = std::alloc::alloc(layout) as *mut Self;
+            if ptr.is_null() {
+                std::alloc::handle_alloc_error(layout);
+            }
+            std::ptr::copy_nonoverlapping(self as *const Self, ptr, 1);
+            &*ptr
+        };
+        node_replicas.push((source, numa_node, replica));
+        replica
+    }
+}
+
+// Deterministic pseudo-random weights for the unit tests - The trained weights file is not
+// part of the repository. Leaked once and shared like load_shared.
+#[cfg(test)]
+pub fn test_network() -> &'static NnueNetwork {
+    static TEST_NETWORK: std::sync::OnceLock<&'static NnueNetwork> = std::sync::OnceLock::new();
+
+    TEST_NETWORK.get_or_init(|| {
+        let mut network_box = unsafe {
+            let layout = std::alloc::Layout::new::<NnueNetwork>();
+            let ptr = std::alloc::alloc_zeroed(layout) as *mut NnueNetwork;
+            if ptr.is_null() {
+                std::alloc::handle_alloc_error(layout);
+            }
+            Box::from_raw(ptr)
+        };
+
+        let mut seed: u64 = 0x9E37_79B9_7F4A_7C15;
+        let mut next = |range: i64| {
+            seed ^= seed << 13;
+            seed ^= seed >> 7;
+            seed ^= seed << 17;
+            (seed % (2 * range as u64 + 1)) as i64 - range
+        };
+
+        network_box.l1_weights.iter_mut().flatten().for_each(|weight| *weight = next(32) as i16);
+        network_box.l1_biases.iter_mut().for_each(|bias| *bias = next(64) as i32);
+        network_box.l2_weights.iter_mut().flatten().for_each(|weight| *weight = next(16) as i8);
+        network_box.l3_weights.iter_mut().flatten().for_each(|weight| *weight = next(16) as i8);
+        network_box.output_weights.iter_mut().flatten().for_each(|weight| *weight = next(16) as i8);
+
+        Box::leak(network_box)
+    })
 }
 
 /// The runtime container holding the current calculation buffers.
@@ -8,12 +8,12 @@ pub fn parse_uci(forward_move: ForwardMove) -> String {
         (4, 'e'), (5, 'f'), (6, 'g'), (7, 'h'),
     ]);
 
-    let start_file = *map.get(&(forward_move.start_sq % 8)).unwrap_or(&'a'); 
-    let start_rank = (forward_move.start_sq / 8) + 1;
-    let end_file = *map.get(&(forward_move.end_sq % 8)).unwrap_or(&'a'); 
-    let end_rank = (forward_move.end_sq / 8) + 1;
+    let start_file = *map.get(&(forward_move.start_sq() % 8)).unwrap_or(&'a'); 
+    let start_rank = (forward_move.start_sq() / 8) + 1;
+    let end_file = *map.get(&(forward_move.end_sq() % 8)).unwrap_or(&'a'); 
+    let end_rank = (forward_move.end_sq() / 8) + 1;
 
-    let promo = match forward_move.move_type {
+    let promo = match forward_move.move_type() {
         MoveFlag::PROMOTIONQUEEN => "q",
         MoveFlag::PROMOTIONROOK => "r",
         MoveFlag::PROMOTIONBISHOP => "b",
@@ -87,10 +87,5 @@ pub fn parse_forward_move_with_board(uci: &str, board: &ChessBoard) -> ForwardMo
         }
     }
 
-    ForwardMove {
-        start_sq,
-        end_sq,
-        move_type,
-        pv_score: 0,
-    }
+    ForwardMove::new(start_sq, end_sq, move_type)
 }
@@ -1,5 +1,5 @@
 use crate::move_command::*;
-use arrayvec::ArrayVec;
+use crate::move_list::*;
 use crate::chess_board::*;
 
 const NOT_A_FILE: u64 = 0xFEFE_FEFE_FEFE_FEFE;
@@ -33,7 +33,7 @@ pub fn black_pawn_attacks(black_pawns: u64) -> u64 {
 }
 
 pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index: usize,
-    moves: &mut ArrayVec::<ForwardMove, 256>)  {
+    moves: &mut MoveList)  {
 
     let white_pawns = chess_board.pawns[player_index];
     let black_pieces = chess_board.all_pieces[opp_index];
@@ -44,11 +44,7 @@ pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     let mut one_move = ((white_pawns & !RANK_7) << 8) & !occupancy;
     while one_move != 0 {
         let target = one_move.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: target - 8, end_sq: target, move_type: MoveFlag::MOVE, pv_score: 1000 
-            }
-        );
+        moves.push(ForwardMove::new(target - 8, target, MoveFlag::MOVE), 1000);
         one_move &= one_move - 1;
     }
 
@@ -57,19 +53,11 @@ pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     while promotion_move != 0 {
         let target = promotion_move.trailing_zeros() as usize;
         
-        moves.push(ForwardMove { 
-            start_sq: target - 8, end_sq: target, move_type: MoveFlag::PROMOTIONQUEEN, pv_score: 10 
-        });
-
-        moves.push(ForwardMove { 
-            start_sq: target - 8, end_sq: target, move_type: MoveFlag::PROMOTIONROOK, pv_score: 2000 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target - 8, end_sq: target, move_type: MoveFlag::PROMOTIONBISHOP, pv_score: 2100 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target - 8, end_sq: target, move_type: MoveFlag::PROMOTIONKNIGHT, pv_score: 2200 
-        });
+        moves.push(ForwardMove::new(target - 8, target, MoveFlag::PROMOTIONQUEEN), 10);
+
+        moves.push(ForwardMove::new(target - 8, target, MoveFlag::PROMOTIONROOK), 2000);
+        moves.push(ForwardMove::new(target - 8, target, MoveFlag::PROMOTIONBISHOP), 2100);
+        moves.push(ForwardMove::new(target - 8, target, MoveFlag::PROMOTIONKNIGHT), 2200);
 
         promotion_move &= promotion_move - 1;
     }
@@ -79,11 +67,7 @@ pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     let mut double_move = (single_move << 8) & !occupancy;
     while double_move != 0 {
         let target = double_move.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: target - 8 * 2, end_sq: target, move_type: MoveFlag::PAWNOPENMOVE, pv_score: 600
-            }
-        );
+        moves.push(ForwardMove::new(target - 8 * 2, target, MoveFlag::PAWNOPENMOVE), 600);
         double_move &= double_move - 1;
     }
 
@@ -98,11 +82,7 @@ pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
         let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
         let pv_score = 100 - (captured_piece_val * 10) + 1; 
 
-        moves.push(
-            ForwardMove { 
-                start_sq: target - 7, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score 
-            }
-        );
+        moves.push(ForwardMove::new(target - 7, target, MoveFlag::CAPTURE), pv_score);
         left_capture_no_promotion &= left_capture_no_promotion - 1;
     }
 
@@ -113,11 +93,7 @@ pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
         let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
         let pv_score = 100 - (captured_piece_val * 10) + 1; 
 
-        moves.push(
-            ForwardMove { 
-                start_sq: target - 9, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score 
-            }
-        );
+        moves.push(ForwardMove::new(target - 9, target, MoveFlag::CAPTURE), pv_score);
         right_capture_no_promotion &= right_capture_no_promotion - 1;
     }
 
@@ -125,40 +101,24 @@ pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     let mut left_capture_promotion = left_captures & RANK_8;
     while left_capture_promotion != 0 {
         let target = left_capture_promotion.trailing_zeros() as usize;
-        moves.push(ForwardMove { 
-            start_sq: target - 7, end_sq: target, move_type: MoveFlag::PROMOTIONQUEEN, pv_score: 10 
-        });
+        moves.push(ForwardMove::new(target - 7, target, MoveFlag::PROMOTIONQUEEN), 10);
 
         // Under-promotions: Pushed past 1000 so they are evaluated after quiet moves
-        moves.push(ForwardMove { 
-            start_sq: target - 7, end_sq: target, move_type: MoveFlag::PROMOTIONROOK, pv_score: 2000 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target - 7, end_sq: target, move_type: MoveFlag::PROMOTIONBISHOP, pv_score: 2100 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target - 7, end_sq: target, move_type: MoveFlag::PROMOTIONKNIGHT, pv_score: 2200 
-        });
+        moves.push(ForwardMove::new(target - 7, target, MoveFlag::PROMOTIONROOK), 2000);
+        moves.push(ForwardMove::new(target - 7, target, MoveFlag::PROMOTIONBISHOP), 2100);
+        moves.push(ForwardMove::new(target - 7, target, MoveFlag::PROMOTIONKNIGHT), 2200);
         left_capture_promotion &= left_capture_promotion - 1;
     }
 
     let mut right_capture_promotion = right_captures & RANK_8;
     while right_capture_promotion != 0 {
         let target = right_capture_promotion.trailing_zeros() as usize;
-        moves.push(ForwardMove { 
-            start_sq: target - 9, end_sq: target, move_type: MoveFlag::PROMOTIONQUEEN, pv_score: 10 
-        });
+        moves.push(ForwardMove::new(target - 9, target, MoveFlag::PROMOTIONQUEEN), 10);
 
         // Under-promotions: Pushed past 1000 so they are evaluated after quiet moves
-        moves.push(ForwardMove { 
-            start_sq: target - 9, end_sq: target, move_type: MoveFlag::PROMOTIONROOK, pv_score: 2000 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target - 9, end_sq: target, move_type: MoveFlag::PROMOTIONBISHOP, pv_score: 2100 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target - 9, end_sq: target, move_type: MoveFlag::PROMOTIONKNIGHT, pv_score: 2200 
-        });
+        moves.push(ForwardMove::new(target - 9, target, MoveFlag::PROMOTIONROOK), 2000);
+        moves.push(ForwardMove::new(target - 9, target, MoveFlag::PROMOTIONBISHOP), 2100);
+        moves.push(ForwardMove::new(target - 9, target, MoveFlag::PROMOTIONKNIGHT), 2200);
         right_capture_promotion &= right_capture_promotion - 1;
     }
 
@@ -166,28 +126,20 @@ pub fn white_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     let mut left_attackers = (en_passant_board >> 9) & NOT_H_FILE & white_pawns;
     while left_attackers != 0 {
         let from = left_attackers.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: from, end_sq: from + 9, move_type: MoveFlag::ENPASSANT, pv_score: 150 
-            }
-        );
+        moves.push(ForwardMove::new(from, from + 9, MoveFlag::ENPASSANT), 150);
         left_attackers &= left_attackers - 1;
     }
 
     let mut right_attackers = (en_passant_board >> 7) & NOT_A_FILE & white_pawns;
     while right_attackers != 0 {
         let from = right_attackers.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: from, end_sq: from + 7, move_type: MoveFlag::ENPASSANT, pv_score: 150 
-            }
-        );
+        moves.push(ForwardMove::new(from, from + 7, MoveFlag::ENPASSANT), 150);
         right_attackers &= right_attackers - 1;
     }
 }
 
 pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index: usize,
-    moves: &mut ArrayVec::<ForwardMove, 256>)  {
+    moves: &mut MoveList)  {
 
     let black_pawns = chess_board.pawns[player_index];
     let white_pieces = chess_board.all_pieces[opp_index];
@@ -198,11 +150,7 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     let mut one_move = ((black_pawns & !RANK_2) >> 8) & !occupancy;
     while one_move != 0 {
         let target = one_move.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: target + 8, end_sq: target, move_type: MoveFlag::MOVE, pv_score: 1000
-            }
-        );
+        moves.push(ForwardMove::new(target + 8, target, MoveFlag::MOVE), 1000);
         one_move &= one_move - 1;
     }
 
@@ -211,20 +159,12 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     while promotion_move != 0 {
         let target = promotion_move.trailing_zeros() as usize;
         // 1. Queen Promotion: Highest priority (most negative)
-        moves.push(ForwardMove { 
-            start_sq: target + 8, end_sq: target, move_type: MoveFlag::PROMOTIONQUEEN, pv_score: 10 
-        });
+        moves.push(ForwardMove::new(target + 8, target, MoveFlag::PROMOTIONQUEEN), 10);
 
         // 2. Under-promotions: Pushed past 1000 so they are evaluated after quiet moves
-        moves.push(ForwardMove { 
-            start_sq: target + 8, end_sq: target, move_type: MoveFlag::PROMOTIONROOK, pv_score: 2000 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target + 8, end_sq: target, move_type: MoveFlag::PROMOTIONBISHOP, pv_score: 2100 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target + 8, end_sq: target, move_type: MoveFlag::PROMOTIONKNIGHT, pv_score: 2200 
-        });
+        moves.push(ForwardMove::new(target + 8, target, MoveFlag::PROMOTIONROOK), 2000);
+        moves.push(ForwardMove::new(target + 8, target, MoveFlag::PROMOTIONBISHOP), 2100);
+        moves.push(ForwardMove::new(target + 8, target, MoveFlag::PROMOTIONKNIGHT), 2200);
         promotion_move &= promotion_move - 1;
     }
 
@@ -233,11 +173,7 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     let mut double_move = (single_move >> 8) & !occupancy;
     while double_move != 0 {
         let target = double_move.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: target + 8 * 2, end_sq: target, move_type: MoveFlag::PAWNOPENMOVE, pv_score: 600 
-            }
-        );
+        moves.push(ForwardMove::new(target + 8 * 2, target, MoveFlag::PAWNOPENMOVE), 600);
         double_move &= double_move - 1;
     }
 
@@ -252,11 +188,7 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
         let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
         let pv_score = 100 - (captured_piece_val * 10) + 1; 
 
-        moves.push(
-            ForwardMove { 
-                start_sq: target + 9, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score 
-            }
-        );
+        moves.push(ForwardMove::new(target + 9, target, MoveFlag::CAPTURE), pv_score);
         left_capture_no_promotion &= left_capture_no_promotion - 1;
     }
 
@@ -267,11 +199,7 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
         let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
         let pv_score = 100 - (captured_piece_val * 10) + 1; 
 
-        moves.push(
-            ForwardMove { 
-                start_sq: target + 7, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score 
-            }
-        );
+        moves.push(ForwardMove::new(target + 7, target, MoveFlag::CAPTURE), pv_score);
         right_capture_no_promotion &= right_capture_no_promotion - 1;
     }
 
@@ -280,20 +208,12 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     while left_capture_promotion != 0 {
         let target = left_capture_promotion.trailing_zeros() as usize;
         // 1. Queen Promotion: Highest priority (most negative)
-        moves.push(ForwardMove { 
-            start_sq: target + 9, end_sq: target, move_type: MoveFlag::PROMOTIONQUEEN, pv_score: 10 
-        });
+        moves.push(ForwardMove::new(target + 9, target, MoveFlag::PROMOTIONQUEEN), 10);
 
         // 2. Under-promotions: Pushed past 1000 so they are evaluated after quiet moves
-        moves.push(ForwardMove { 
-            start_sq: target + 9, end_sq: target, move_type: MoveFlag::PROMOTIONROOK, pv_score: 2000 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target + 9, end_sq: target, move_type: MoveFlag::PROMOTIONBISHOP, pv_score: 2100 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target + 9, end_sq: target, move_type: MoveFlag::PROMOTIONKNIGHT, pv_score: 2200 
-        });
+        moves.push(ForwardMove::new(target + 9, target, MoveFlag::PROMOTIONROOK), 2000);
+        moves.push(ForwardMove::new(target + 9, target, MoveFlag::PROMOTIONBISHOP), 2100);
+        moves.push(ForwardMove::new(target + 9, target, MoveFlag::PROMOTIONKNIGHT), 2200);
         left_capture_promotion &= left_capture_promotion - 1;
     }
 
@@ -301,20 +221,12 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     while right_capture_promotion != 0 {
         let target = right_capture_promotion.trailing_zeros() as usize;
         // 1. Queen Promotion: Highest priority (most negative)
-        moves.push(ForwardMove { 
-            start_sq: target + 7, end_sq: target, move_type: MoveFlag::PROMOTIONQUEEN, pv_score: 10 
-        });
+        moves.push(ForwardMove::new(target + 7, target, MoveFlag::PROMOTIONQUEEN), 10);
 
         // 2. Under-promotions: Pushed past 1000 so they are evaluated after quiet moves
-        moves.push(ForwardMove { 
-            start_sq: target + 7, end_sq: target, move_type: MoveFlag::PROMOTIONROOK, pv_score: 2000 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target + 7, end_sq: target, move_type: MoveFlag::PROMOTIONBISHOP, pv_score: 2100 
-        });
-        moves.push(ForwardMove { 
-            start_sq: target + 7, end_sq: target, move_type: MoveFlag::PROMOTIONKNIGHT, pv_score: 2200 
-        });
+        moves.push(ForwardMove::new(target + 7, target, MoveFlag::PROMOTIONROOK), 2000);
+        moves.push(ForwardMove::new(target + 7, target, MoveFlag::PROMOTIONBISHOP), 2100);
+        moves.push(ForwardMove::new(target + 7, target, MoveFlag::PROMOTIONKNIGHT), 2200);
         right_capture_promotion &= right_capture_promotion - 1;
     }
 
@@ -322,22 +234,14 @@ pub fn black_pawn_moves(chess_board: &mut ChessBoard, player_index: usize, opp_i
     let mut left_attackers = (en_passant_board << 7) & NOT_H_FILE & black_pawns;
     while left_attackers != 0 {
         let target = left_attackers.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: target, end_sq: target - 7, move_type: MoveFlag::ENPASSANT, pv_score: 150  
-            }
-        );
+        moves.push(ForwardMove::new(target, target - 7, MoveFlag::ENPASSANT), 150);
         left_attackers &= left_attackers - 1;
     }
 
     let mut right_attackers = (en_passant_board << 9) & NOT_A_FILE & black_pawns;
     while right_attackers != 0 {
         let target = right_attackers.trailing_zeros() as usize;
-        moves.push(
-            ForwardMove { 
-                start_sq: target, end_sq: target - 9, move_type: MoveFlag::ENPASSANT, pv_score: 150   
-            }
-        );
+        moves.push(ForwardMove::new(target, target - 9, MoveFlag::ENPASSANT), 150);
         right_attackers &= right_attackers - 1;
     }
 }
\ No newline at end of file
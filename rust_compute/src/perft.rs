@@ -0,0 +1,255 @@
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use std::thread;
+use std::time::Instant;
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+
+use crate::chess_board::*;
+use crate::move_command::*;
+use crate::move_list::*;
+use crate::parser::*;
+
+// Default size of the perft hash table (MB) - 0 disables hashing
+pub const PERFT_HASH_MB: usize = 16;
+
+// Subtrees below this depth are cheaper to count than to look up
+const PERFT_HASH_MIN_DEPTH: i32 = 2;
+
+// Node counts are packed above the 8 depth bits
+const PERFT_DEPTH_MASK: u64 = 0xFF;
+
+// Lockless entry - The key is stored XORed with the data so a torn write fails the check
+struct PerftEntry {
+    checksum: AtomicU64,
+    data: AtomicU64,
+}
+
+// Always-replace table of (position, depth) -> leaf count, shared by all perft threads
+pub struct PerftHashTable {
+    entries: Vec<PerftEntry>,
+    mask: usize,
+}
+
+impl PerftHashTable {
+    pub fn new(mb: usize) -> Self {
+        let count = mb * 1024 * 1024 / std::mem::size_of::<PerftEntry>();
+
+        // Round down to power of two for fast bitwise indexing
+        let final_count = std::cmp::max(1, count.next_power_of_two() >> 1);
+
+        Self {
+            entries: (0..final_count)
+                .map(|_| PerftEntry { checksum: AtomicU64::new(0), data: AtomicU64::new(0) })
+                .collect(),
+            mask: final_count - 1,
+        }
+    }
+
+    #[inline(always)]
+    fn probe(&self, key: u64, depth: i32) -> Option<u64> {
+        let entry = &self.entries[(key as usize) & self.mask];
+        let data = entry.data.load(Ordering::Relaxed);
+        let checksum = entry.checksum.load(Ordering::Relaxed);
+
+        (data != 0 && checksum ^ data == key && data & PERFT_DEPTH_MASK == depth as u64)
+            .then_some(data >> 8)
+    }
+
+    #[inline(always)]
+    fn store(&self, key: u64, depth: i32, nodes: u64) {
+        let entry = &self.entries[(key as usize) & self.mask];
+        let data = (nodes << 8) | depth as u64;
+
+        entry.checksum.store(key ^ data, Ordering::Relaxed);
+        entry.data.store(data, Ordering::Relaxed);
+    }
+}
+
+// Leaf count of a perft run - divide holds the leaf count below each root move
+#[cfg_attr(feature = "python", pyclass(get_all))]
+#[derive(Debug, Clone)]
+pub struct PerftReport {
+    pub depth: i32,
+    pub nodes: u64,
+    pub divide: Vec<(String, u64)>,
+    pub elapsed_ms: u64,
+    pub nps: u64,
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl PerftReport {
+    fn __repr__(&self) -> String {
+        format!("PerftReport(depth={}, nodes={}, elapsed_ms={}, nps={})",
+            self.depth, self.nodes, self.elapsed_ms, self.nps)
+    }
+}
+
+// Move generation and make / unmake throughput - No NNUE updates, no search.
+// Root moves are handed out to the threads one at a time, so uneven subtrees balance out.
+pub fn perft(board: &ChessBoard, depth: i32, threads: usize, hash_mb: usize) -> PerftReport {
+    let start_time = Instant::now();
+
+    let mut root_board = board.clone();
+    let root_moves = if depth > 0 { legal_moves(&mut root_board) } else { Vec::new() };
+
+    let hash_table = (hash_mb > 0 && depth > PERFT_HASH_MIN_DEPTH).then(|| PerftHashTable::new(hash_mb));
+    let subtree_nodes: Vec<AtomicU64> = root_moves.iter().map(|_| AtomicU64::new(0)).collect();
+    let next_root_move = AtomicUsize::new(0);
+
+    thread::scope(|s| {
+        for _ in 0..threads.clamp(1, root_moves.len().max(1)) {
+            let mut thread_board = root_board.clone();
+            let (root_moves, subtree_nodes) = (&root_moves, &subtree_nodes);
+            let (hash_table, next_root_move) = (hash_table.as_ref(), &next_root_move);
+
+            s.spawn(move || {
+                loop {
+                    let index = next_root_move.fetch_add(1, Ordering::Relaxed);
+                    let Some(root_move) = root_moves.get(index) else {
+                        break;
+                    };
+
+                    let undo_move = make_move(&mut thread_board, *root_move);
+                    let nodes = perft_nodes(&mut thread_board, depth - 1, hash_table);
+                    thread_board.unexecute_move(undo_move);
+
+                    subtree_nodes[index].store(nodes, Ordering::Relaxed);
+                }
+            });
+        }
+    });
+
+    let divide: Vec<(String, u64)> = root_moves.iter()
+        .zip(&subtree_nodes)
+        .map(|(root_move, nodes)| (parse_uci(*root_move), nodes.load(Ordering::Relaxed)))
+        .collect();
+
+    let nodes = if depth > 0 { divide.iter().map(|(_, nodes)| nodes).sum() } else { 1 };
+    let elapsed = start_time.elapsed();
+
+    PerftReport {
+        depth,
+        nodes,
+        divide,
+        elapsed_ms: elapsed.as_millis() as u64,
+        nps: (nodes as f64 / elapsed.as_secs_f64().max(1e-6)) as u64,
+    }
+}
+
+fn perft_nodes(board: &mut ChessBoard, depth: i32, hash_table: Option<&PerftHashTable>) -> u64 {
+    if depth == 0 {
+        return 1;
+    }
+
+    let hash_table = hash_table.filter(|_| depth >= PERFT_HASH_MIN_DEPTH);
+    if let Some(nodes) = hash_table.and_then(|table| table.probe(board.zobrist_hash(), depth)) {
+        return nodes;
+    }
+
+    let legal_masks = board.legal_masks();
+    let mut gen_moves = MoveList::new();
+    board.generate_legal_moves(&mut gen_moves, &legal_masks);
+
+    // Bulk counting - Legal moves at depth 1 are the leaves
+    if depth == 1 {
+        return gen_moves.len() as u64;
+    }
+
+    let mut nodes = 0;
+    for forward_move in gen_moves.iter() {
+        let undo_move = make_move(board, *forward_move);
+        nodes += perft_nodes(board, depth - 1, hash_table);
+        board.unexecute_move(undo_move);
+    }
+
+    if let Some(table) = hash_table {
+        table.store(board.zobrist_hash(), depth, nodes);
+    }
+    nodes
+}
+
+fn legal_moves(board: &mut ChessBoard) -> Vec<ForwardMove> {
+    let legal_masks = board.legal_masks();
+    let mut gen_moves = MoveList::new();
+    board.generate_legal_moves(&mut gen_moves, &legal_masks);
+
+    gen_moves.to_vec()
+}
+
+// Board only - The NNUE accumulators are left untouched
+#[inline(always)]
+fn make_move(board: &mut ChessBoard, forward_move: ForwardMove) -> UndoMove {
+    let prev_castle_rights = board.castle_rights();
+    let prev_en_passant = board.en_passant();
+    let prev_halfmove_clock = board.halfmove_clock();
+    let captured_piece = board.execute_move(forward_move);
+
+    UndoMove {
+        start_sq: forward_move.start_sq(),
+        end_sq: forward_move.end_sq(),
+        move_type: forward_move.move_type(),
+        captured_piece,
+        prev_castle_rights,
+        prev_en_passant,
+        prev_halfmove_clock,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::nnue_network::test_network;
+
+    // Standard perft suite - (FEN, depth, leaf count)
+    const PERFT_SUITE: [(&str, i32, u64); 6] = [
+        (START_FEN, 4, 197_281),
+        ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 3, 97_862),
+        ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 4, 43_238),
+        ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 4, 422_333),
+        ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 3, 62_379),
+        ("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10", 3, 89_890),
+    ];
+
+    fn check_suite(threads: usize, hash_mb: usize) {
+        for (fen, depth, expected_nodes) in PERFT_SUITE {
+            let mut board = ChessBoard::new(test_network());
+            board.load_fen(fen).unwrap();
+
+            let report = perft(&board, depth, threads, hash_mb);
+            assert_eq!(report.nodes, expected_nodes, "perft {} of {} (threads {}, hash {} MB)",
+                depth, fen, threads, hash_mb);
+            assert_eq!(report.divide.iter().map(|(_, nodes)| nodes).sum::<u64>(), report.nodes);
+        }
+    }
+
+    #[test]
+    fn single_thread_without_hash() {
+        check_suite(1, 0);
+    }
+
+    #[test]
+    fn single_thread_with_hash() {
+        check_suite(1, PERFT_HASH_MB);
+    }
+
+    #[test]
+    fn multi_thread_without_hash() {
+        check_suite(4, 0);
+    }
+
+    #[test]
+    fn multi_thread_with_hash() {
+        check_suite(4, PERFT_HASH_MB);
+    }
+
+    #[test]
+    fn depth_zero_counts_the_root() {
+        let mut board = ChessBoard::new(test_network());
+        board.load_fen(START_FEN).unwrap();
+
+        let report = perft(&board, 0, 1, 0);
+        assert_eq!(report.nodes, 1);
+        assert!(report.divide.is_empty());
+    }
+}
@@ -0,0 +1,110 @@
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+
+// Forward pruning margins (centipawns) and depth limits - Exposed as UCI spin options for tuning
+#[cfg_attr(feature = "python", pyclass(get_all, set_all))]
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct PruningParams {
+    // Reverse futility: return the static eval when eval - margin * depth >= beta
+    pub rfp_margin: i32,
+    pub rfp_max_depth: i32,
+    // Futility: skip quiet moves when eval + base + margin * depth <= alpha
+    pub futility_base: i32,
+    pub futility_margin: i32,
+    pub futility_max_depth: i32,
+    // Razoring: drop into qsearch when eval + base + margin * depth < alpha
+    pub razor_base: i32,
+    pub razor_margin: i32,
+    pub razor_max_depth: i32,
+    // Late move pruning: skip quiet moves after base + depth * depth of them
+    pub lmp_base: i32,
+    pub lmp_max_depth: i32,
+}
+
+impl Default for PruningParams {
+    fn default() -> Self {
+        Self {
+            rfp_margin: 80,
+            rfp_max_depth: 6,
+            futility_base: 100,
+            futility_margin: 120,
+            futility_max_depth: 5,
+            razor_base: 300,
+            razor_margin: 250,
+            razor_max_depth: 3,
+            lmp_base: 3,
+            lmp_max_depth: 6,
+        }
+    }
+}
+
+// UCI name, min, max - Lowercased without underscores, the attribute names match too
+pub const PRUNING_OPTIONS: [(&str, i32, i32); 10] = [
+    ("RfpMargin", 0, 1000),
+    ("RfpMaxDepth", 0, 32),
+    ("FutilityBase", 0, 1000),
+    ("FutilityMargin", 0, 1000),
+    ("FutilityMaxDepth", 0, 32),
+    ("RazorBase", 0, 2000),
+    ("RazorMargin", 0, 1000),
+    ("RazorMaxDepth", 0, 32),
+    ("LmpBase", 0, 64),
+    ("LmpMaxDepth", 0, 32),
+];
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl PruningParams {
+    #[new]
+    fn py_new() -> Self {
+        Self::default()
+    }
+
+    fn __repr__(&self) -> String {
+        format!("{:?}", self)
+    }
+}
+
+impl PruningParams {
+    pub fn get(&self, name: &str) -> Option<i32> {
+        let mut params = *self;
+        params.field_mut(name).map(|field| *field)
+    }
+
+    // Range checks are left to validate
+    pub fn set(&mut self, name: &str, value: i32) -> Result<(), String> {
+        let field = self.field_mut(name).ok_or_else(|| format!("Unknown option: {}", name))?;
+        *field = value;
+        Ok(())
+    }
+
+    pub fn validate(&self) -> Result<(), String> {
+        for (option_name, min, max) in PRUNING_OPTIONS {
+            let value = self.get(option_name).unwrap_or_default();
+            if !(min..=max).contains(&value) {
+                return Err(format!("{} must be between {} and {}", option_name, min, max));
+            }
+        }
+        Ok(())
+    }
+
+    fn field_mut(&mut self, name: &str) -> Option<&mut i32> {
+        match normalize(name).as_str() {
+            "rfpmargin" => Some(&mut self.rfp_margin),
+            "rfpmaxdepth" => Some(&mut self.rfp_max_depth),
+            "futilitybase" => Some(&mut self.futility_base),
+            "futilitymargin" => Some(&mut self.futility_margin),
+            "futilitymaxdepth" => Some(&mut self.futility_max_depth),
+            "razorbase" => Some(&mut self.razor_base),
+            "razormargin" => Some(&mut self.razor_margin),
+            "razormaxdepth" => Some(&mut self.razor_max_depth),
+            "lmpbase" => Some(&mut self.lmp_base),
+            "lmpmaxdepth" => Some(&mut self.lmp_max_depth),
+            _ => None,
+        }
+    }
+}
+
+fn normalize(name: &str) -> String {
+    name.trim().replace('_', "").to_ascii_lowercase()
+}
@@ -2,10 +2,10 @@ use crate::bishop_mask::*;
 use crate::rook_mask::*;
 use crate::move_command::*;
 use crate::chess_board::*;
-use arrayvec::ArrayVec;
+use crate::move_list::*;
 
 pub fn queen_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index: usize,
-    moves: &mut ArrayVec::<ForwardMove, 256>)  {
+    moves: &mut MoveList)  {
 
     let mut queen_bitboard = chess_board.queens[player_index];
 
@@ -21,9 +21,7 @@ pub fn queen_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index:
 
         while queen_moves != 0 {
             let target = queen_moves.trailing_zeros() as usize;
-            moves.push(ForwardMove { 
-                start_sq: queen, end_sq: target, move_type: MoveFlag::MOVE, pv_score: 1000 
-            });
+            moves.push(ForwardMove::new(queen, target, MoveFlag::MOVE), 1000);
             queen_moves &= queen_moves - 1;
         }
 
@@ -33,9 +31,7 @@ pub fn queen_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index:
             let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
             let pv_score = 100 - (captured_piece_val * 10) + 5; 
 
-            moves.push(ForwardMove { 
-                start_sq: queen, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score 
-            });
+            moves.push(ForwardMove::new(queen, target, MoveFlag::CAPTURE), pv_score);
             queen_captures &= queen_captures - 1;
         }
 
@@ -1,7 +1,7 @@
 use std::sync::LazyLock;
 use crate::move_command::*;
 use crate::chess_board::*;
-use arrayvec::ArrayVec;
+use crate::move_list::*;
 
 // Mask the Irrelevant Bits no in the Diagonal Path
 pub const ROOK_MASKS: [u64; 64] = {
@@ -233,7 +233,7 @@ pub fn compute_rook_magic(sq: usize) -> u64 {
 }
 
 pub fn rook_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index: usize,
-    moves: &mut ArrayVec::<ForwardMove, 256>)  {
+    moves: &mut MoveList)  {
 
     let mut rook_bitboard = chess_board.rooks[player_index];
 
@@ -246,9 +246,7 @@ pub fn rook_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index:
 
         while rook_moves != 0 {
             let target = rook_moves.trailing_zeros() as usize;
-            moves.push(ForwardMove { 
-                start_sq: rook, end_sq: target, move_type: MoveFlag::MOVE, pv_score: 1000 
-            });
+            moves.push(ForwardMove::new(rook, target, MoveFlag::MOVE), 1000);
             rook_moves &= rook_moves - 1;
         }
 
@@ -258,9 +256,7 @@ pub fn rook_moves(chess_board: &mut ChessBoard, player_index: usize, opp_index:
             let captured_piece_val = piece_value(chess_board.mailbox_piece(target));
             let pv_score = 100 - (captured_piece_val * 10) + 3; 
 
-            moves.push(ForwardMove { 
-                start_sq: rook, end_sq: target, move_type: MoveFlag::CAPTURE, pv_score 
-            });
+            moves.push(ForwardMove::new(rook, target, MoveFlag::CAPTURE), pv_score);
             rook_captures &= rook_captures - 1;
         }
 
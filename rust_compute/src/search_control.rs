@@ -0,0 +1,269 @@
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+use std::sync::{Mutex, OnceLock};
+use std::time::{Duration, Instant};
+
+use crate::move_command::*;
+use crate::time_manager::*;
+
+// Search threads report their node counts and check the limits every POLL_INTERVAL nodes
+pub const POLL_INTERVAL: usize = 1024;
+pub const POLL_MASK: usize = POLL_INTERVAL - 1;
+
+// Root move with its score and principal variation (MultiPV)
+#[derive(Debug, Clone)]
+pub struct PvLine {
+    pub best_move: ForwardMove,
+    pub score: i32,
+    pub depth: i32,
+    pub pv: Vec<ForwardMove>,
+}
+
+// Progress of the master thread after each completed iteration - One per MultiPV line
+pub struct SearchInfo {
+    pub depth: i32,
+    // 1-based rank of the line
+    pub multipv: usize,
+    pub score: i32,
+    pub nodes: usize,
+    pub elapsed: Duration,
+    pub pv: Vec<ForwardMove>,
+}
+
+type InfoCallback = Box<dyn Fn(&SearchInfo) + Send + Sync>;
+
+// Keeps a value on cache lines of its own, so writes by other threads to their neighbours
+// never invalidate it. 128 bytes - x86 prefetches cache lines in pairs, Apple M lines are 128.
+#[repr(align(128))]
+#[derive(Default)]
+pub struct CachePadded<T>(pub T);
+
+impl<T> std::ops::Deref for CachePadded<T> {
+    type Target = T;
+
+    fn deref(&self) -> &T {
+        &self.0
+    }
+}
+
+// Written by one search thread only - Plain stores, no shared read-modify-write
+#[derive(Default)]
+pub struct ThreadStats {
+    pub nodes: AtomicUsize,
+}
+
+// Signals shared by every thread of a single search. The stop flag is read at every node,
+// so it sits apart from the per-thread stats, which are written every POLL_INTERVAL nodes.
+pub struct SearchControl {
+    pub stop_search: CachePadded<AtomicBool>,
+
+    // Pondering searches ignore the clock until the predicted move is played
+    pondering: AtomicBool,
+    start_time: Instant,
+
+    // Read by the master every POLL_INTERVAL nodes, by every thread once per iteration
+    clock: Mutex<SearchClock>,
+    // One slot per search thread - Set up once the thread count is known
+    thread_stats: OnceLock<Box<[CachePadded<ThreadStats>]>>,
+
+    info_callback: Option<InfoCallback>,
+}
+
+// Limits in force and the time budget they give the side to move, timed from clock_start.
+// A ponder hit may hand over new limits, which then run from the hit.
+struct SearchClock {
+    limits: SearchLimits,
+    clock_start: Instant,
+    // Set once the side to move is known
+    side: Option<Side>,
+    time_manager: Option<TimeManager>,
+}
+
+impl SearchClock {
+    fn time_manager(&self) -> Option<(&TimeManager, Duration)> {
+        self.time_manager.as_ref().map(|time_manager| (time_manager, self.clock_start.elapsed()))
+    }
+}
+
+impl SearchControl {
+    pub fn new(limits: SearchLimits, pondering: bool) -> Self {
+        let start_time = Instant::now();
+
+        Self {
+            stop_search: CachePadded(AtomicBool::new(false)),
+            pondering: AtomicBool::new(pondering),
+            start_time,
+
+            clock: Mutex::new(SearchClock { limits, clock_start: start_time, side: None, time_manager: None }),
+            thread_stats: OnceLock::new(),
+
+            info_callback: None,
+        }
+    }
+
+    pub fn with_info_callback<F>(mut self, callback: F) -> Self
+    where
+        F: Fn(&SearchInfo) + Send + Sync + 'static,
+    {
+        self.info_callback = Some(Box::new(callback));
+        self
+    }
+
+    pub fn reports_info(&self) -> bool {
+        self.info_callback.is_some()
+    }
+
+    pub fn report_info(&self, info: &SearchInfo) {
+        if let Some(callback) = &self.info_callback {
+            callback(info);
+        }
+    }
+
+    pub fn elapsed(&self) -> Duration {
+        self.start_time.elapsed()
+    }
+
+    // Before the search threads start - Later calls keep the first thread count
+    pub fn start_threads(&self, threads: usize) {
+        let _ = self.thread_stats.set((0..threads.max(1)).map(|_| CachePadded::default()).collect());
+    }
+
+    // Nodes reported so far by the search threads - Summed by the reader, not the writers
+    pub fn nodes_searched(&self) -> usize {
+        self.thread_stats.get().map_or(0, |thread_stats| {
+            thread_stats.iter().map(|stats| stats.nodes.load(Ordering::Relaxed)).sum()
+        })
+    }
+
+    // Resolve the time budget for the side to move - The clock runs from new()
+    pub fn start_clock(&self, side: Side) {
+        let mut clock = self.clock.lock().unwrap();
+        if clock.side.is_none() {
+            clock.time_manager = Some(TimeManager::new(&clock.limits, side));
+            clock.side = Some(side);
+        }
+    }
+
+    pub fn max_depth(&self) -> i32 {
+        self.clock.lock().unwrap().limits.max_depth()
+    }
+
+    pub fn stop(&self) {
+        self.stop_search.store(true, Ordering::Relaxed);
+    }
+
+    pub fn is_stopped(&self) -> bool {
+        self.stop_search.load(Ordering::Relaxed)
+    }
+
+    pub fn is_pondering(&self) -> bool {
+        self.pondering.load(Ordering::Relaxed)
+    }
+
+    // Predicted move was played - The time spent pondering counts towards the move
+    pub fn ponderhit(&self) {
+        self.pondering.store(false, Ordering::Relaxed);
+
+        if self.out_of_time() {
+            self.stop();
+        }
+    }
+
+    // Predicted move was played with these limits - They replace the ponder search's
+    // limits and are timed from now. Also applies if the search has not set its clock yet.
+    pub fn ponderhit_with(&self, limits: SearchLimits) {
+        {
+            let mut clock = self.clock.lock().unwrap();
+            clock.time_manager = clock.side.map(|side| TimeManager::new(&limits, side));
+            clock.limits = limits;
+            clock.clock_start = Instant::now();
+        }
+        self.ponderhit();
+    }
+
+    pub fn out_of_time(&self) -> bool {
+        !self.is_pondering() && self.clock.lock().unwrap().time_manager()
+            .is_some_and(|(time_manager, elapsed)| time_manager.hard_limit_reached(elapsed))
+    }
+
+    // Called by every search thread each POLL_INTERVAL nodes with its own node count.
+    // Only the master checks the hard limits - Helpers just publish and follow the stop flag.
+    pub fn poll(&self, thread_id: usize, nodes: usize) {
+        if let Some(stats) = self.thread_stats.get().and_then(|thread_stats| thread_stats.get(thread_id)) {
+            stats.nodes.store(nodes, Ordering::Relaxed);
+        }
+        if thread_id != 0 {
+            return;
+        }
+
+        let node_limit = self.clock.lock().unwrap().limits.nodes;
+        let node_limit_reached = node_limit.is_some_and(|limit| self.nodes_searched() >= limit);
+        if node_limit_reached || self.out_of_time() {
+            self.stop();
+        }
+    }
+
+    // Soft limits - Checked by the master thread after each completed iteration
+    pub fn should_stop_iterating(&self, depth: i32, best_move_stability: usize) -> bool {
+        if depth >= self.max_depth() {
+            return true;
+        }
+
+        // A pondering search keeps going until ponderhit or stop
+        if self.is_pondering() {
+            return false;
+        }
+
+        self.clock.lock().unwrap().time_manager().is_some_and(|(time_manager, elapsed)| {
+            time_manager.soft_limit_reached(elapsed, best_move_stability)
+        })
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn movetime(ms: u64) -> SearchLimits {
+        SearchLimits { movetime: Some(ms), ..SearchLimits::default() }
+    }
+
+    #[test]
+    fn ponderhit_keeps_the_ponder_limits() {
+        let control = SearchControl::new(SearchLimits::default(), true);
+        control.start_clock(Side::WHITE);
+        std::thread::sleep(Duration::from_millis(50));
+
+        control.ponderhit();
+        assert!(!control.out_of_time());
+        assert!(!control.is_stopped());
+    }
+
+    #[test]
+    fn ponderhit_with_replaces_the_ponder_limits() {
+        let control = SearchControl::new(SearchLimits::default(), true);
+        control.start_clock(Side::WHITE);
+
+        control.ponderhit_with(SearchLimits { depth: Some(3), ..movetime(60_000) });
+        assert!(!control.is_pondering());
+        assert_eq!(control.max_depth(), 3);
+        assert!(!control.out_of_time());
+
+        // Timed from the hit, not from the start of the ponder search
+        let control = SearchControl::new(SearchLimits::default(), true);
+        control.start_clock(Side::WHITE);
+        control.ponderhit_with(movetime(MOVE_OVERHEAD_MS + 20));
+        assert!(!control.out_of_time());
+        std::thread::sleep(Duration::from_millis(40));
+        assert!(control.out_of_time());
+    }
+
+    #[test]
+    fn ponderhit_with_before_the_clock_starts() {
+        let control = SearchControl::new(SearchLimits::default(), true);
+        control.ponderhit_with(movetime(MOVE_OVERHEAD_MS + 1));
+        control.start_clock(Side::BLACK);
+
+        std::thread::sleep(Duration::from_millis(10));
+        assert!(control.out_of_time());
+    }
+}
@@ -0,0 +1,243 @@
+use std::sync::{Arc, Condvar, Mutex};
+use std::thread;
+use std::time::Duration;
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+#[cfg(feature = "python")]
+use pyo3::types::PyCFunction;
+
+use crate::move_command::*;
+use crate::parser::*;
+use crate::search_control::*;
+use crate::time_manager::*;
+
+type CompletionCallback = Box<dyn FnOnce(&SearchOutcome) + Send>;
+
+// Final result of a background search
+#[derive(Debug, Clone)]
+pub struct SearchOutcome {
+    pub best_move: Option<ForwardMove>,
+    // Predicted reply - Second move of the principal variation
+    pub ponder_move: Option<ForwardMove>,
+    // Best first - More than one line in MultiPV mode
+    pub pv_lines: Vec<PvLine>,
+    pub nodes_processed: usize,
+    pub elapsed_ms: u128,
+}
+
+impl SearchOutcome {
+    // Best Move in UCI Format - Empty if no legal move was found
+    pub fn best_move_uci(&self) -> String {
+        self.best_move.map_or(String::new(), parse_uci)
+    }
+
+    pub fn ponder_move_uci(&self) -> Option<String> {
+        self.ponder_move.map(parse_uci)
+    }
+}
+
+struct TaskState {
+    outcome: Option<SearchOutcome>,
+    completion_callbacks: Vec<CompletionCallback>,
+}
+
+// Search running on a coordinator thread, independent of the Python GIL.
+// The coordinator spawns the Lazy SMP threads and publishes the outcome once they join.
+pub struct SearchTask {
+    control: Arc<SearchControl>,
+    state: Mutex<TaskState>,
+    finished: Condvar,
+}
+
+impl SearchTask {
+    pub fn spawn<F>(control: Arc<SearchControl>, search: F) -> Arc<Self>
+    where
+        F: FnOnce() -> SearchOutcome + Send + 'static,
+    {
+        let task = Arc::new(Self {
+            control,
+            state: Mutex::new(TaskState {
+                outcome: None,
+                completion_callbacks: Vec::new(),
+            }),
+            finished: Condvar::new(),
+        });
+
+        let coordinator_task = Arc::clone(&task);
+        thread::spawn(move || {
+            let outcome = search();
+            coordinator_task.complete(outcome);
+        });
+
+        task
+    }
+
+    fn complete(&self, outcome: SearchOutcome) {
+        // Callbacks run outside the lock so they are free to acquire the GIL
+        let callbacks = {
+            let mut state = self.state.lock().unwrap();
+            state.outcome = Some(outcome.clone());
+            std::mem::take(&mut state.completion_callbacks)
+        };
+        self.finished.notify_all();
+
+        for callback in callbacks {
+            callback(&outcome);
+        }
+    }
+
+    // Trip the shared stop signal - The search threads exit on their next poll
+    pub fn stop(&self) {
+        self.control.stop();
+    }
+
+    // Switch a pondering search over to the normal time limit
+    pub fn ponderhit(&self) {
+        self.control.ponderhit();
+    }
+
+    // Switch a pondering search over to new limits, timed from the ponder hit
+    pub fn ponderhit_with(&self, limits: SearchLimits) {
+        self.control.ponderhit_with(limits);
+    }
+
+    pub fn is_pondering(&self) -> bool {
+        self.control.is_pondering()
+    }
+
+    pub fn poll(&self) -> Option<SearchOutcome> {
+        self.state.lock().unwrap().outcome.clone()
+    }
+
+    pub fn wait(&self) -> SearchOutcome {
+        let mut state = self.state.lock().unwrap();
+        loop {
+            if let Some(outcome) = &state.outcome {
+                return outcome.clone();
+            }
+            state = self.finished.wait(state).unwrap();
+        }
+    }
+
+    pub fn wait_timeout(&self, timeout: Duration) -> Option<SearchOutcome> {
+        let state = self.state.lock().unwrap();
+        let (state, _) = self.finished
+            .wait_timeout_while(state, timeout, |state| state.outcome.is_none())
+            .unwrap();
+        state.outcome.clone()
+    }
+
+    // Run the callback once the search completes (immediately if it already has)
+    pub fn on_complete<F>(&self, callback: F)
+    where
+        F: FnOnce(&SearchOutcome) + Send + 'static,
+    {
+        let outcome = {
+            let mut state = self.state.lock().unwrap();
+            match &state.outcome {
+                Some(outcome) => outcome.clone(),
+                None => {
+                    state.completion_callbacks.push(Box::new(callback));
+                    return;
+                }
+            }
+        };
+        callback(&outcome);
+    }
+}
+
+#[cfg(feature = "python")]
+#[pyclass]
+pub struct SearchHandle {
+    task: Arc<SearchTask>,
+}
+
+#[cfg(feature = "python")]
+impl SearchHandle {
+    pub fn new(task: Arc<SearchTask>) -> Self {
+        Self { task }
+    }
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl SearchHandle {
+    // Best Move in UCI Format, or None while the search is still running
+    pub fn poll(&self) -> Option<String> {
+        self.task.poll().map(|outcome| outcome.best_move_uci())
+    }
+
+    // Block without holding the GIL - Returns None if the timeout (seconds) elapses first
+    #[pyo3(signature = (timeout=None))]
+    pub fn wait(&self, py: Python<'_>, timeout: Option<f64>) -> Option<String> {
+        let task = &self.task;
+        let outcome = py.detach(|| match timeout {
+            Some(seconds) => task.wait_timeout(Duration::from_secs_f64(seconds.max(0.0))),
+            None => Some(task.wait()),
+        });
+        outcome.map(|outcome| outcome.best_move_uci())
+    }
+
+    // Cut the search short - The best move of the last completed depth is kept
+    pub fn stop(&self) {
+        self.task.stop();
+    }
+
+    // The opponent played the predicted move - Keep searching on the clock
+    pub fn ponderhit(&self) {
+        self.task.ponderhit();
+    }
+
+    pub fn is_pondering(&self) -> bool {
+        self.task.is_pondering()
+    }
+
+    // Best Move packed as in the Transposition Table (GameSession.push_move format)
+    pub fn best_move_packed(&self) -> Option<u16> {
+        self.task.poll().and_then(|outcome| outcome.best_move).map(|mv| mv.pack())
+    }
+
+    // Predicted reply of the finished search
+    pub fn ponder_move(&self) -> Option<String> {
+        self.task.poll().and_then(|outcome| outcome.ponder_move_uci())
+    }
+
+    pub fn done(&self) -> bool {
+        self.task.poll().is_some()
+    }
+
+    pub fn nodes_processed(&self) -> Option<usize> {
+        self.task.poll().map(|outcome| outcome.nodes_processed)
+    }
+
+    // asyncio support: resolve an event loop future from the coordinator thread
+    fn __await__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let event_loop = py.import("asyncio")?.call_method0("get_running_loop")?;
+        let future = event_loop.call_method0("create_future")?;
+
+        let loop_ref = event_loop.unbind();
+        let future_ref = future.clone().unbind();
+
+        self.task.on_complete(move |outcome| {
+            let uci = outcome.best_move_uci();
+            Python::attach(|py| {
+                // Futures are not thread safe - Both the cancelled check and the result run
+                // on the loop thread, whose exception handler reports any error
+                let resolve = PyCFunction::new_closure(py, None, None, move |args, _kwargs| -> PyResult<()> {
+                    let future = future_ref.bind(args.py());
+                    if !future.call_method0("cancelled")?.extract::<bool>()? {
+                        future.call_method1("set_result", (uci.clone(),))?;
+                    }
+                    Ok(())
+                });
+
+                // Fails only once the loop is closed, with nothing left awaiting the future
+                if let Ok(resolve) = resolve {
+                    let _ = loop_ref.bind(py).call_method1("call_soon_threadsafe", (resolve,));
+                }
+            });
+        });
+
+        future.call_method0("__await__")
+    }
+}
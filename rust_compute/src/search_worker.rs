@@ -1,44 +1,97 @@
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::time::{Instant, Duration};
+use std::sync::Arc;
 use crate::transposition_table::*;
 use arrayvec::ArrayVec;
 use std::cmp;
 
 use crate::move_command::*;
+use crate::move_list::*;
 use crate::chess_game::*;
 use crate::lmr_table::*;
 
 use crate::parser::*;
 use crate::chess_board::*;
 use crate::nnue_network::*;
+use crate::search_control::*;
+use crate::move_picker::*;
+use crate::move_history::*;
+use crate::static_exchange::*;
+use crate::pruning_params::*;
+
+// Aspiration windows start at this depth, around the previous iteration's score
+pub const ASPIRATION_MIN_DEPTH: i32 = 4;
+
+// Initial half-width (centipawns) for the master thread
+pub const ASPIRATION_WINDOW: i32 = 25;
+
+// Lazy SMP helpers widen their initial window by this much per thread_id step,
+// so the helpers fail high / low at different depths than the master
+pub const ASPIRATION_HELPER_STEP: i32 = 10;
+
+// Past this half-width the window opens up completely
+pub const ASPIRATION_MAX_WINDOW: i32 = 1000;
+
+// Lazy SMP depth schedule - Helper thread_id cycles through these rows, and skips every
+// other block of skip size depths, shifted by the phase. Helpers therefore spread out over
+// neighbouring depths instead of all searching the same one in lockstep.
+const SKIP_SIZE: [i32; 20] = [1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4];
+const SKIP_PHASE: [i32; 20] = [0, 1, 0, 1, 2, 3, 0, 1, 2, 3, 4, 5, 0, 1, 2, 3, 4, 5, 6, 7];
+
+// ABDADA - Moves another thread is searching are deferred from this depth on,
+// shallower subtrees are cheaper to duplicate than to coordinate
+pub const ABDADA_DEFER_DEPTH: i32 = 3;
+
+// Quiescence delta pruning - Captures that can't raise alpha even with this much to spare are skipped
+pub const DELTA_MARGIN: i32 = 200;
+
+// Moves searched before a cutoff whose history is penalized - Later ones are skipped
+const MAX_TRIED_MOVES: usize = 64;
+
+// Deferred ABDADA moves per node - Once full, busy moves are searched right away
+const MAX_DEFERRED_MOVES: usize = 32;
 
 #[derive(Clone)] 
-pub struct SearchWorker<'a>  {
-    transposition_table: &'a TranspositionTable,
+pub struct SearchWorker {
+    transposition_table: Arc<TranspositionTable>,
     nodes_processed: usize,
 
-    history: [Option<UndoMove>; 1024],
-    history_index: usize,
+    // Moves played into the root position, for pop_move - Search threads start without them
+    game_history: Vec<UndoMove>,
+    // Moves made by the search below the root
+    history: ArrayVec<UndoMove, MAX_PLY>,
 
     chess_board: ChessBoard,
 
-    traversed_positions: [u64; 1024],
-    position_stack_len: usize,
+    // Game positions up to and including the root. Only those within the halfmove clock,
+    // since the last capture or pawn move, can repeat - Search threads copy just these.
+    game_positions: Vec<u64>,
+    // Positions reached by the search below the root
+    search_positions: ArrayVec<u64, MAX_PLY>,
 
-    killer_move_table: [[Option<ForwardMove>; MAX_DEPTH as usize]; 2],
+    // Packed as in the Transposition Table - 0 is an empty slot
+    killer_move_table: [[u16; MAX_DEPTH as usize]; 2],
+    // Butterfly, countermove and capture history - Per thread, so helpers diverge
+    move_history: Box<MoveHistory>,
     thread_id: i32,
 
+    // Forward pruning margins - Set from the engine options before each search
+    pruning: PruningParams,
+    // ABDADA parallel search instead of Lazy SMP depth skipping
+    abdada: bool,
+
+    // MultiPV - Root moves of the lines already found at the current depth
+    root_excluded_moves: Vec<ForwardMove>,
+
     thread_buffer: NnueInferenceBuffer,
 }
 
-impl<'a> SearchWorker<'a> {
+impl SearchWorker {
     pub fn new(
-        transposition_table: &'a TranspositionTable,
+        transposition_table: Arc<TranspositionTable>,
         nnue_network: &'static NnueNetwork
     ) -> Self {
         Self {
-            history: [None; 1024],
-            history_index: 0,
+            game_history: Vec::new(),
+            history: ArrayVec::new(),
 
             chess_board: {
                 let mut chess_board = ChessBoard::new(
@@ -48,148 +101,430 @@ impl<'a> SearchWorker<'a> {
                 chess_board
             },
 
-            traversed_positions: {
-                [0; 1024]
-            },
-            position_stack_len: 0, 
+            game_positions: Vec::new(),
+            search_positions: ArrayVec::new(),
             
             nodes_processed: 0,
             transposition_table,
 
-            killer_move_table: [[None; MAX_DEPTH as usize]; 2],
+            killer_move_table: [[0; MAX_DEPTH as usize]; 2],
+            move_history: Box::default(),
             thread_id: 0,
+            pruning: PruningParams::default(),
+            abdada: false,
+
+            root_excluded_moves: Vec::new(),
 
             thread_buffer: NnueInferenceBuffer::default(),
         }
     }
 
+    // Root position from a FEN string
+    pub fn from_fen(
+        transposition_table: Arc<TranspositionTable>,
+        nnue_network: &'static NnueNetwork,
+        fen: &str
+    ) -> Result<Self, String> {
+        let mut search_worker = Self::new(transposition_table, nnue_network);
+        search_worker.chess_board.load_fen(fen)?;
+        search_worker.game_positions.push(search_worker.chess_board.zobrist_hash());
+        Ok(search_worker)
+    }
+
     pub fn from_game_state(
-        transposition_table: &'a TranspositionTable, 
+        transposition_table: Arc<TranspositionTable>, 
         search_worker: &SearchWorker,
         thread_id: i32
     ) -> Self {
         Self {
-            // History move records are left blank as they aren't needed for future searches
-            history: [None; 1024],
-            history_index: search_worker.history_index,
+            // Game moves are left out as the search never goes below its root
+            game_history: Vec::new(),
+            history: ArrayVec::new(),
             chess_board: search_worker.chess_board.clone(),
 
-            // Populate our repetition detection array
-            traversed_positions: search_worker.traversed_positions,
-            position_stack_len: search_worker.position_stack_len, 
+            // Only the positions that can still repeat
+            game_positions: search_worker.repetition_window().to_vec(),
+            search_positions: ArrayVec::new(),
             
             nodes_processed: 0,
             transposition_table,
 
-            killer_move_table: [[None; MAX_DEPTH as usize]; 2],
+            killer_move_table: [[0; MAX_DEPTH as usize]; 2],
+            move_history: Box::default(),
             thread_id,
+            pruning: search_worker.pruning,
+            abdada: search_worker.abdada,
+
+            root_excluded_moves: Vec::new(),
 
             thread_buffer: NnueInferenceBuffer::default(),
         }
     }
 
-    // Search Entry Point
+    // Pooled threads keep their worker between searches - Point it at the new root in place
+    // instead of allocating the repetition list and accumulators again
+    pub fn reset_from_game_state(
+        &mut self,
+        transposition_table: Arc<TranspositionTable>,
+        search_worker: &SearchWorker,
+        thread_id: i32
+    ) {
+        self.game_history.clear();
+        self.history.clear();
+        self.chess_board.copy_position_from(&search_worker.chess_board);
+
+        self.game_positions.clear();
+        self.game_positions.extend_from_slice(search_worker.repetition_window());
+        self.search_positions.clear();
+
+        self.nodes_processed = 0;
+        self.transposition_table = transposition_table;
+
+        self.killer_move_table = [[0; MAX_DEPTH as usize]; 2];
+        self.move_history.clear();
+        self.thread_id = thread_id;
+
+        self.pruning = search_worker.pruning;
+        self.abdada = search_worker.abdada;
+        self.root_excluded_moves.clear();
+    }
+
+    pub fn set_pruning_params(&mut self, pruning: PruningParams) {
+        self.pruning = pruning;
+    }
+
+    pub fn set_abdada(&mut self, abdada: bool) {
+        self.abdada = abdada;
+    }
+
+    pub fn set_nnue_network(&mut self, nnue_network: &'static NnueNetwork) {
+        self.chess_board.set_nnue_network(nnue_network);
+    }
+
+    // Search Entry Point - Returns the best multi_pv root moves of the last completed
+    // depth, best first. Each extra line re-searches the root with the moves of the
+    // earlier lines excluded, in the same iterative deepening loop and TT.
     pub fn root_search(&mut self,
-        max_depth: i32, stop_signal: &AtomicBool) -> (Option<ForwardMove>, usize){
-        // Start the timer
-        let start_time = Instant::now();
-        let time_limit = Duration::from_secs(SEARCH_TIME_LIMIT);
+        max_depth: i32, control: &SearchControl, multi_pv: usize) -> (Vec<PvLine>, usize){
+
+        let multi_pv = multi_pv.clamp(1, self.legal_moves().len().max(1));
 
         // --- ITERATIVE DEEPENING LOOP ---
-        let mut best_move_overall: Option<ForwardMove> = None;
+        let mut pv_lines: Vec<PvLine> = Vec::new();
+        let mut best_move_stability = 0;
         let mut depth = 1;
 
         while depth <= max_depth {
-            if stop_signal.load(Ordering::Relaxed) || start_time.elapsed() >= time_limit {
-                stop_signal.store(true, Ordering::Relaxed);
+            if control.is_stopped() || control.out_of_time() {
+                control.stop();
                 break;
             }
-            
-            let result = self.negamax(depth, 0, -INFINITY, INFINITY, 
-                best_move_overall, stop_signal, true);
-            
-            if !stop_signal.load(Ordering::Relaxed){
-                best_move_overall = result.best_move;
-
-                if self.thread_id == 0 {
-                    println!("[Master Thread] Completed Depth: {} | Best Move Score: {:?}", 
-                        depth, result.best_move);
-                    if depth >= PV_DEPTH { 
-                        stop_signal.store(true, Ordering::Relaxed);
-                        break;
+
+            // Helpers skip depths once they have a result - The last depth is always searched
+            if !pv_lines.is_empty() && depth < max_depth && self.skips_depth(depth) {
+                depth += 1;
+                continue;
+            }
+
+            let mut depth_lines: Vec<PvLine> = Vec::with_capacity(multi_pv);
+            for pv_index in 0..multi_pv {
+                // Previous iteration's line at this rank leads the move ordering
+                // and centres the aspiration window
+                let previous_line = pv_lines.get(pv_index);
+                let result = self.aspiration_search(depth, 
+                    previous_line.map(|pv_line| pv_line.score),
+                    previous_line.map(|pv_line| pv_line.best_move),
+                    control);
+
+                // Aborted before the first iteration completed - The master keeps the partial root
+                // result so there is a move to play, helpers only vote with completed iterations
+                if control.is_stopped() {
+                    if let (true, Some(best_move)) = (self.thread_id == 0 && pv_lines.is_empty(), result.best_move) {
+                        depth_lines.push(PvLine { best_move, score: result.score, depth, pv: vec![best_move] });
                     }
+                    break;
+                }
+
+                let Some(best_move) = result.best_move else {
+                    break;
+                };
+                depth_lines.push(PvLine { best_move, score: result.score, depth, pv: vec![best_move] });
+                self.root_excluded_moves.push(best_move);
+            }
+            self.root_excluded_moves.clear();
+
+            if control.is_stopped() {
+                if pv_lines.is_empty() {
+                    pv_lines = depth_lines;
                 }
-            } else {
                 break;
             }
 
+            depth_lines.sort_by_key(|pv_line| -pv_line.score);
+            let best_move = depth_lines.first().map(|pv_line| pv_line.best_move);
+            if best_move == pv_lines.first().map(|pv_line| pv_line.best_move) {
+                best_move_stability += 1;
+            } else {
+                best_move_stability = 0;
+            }
+            pv_lines = depth_lines;
+
+            if self.thread_id == 0 {
+                for pv_line in pv_lines.iter_mut() {
+                    pv_line.pv = self.principal_variation(pv_line.best_move, depth as usize);
+                }
+
+                if control.reports_info() {
+                    for (pv_index, pv_line) in pv_lines.iter().enumerate() {
+                        control.report_info(&SearchInfo {
+                            depth,
+                            multipv: pv_index + 1,
+                            score: pv_line.score,
+                            nodes: control.nodes_searched() + self.nodes_processed % POLL_INTERVAL,
+                            elapsed: control.elapsed(),
+                            pv: pv_line.pv.clone(),
+                        });
+                    }
+                }
+                if control.should_stop_iterating(depth, best_move_stability) { 
+                    control.stop();
+                    break;
+                }
+            }
+
             depth += 1;
         }
+
+        // Helpers only follow the principal variation at the end - Their lines may win the vote
+        if self.thread_id != 0 {
+            for pv_line in pv_lines.iter_mut() {
+                pv_line.pv = self.principal_variation(pv_line.best_move, pv_line.depth as usize);
+            }
+        }
             
-        (best_move_overall, self.nodes_processed)
+        (pv_lines, self.nodes_processed)
     }
 
-    // Call this when entering a node (making a move)
-    fn push_position(&mut self) {
-        let hash = self.chess_board.zobrist_hash();
-        self.traversed_positions[self.position_stack_len] = hash;
-        self.position_stack_len += 1;
-    }
+    // The master searches every depth - ABDADA threads all search the same depth
+    fn skips_depth(&self, depth: i32) -> bool {
+        if self.thread_id == 0 || self.abdada {
+            return false;
+        }
 
-    // Call this when backing out of a node (undoing a move)
-    fn pop_position(&mut self) {
-        self.position_stack_len -= 1;
+        let row = (self.thread_id as usize - 1) % SKIP_SIZE.len();
+        ((depth + SKIP_PHASE[row]) / SKIP_SIZE[row]) % 2 != 0
     }
 
-    // Fast linear scan inside the L1 CPU cache stepping by 2
-    fn is_three_move_repetition(&self) -> bool {
-        let current_hash = self.chess_board.zobrist_hash();
-        
-        // A repetition requires at least 4 plies to pass (2 full moves) 
-        // for the same position to occur a second time on your turn.
-        if self.position_stack_len < 4 {
-            return false;
-        }
+    // Root search in a window around the previous score, widened gradually on a fail
+    // low / fail high until the score lands inside it. Mate scores use the full window.
+    fn aspiration_search(&mut self, depth: i32, previous_score: Option<i32>,
+        pv_move_hint: Option<ForwardMove>, control: &SearchControl) -> SearchResult {
 
-        // Initialize to 1 because the current position is the 1st occurrence
-        let mut curr_count = 1;
+        let previous_score = previous_score
+            .filter(|score| depth >= ASPIRATION_MIN_DEPTH && score.abs() < MATE_THRESHOLD);
+        let Some(previous_score) = previous_score else {
+            return self.negamax(depth, 0, -INFINITY, INFINITY, pv_move_hint, control, true);
+        };
 
-        // Start 2 plies back (the last time it was this player's turn)
-        let mut i = self.position_stack_len - 2;
+        let mut delta = self.aspiration_window();
+        let mut alpha = (previous_score - delta).max(-INFINITY);
+        let mut beta = (previous_score + delta).min(INFINITY);
 
         loop {
-            if self.traversed_positions[i] == current_hash {
-                curr_count += 1;
-                if curr_count == 3 {
-                    return true;
-                }
+            let result = self.negamax(depth, 0, alpha, beta, pv_move_hint, control, true);
+            if control.is_stopped() {
+                return result;
             }
 
-            // Clean underflow protection and loop exit
-            if i >= 2 {
-                i -= 2;
+            if result.score <= alpha {
+                // Fail Low - Pull beta in as well, the true score is below the window
+                beta = (alpha + beta) / 2;
+                alpha = (result.score - delta).max(-INFINITY);
+            } else if result.score >= beta {
+                beta = (result.score + delta).min(INFINITY);
             } else {
+                return result;
+            }
+
+            delta += delta / 2;
+            if delta > ASPIRATION_MAX_WINDOW {
+                alpha = -INFINITY;
+                beta = INFINITY;
+            }
+        }
+    }
+
+    // Helpers use wider windows - Four distinct widths cycle over the thread ids
+    fn aspiration_window(&self) -> i32 {
+        ASPIRATION_WINDOW + ASPIRATION_HELPER_STEP * (self.thread_id % 4)
+    }
+
+    // Follow the Transposition Table moves from the root, starting with the best move.
+    // Every move is validated against the generated moves, so hash collisions end the line.
+    pub fn principal_variation(&mut self, best_move: ForwardMove, max_len: usize) -> Vec<ForwardMove> {
+        let mut pv_line = Vec::new();
+        let mut next_move = Some(best_move);
+
+        while let Some(candidate) = next_move {
+            if pv_line.len() >= max_len {
+                break;
+            }
+
+            let Some(forward_move) = self.legal_moves().into_iter().find(|m| *m == candidate) else {
+                break;
+            };
+
+            self.process_forward_move(forward_move);
+            pv_line.push(forward_move);
+
+            if self.is_draw() {
                 break;
             }
+
+            next_move = self.transposition_table
+                .probe(self.chess_board.zobrist_hash(), 0)
+                .filter(|tt_entry| tt_entry.move_id != 0)
+                .map(|tt_entry| ForwardMove::unpack(tt_entry.move_id));
+        }
+
+        // Restore the root position
+        for _ in 0..pv_line.len() {
+            self.process_backward_move();
+        }
+
+        pv_line
+    }
+
+    // Game positions since the last capture or pawn move, the root included - Called at the root
+    fn repetition_window(&self) -> &[u64] {
+        let window_len = (self.chess_board.halfmove_clock() as usize + 1).min(self.game_positions.len());
+        &self.game_positions[self.game_positions.len() - window_len..]
+    }
+
+    // Linear scan of the positions with the same side to move, newest first - The search
+    // plies, then the game positions. Only those within the halfmove clock can repeat.
+    fn is_three_move_repetition(&self) -> bool {
+        let halfmove_clock = self.chess_board.halfmove_clock() as usize;
+
+        // Two repetitions need at least 8 reversible plies
+        if halfmove_clock < 8 {
+            return false;
+        }
+
+        let current_hash = self.chess_board.zobrist_hash();
+
+        // The current position is the newest entry, so start 2 plies before it
+        let mut earlier_positions = self.search_positions.iter().rev()
+            .chain(self.game_positions.iter().rev())
+            .take(halfmove_clock + 1)
+            .skip(2)
+            .step_by(2);
+
+        // The current position is the 1st occurrence, two more make it a draw
+        earlier_positions.by_ref().any(|hash| *hash == current_hash)
+            && earlier_positions.any(|hash| *hash == current_hash)
+    }
+
+    // Fifty-move rule, dead position or repetition - Checkmate on the hundredth ply still counts
+    fn is_draw(&mut self) -> bool {
+        if self.chess_board.halfmove_clock() >= 100 {
+            return !self.chess_board.is_in_check() || !self.legal_moves().is_empty();
         }
 
-        false
+        self.chess_board.is_insufficient_material() || self.is_three_move_repetition()
+    }
+
+    pub fn active_player(&self) -> Side {
+        self.chess_board.active_player()
+    }
+
+    pub fn chess_board(&self) -> &ChessBoard {
+        &self.chess_board
     }
 
     pub fn process_moves(&mut self, prev_moves: Vec<String>) {
         for uci_move in &prev_moves {
-            if self.history_index >= 1024 { break; } 
-
             let move_command: ForwardMove = 
                 parse_forward_move_with_board(uci_move, &self.chess_board);
-            self.process_forward_move(move_command);
+            self.process_game_move(move_command);
+        }
+    }
+
+    // Validated counterpart of process_moves - Rejects moves that aren't legal in the position
+    pub fn push_uci_move(&mut self, uci_move: &str) -> Result<ForwardMove, String> {
+        self.push_legal_move(|m| parse_uci(*m) == uci_move, uci_move)
+    }
+
+    // Moves packed as in the Transposition Table
+    pub fn push_packed_move(&mut self, packed_move: u16) -> Result<ForwardMove, String> {
+        self.push_legal_move(|m| m.pack() == packed_move, &format!("{:#06x}", packed_move))
+    }
+
+    // Undo the last pushed move - Returns None at the root position
+    pub fn pop_move(&mut self) -> Option<ForwardMove> {
+        let undo_move = self.game_history.pop()?;
+        self.game_positions.pop();
+
+        // The root accumulator slot is the position being left, refresh the one returned to
+        let accumulator_below = self.chess_board.unmake_move();
+        self.chess_board.unexecute_move(undo_move);
+        if !accumulator_below {
+            self.chess_board.create_accumlator_from_scratch();
         }
+
+        Some(ForwardMove::new(undo_move.start_sq, undo_move.end_sq, undo_move.move_type))
     }
 
+    pub fn legal_moves(&mut self) -> Vec<ForwardMove> {
+        let legal_masks = self.chess_board.legal_masks();
+        let mut gen_moves = MoveList::new();
+        self.chess_board.generate_legal_moves(&mut gen_moves, &legal_masks);
+
+        gen_moves.to_vec()
+    }
+
+    // Number of moves played from the root position
+    pub fn history_len(&self) -> usize {
+        self.game_history.len()
+    }
+
+    fn push_legal_move<F>(&mut self, matches: F, move_name: &str) -> Result<ForwardMove, String>
+    where
+        F: Fn(&ForwardMove) -> bool,
+    {
+        let forward_move = self.legal_moves()
+            .into_iter()
+            .find(|m| matches(m))
+            .ok_or_else(|| format!("Illegal move: {}", move_name))?;
+
+        self.process_game_move(forward_move);
+        Ok(forward_move)
+    }
+
+    // Game move - The new position becomes the root, so the search stacks stay
+    // bounded by the search depth however long the game runs
+    fn process_game_move(&mut self, forward_move: ForwardMove) {
+        let undo_move = self.make_forward_move(forward_move);
+        self.chess_board.reroot_accumulators();
+
+        self.game_positions.push(self.chess_board.zobrist_hash());
+        self.game_history.push(undo_move);
+    }
+
+    // Search move below the root
     fn process_forward_move(&mut self, forward_move: ForwardMove) {
+        let undo_move = self.make_forward_move(forward_move);
+
+        // Push Move History
+        self.search_positions.push(self.chess_board.zobrist_hash());
+        self.history.push(undo_move);
+    }
+
+    fn make_forward_move(&mut self, forward_move: ForwardMove) -> UndoMove {
         // Store Value prior to Executing Move
         let prev_castle_rights = self.chess_board.castle_rights(); 
         let prev_en_passant = self.chess_board.en_passant();
+        let prev_halfmove_clock = self.chess_board.halfmove_clock();
 
         // Null Move
         let mut undo_move = UndoMove {
@@ -199,17 +534,18 @@ impl<'a> SearchWorker<'a> {
             captured_piece: None,
             prev_castle_rights,
             prev_en_passant,
+            prev_halfmove_clock,
         };
 
-        if forward_move.move_type == MoveFlag::NULL {
-            self.chess_board.increment_ply();
+        if forward_move.move_type() == MoveFlag::NULL {
+            self.chess_board.push_null_accumulator();
             self.chess_board.execute_move(forward_move); 
         } else {
-            let move_piece = self.chess_board.mailbox_piece(forward_move.start_sq);
+            let move_piece = self.chess_board.mailbox_piece(forward_move.start_sq());
             let is_king_or_castle = move_piece == BoardPiece::WKING 
                 || move_piece == BoardPiece::BKING 
-                || forward_move.move_type == MoveFlag::KINGSIDECASTLE 
-                || forward_move.move_type == MoveFlag::QUEENSIDECASTLE;
+                || forward_move.move_type() == MoveFlag::KINGSIDECASTLE 
+                || forward_move.move_type() == MoveFlag::QUEENSIDECASTLE;
 
         if !is_king_or_castle {
                 self.chess_board.make_move(forward_move);
@@ -217,12 +553,13 @@ impl<'a> SearchWorker<'a> {
 
             let remove_piece = self.chess_board.execute_move(forward_move);
             undo_move = UndoMove {
-                start_sq: forward_move.start_sq,
-                end_sq: forward_move.end_sq,
-                move_type: forward_move.move_type,
+                start_sq: forward_move.start_sq(),
+                end_sq: forward_move.end_sq(),
+                move_type: forward_move.move_type(),
                 captured_piece: remove_piece,
                 prev_castle_rights,
                 prev_en_passant,
+                prev_halfmove_clock,
             };
 
             // Forced Recompute due to King
@@ -232,26 +569,17 @@ impl<'a> SearchWorker<'a> {
             }
         }
 
-        // Push Move History
-        self.push_position();
-
-        self.history[self.history_index] = Some(undo_move);
-        self.history_index += 1;
+        undo_move
     }
 
     fn process_backward_move(&mut self) {
-        if self.history_index == 0 {
-            return;
-        }
-
-        self.history_index -= 1;
-        if let Some(undo_move) = self.history[self.history_index].take() {
+        if let Some(undo_move) = self.history.pop() {
             // Timecat Undo
             self.chess_board.unmake_move();
 
             // ChessBoard Undo Move
             self.chess_board.unexecute_move(undo_move);
-            self.pop_position();
+            self.search_positions.pop();
         }
     }
 
@@ -284,7 +612,7 @@ impl<'a> SearchWorker<'a> {
     // Store Killer Move - No Captures
     fn store_killer_move(&mut self, new_killer_move: ForwardMove, depth: i32) {
         // Store Non-Captures for Killer Move
-        if matches!(new_killer_move.move_type, 
+        if matches!(new_killer_move.move_type(), 
             MoveFlag::CAPTURE | MoveFlag::ENPASSANT | MoveFlag::PROMOTIONQUEEN
         ) {
             return;
@@ -293,13 +621,46 @@ impl<'a> SearchWorker<'a> {
         let depth_idx = depth as usize;
 
         // If this move is already our primary killer, do nothing
-        if self.killer_move_table[0][depth_idx] == Some(new_killer_move) {
+        if self.killer_move_table[0][depth_idx] == new_killer_move.pack() {
             return;
         }
         
         // Later Moves would case a stronger beta cutoff
         self.killer_move_table[1][depth_idx] = self.killer_move_table[0][depth_idx];
-        self.killer_move_table[0][depth_idx] = Some(new_killer_move);
+        self.killer_move_table[0][depth_idx] = new_killer_move.pack();
+    }
+
+    fn killer_moves(&self, depth: i32) -> [Option<ForwardMove>; 2] {
+        self.killer_move_table.map(|killers| {
+            let packed_move = killers[depth as usize];
+            (packed_move != 0).then(|| ForwardMove::unpack(packed_move))
+        })
+    }
+
+    // Piece and destination of the last move played - None at the root or after a null move
+    fn previous_move_key(&self) -> Option<(BoardPiece, usize)> {
+        let undo_move = self.history.last()?;
+
+        (undo_move.move_type != MoveFlag::NULL)
+            .then(|| (self.chess_board.mailbox_piece(undo_move.end_sq), undo_move.end_sq))
+    }
+
+    // Beta cutoff - Quiet moves feed the killers, countermove and butterfly history,
+    // and every capture searched at this node the capture history
+    fn update_move_history(&mut self, best_move: ForwardMove, depth: i32,
+        quiets_tried: &[ForwardMove], captures_tried: &[ForwardMove]) {
+        if is_tactical(best_move) {
+            self.move_history.update_captures(&self.chess_board, Some(best_move), captures_tried, depth);
+            return;
+        }
+
+        self.store_killer_move(best_move, depth);
+        self.move_history.update_quiets(self.chess_board.active_player(), best_move, quiets_tried, depth);
+        self.move_history.update_captures(&self.chess_board, None, captures_tried, depth);
+
+        if let Some((piece, to_sq)) = self.previous_move_key() {
+            self.move_history.store_countermove(piece, to_sq, best_move);
+        }
     }
 
     // StockFish NMP Reduction algorithm
@@ -335,21 +696,27 @@ impl<'a> SearchWorker<'a> {
     #[allow(clippy::too_many_arguments)]
     fn negamax(&mut self, depth: i32, ply: i32, mut alpha: i32, mut beta: i32, 
         mut pv_move_hint: Option<ForwardMove>, 
-        stop_signal: &AtomicBool, allow_null: bool) -> SearchResult {
+        control: &SearchControl, allow_null: bool) -> SearchResult {
         
         // Nodes Processed
         self.nodes_processed += 1;
 
-        // Halt Signal
-        if self.nodes_processed & 0x3FFF == 0 && stop_signal.load(Ordering::Relaxed) {
+        // Halt Signal - Report nodes and check the limits periodically
+        if self.nodes_processed & POLL_MASK == 0 {
+            control.poll(self.thread_id as usize, self.nodes_processed);
+        }
+        if control.is_stopped() {
             return SearchResult { score: 0, best_move: None };
         }
 
         // Original Alpha for Transposition Table
         let original_alpha = alpha;
+
+        // MultiPV root with moves excluded - The TT holds the unrestricted root
+        let excluding_root_moves = ply == 0 && !self.root_excluded_moves.is_empty();
         
-        // Three Move Repetition Draw
-        if self.is_three_move_repetition() {
+        // Draw by rule - The root still needs a move when the game itself is drawn
+        if ply > 0 && self.is_draw() {
             return SearchResult {
                 score: 0,
                 best_move: None,
@@ -357,14 +724,12 @@ impl<'a> SearchWorker<'a> {
         }
 
         let hash = self.chess_board.zobrist_hash();
-        if let Some(tt_entry) = self.transposition_table.probe(hash, ply) {
+        if let Some(tt_entry) = self.transposition_table.probe(hash, ply).filter(|_| !excluding_root_moves) {
             let retrieved_score: i32 = tt_entry.score as i32;
             let retrieved_depth: i32 = tt_entry.depth as i32;
             
             if tt_entry.move_id != 0 {
-                let mut mv = ForwardMove::unpack(tt_entry.move_id);
-                mv.pv_score = -2_000_000;
-                pv_move_hint = Some(mv);
+                pv_move_hint = Some(ForwardMove::unpack(tt_entry.move_id));
             };
 
             if retrieved_depth >= depth {
@@ -400,7 +765,7 @@ impl<'a> SearchWorker<'a> {
         // Leaf Node Condition -> Drop into Quiescence Search
         if depth == 0 {
             return SearchResult {
-                score: self.quiescence_search(alpha, beta, ply, -1, stop_signal),
+                score: self.quiescence_search(alpha, beta, ply, -1, control),
                 best_move: None,
             };
         }
@@ -409,15 +774,52 @@ impl<'a> SearchWorker<'a> {
         let mut legal_moves_played = 0;
         let mut best_score = -INFINITY;
 
-        let mut gen_moves = ArrayVec::<ForwardMove, 256>::new();
-        self.chess_board.generate_moves(&mut gen_moves, pv_move_hint, 
-            depth, &self.killer_move_table);
+        // Moves are generated lazily - A TT move cutoff never pays for generation
+        let countermove = self.previous_move_key()
+            .and_then(|(piece, to_sq)| self.move_history.countermove(piece, to_sq));
+        let mut move_picker = MovePicker::new(pv_move_hint, self.killer_moves(depth), countermove);
+
+        // Moves searched so far - Penalized in the history tables on a cutoff
+        let mut quiets_tried = ArrayVec::<ForwardMove, MAX_TRIED_MOVES>::new();
+        let mut captures_tried = ArrayVec::<ForwardMove, MAX_TRIED_MOVES>::new();
 
         // Late Move Reduction 
         let mut lmr_eligibility;
         let mut moves_tried: i32 = 0;
         let king_in_check = self.chess_board.is_in_check(); 
 
+        // Static pruning near the horizon - Null window nodes that aren't in check, away from mate scores
+        let pruning = self.pruning;
+        let can_prune = ply > 0 && !king_in_check && beta - alpha == 1 &&
+            alpha > -MATE_THRESHOLD && beta < MATE_THRESHOLD;
+        let eval_max_depth = pruning.rfp_max_depth.max(pruning.futility_max_depth).max(pruning.razor_max_depth);
+        let node_eval = (can_prune && depth <= eval_max_depth).then(|| self.board_eval());
+
+        if let Some(eval) = node_eval {
+            // Reverse Futility Pruning - Too far above beta to drop below it within depth
+            if depth <= pruning.rfp_max_depth && eval - pruning.rfp_margin * depth >= beta {
+                return SearchResult { score: eval, best_move: None };
+            }
+
+            // Razoring - Too far below alpha, unless quiescence finds a tactic
+            if depth <= pruning.razor_max_depth &&
+                eval + pruning.razor_base + pruning.razor_margin * depth < alpha {
+                let razor_score = self.quiescence_search(alpha, beta, ply, -1, control);
+                if razor_score < alpha {
+                    return SearchResult { score: razor_score, best_move: None };
+                }
+            }
+        }
+
+        // Futility Pruning - Quiet moves can't lift the eval up to alpha
+        let futility_pruning = node_eval.is_some_and(|eval| depth <= pruning.futility_max_depth &&
+            eval + pruning.futility_base + pruning.futility_margin * depth <= alpha);
+
+        // Late Move Pruning - Quiet moves past this count are skipped
+        let lmp_limit = (can_prune && depth <= pruning.lmp_max_depth)
+            .then_some(pruning.lmp_base + depth * depth);
+        let mut quiets_seen: i32 = 0;
+
         // Null Move Pruning
         if allow_null && !king_in_check && depth >= 3 && 
             self.chess_board.has_major_pieces() && ply > 0 &&
@@ -431,18 +833,19 @@ impl<'a> SearchWorker<'a> {
                 let next_depth = (depth - reduction).max(0); 
 
                 // Make the null move (switch sides, update en-passant/hash keys)
-                let null_move = ForwardMove { 
-                    start_sq: 0, end_sq: 0, 
-                    move_type: MoveFlag::NULL, pv_score: 0
-                };
+                let null_move = ForwardMove::new(0, 0, MoveFlag::NULL);
                 
                 self.process_forward_move(null_move);
                 
-                let null_result = self.negamax(next_depth, ply + 1, -beta, -beta + 1, None, stop_signal, false);
+                let null_result = self.negamax(next_depth, ply + 1, -beta, -beta + 1, None, control, false);
                 let mut null_score = -null_result.score;
                 
                 self.process_backward_move();
 
+                if control.is_stopped() {
+                    return SearchResult { score: 0, best_move: None };
+                }
+
                 if null_score >= MATE_THRESHOLD {
                     null_score = beta;
                 }
@@ -454,29 +857,67 @@ impl<'a> SearchWorker<'a> {
             }
         }
 
-        for forward_move in &gen_moves {
+        // ABDADA - Moves busy on another thread wait until the picker runs dry
+        let defer_busy_moves = self.abdada && depth >= ABDADA_DEFER_DEPTH;
+        let mut deferred_moves = ArrayVec::<ForwardMove, MAX_DEFERRED_MOVES>::new();
+        let mut deferred_index = 0;
+
+        loop {
+            let (forward_move, deferred) = match move_picker.next_move(&mut self.chess_board, &self.move_history) {
+                Some(forward_move) => (forward_move, false),
+                None if deferred_index < deferred_moves.len() => {
+                    deferred_index += 1;
+                    (deferred_moves[deferred_index - 1], true)
+                },
+                None => break,
+            };
+
+            if excluding_root_moves && self.root_excluded_moves.contains(&forward_move) {
+                continue;
+            }
+
+            // Forward pruning - Never the first move, captures, promotions or checks
+            if !is_tactical(forward_move) && !deferred {
+                quiets_seen += 1;
+
+                if legal_moves_played > 0 &&
+                    (futility_pruning || lmp_limit.is_some_and(|limit| quiets_seen > limit)) &&
+                    !self.chess_board.gives_check(forward_move) {
+                    continue;
+                }
+            }
+
+            let move_key = defer_busy_moves.then(|| abdada_move_key(hash, forward_move));
+            if let Some(move_key) = move_key {
+                if !deferred && legal_moves_played > 0 && self.transposition_table.is_searching(move_key)
+                    && deferred_moves.try_push(forward_move).is_ok() {
+                    continue;
+                }
+                self.transposition_table.start_searching(move_key);
+            }
+
             // Check LMR Eligibility
             lmr_eligibility = false;
-            if depth >= 3 && moves_tried > 2 && !king_in_check && matches!(forward_move.move_type, MoveFlag::MOVE) {
+            if depth >= 3 && moves_tried > 2 && !king_in_check && matches!(forward_move.move_type(), MoveFlag::MOVE) {
                 lmr_eligibility = true;
             }
 
             // Push move (handles UCI, board state, hash, and history internally)
-            self.process_forward_move(*forward_move);
-
-            // Psuedo legal move exposes check, undo move
-            if self.chess_board.is_previous_player_king_in_check() {    
-                self.process_backward_move();
-                continue;
-            }
-
-            // Move is Legal, Forward Move Time Cat
+            // The move picker only hands out legal moves
+            self.process_forward_move(forward_move);
             legal_moves_played += 1;
 
-            // LMR Reduction
+            // Principal Variation Search - The first move gets the full window, later moves
+            // a null window (LMR reduced when eligible) and a re-search if they beat alpha
             let mut negamax_result;
-            if lmr_eligibility {
+            if legal_moves_played == 1 {
+                negamax_result = self.negamax(depth - 1, ply + 1, -beta, -alpha, None, control, true);
+            } else if lmr_eligibility {
                 let mut reduction = self.calculate_lmr_reduction(depth, moves_tried);
+
+                // Quiet moves with a good history are reduced less, bad ones more
+                let history_score = self.move_history.quiet_score(self.chess_board.opponent_player(), forward_move);
+                reduction = (reduction - history_score / LMR_HISTORY_DIVISOR).max(0);
                 // Introduce Lazy SMP Divergence
                 if self.thread_id > 0 {
                     // Even threads search slightly deeper on quiet lines, odd threads prune harder
@@ -490,13 +931,20 @@ impl<'a> SearchWorker<'a> {
 
                 let reduced_depth = (depth - 1 - reduction).max(1);
 
-                negamax_result = self.negamax(reduced_depth, ply + 1,  -alpha - 1, -alpha, None, stop_signal, true);
+                negamax_result = self.negamax(reduced_depth, ply + 1,  -alpha - 1, -alpha, None, control, true);
 
-                if -negamax_result.score > alpha {
-                    negamax_result = self.negamax(depth - 1, ply + 1, -beta, -alpha, None, stop_signal, true);
+                if -negamax_result.score > alpha && reduced_depth < depth - 1 {
+                    negamax_result = self.negamax(depth - 1, ply + 1, -alpha - 1, -alpha, None, control, true);
+                }
+                if -negamax_result.score > alpha && -negamax_result.score < beta {
+                    negamax_result = self.negamax(depth - 1, ply + 1, -beta, -alpha, None, control, true);
                 }
             } else {
-                negamax_result = self.negamax(depth - 1, ply + 1, -beta, -alpha, None, stop_signal, true);
+                negamax_result = self.negamax(depth - 1, ply + 1, -alpha - 1, -alpha, None, control, true);
+
+                if -negamax_result.score > alpha && -negamax_result.score < beta {
+                    negamax_result = self.negamax(depth - 1, ply + 1, -beta, -alpha, None, control, true);
+                }
             }
 
             let score = -negamax_result.score;
@@ -504,21 +952,32 @@ impl<'a> SearchWorker<'a> {
             // Undo Move + TimeCat
             self.process_backward_move();
 
+            if let Some(move_key) = move_key {
+                self.transposition_table.finish_searching(move_key);
+            }
+
+            // Aborted scores are meaningless - Unwind without touching the Transposition Table
+            if control.is_stopped() {
+                return SearchResult { score: 0, best_move };
+            }
+
             // Track maximum evaluations
             if score > best_score {
                 best_score = score;
-                best_move = Some(*forward_move);
+                best_move = Some(forward_move);
             }
 
             // Alpha-Beta Cutoff
             if best_score >= beta {
                 // Adjust mate scores to absolute bounds before saving
-                self.transposition_table.store(
-                    hash, best_score, ply, best_move, depth, HashFlag::LOWERBOUND
-                );
+                if !excluding_root_moves {
+                    self.transposition_table.store(
+                        hash, best_score, ply, best_move, depth, HashFlag::LOWERBOUND
+                    );
+                }
 
                 // Move Triggered a Beta Cutoff - Store as Killer Move
-                self.store_killer_move(*forward_move, depth);
+                self.update_move_history(forward_move, depth, &quiets_tried, &captures_tried);
 
                 return SearchResult { score: best_score, best_move };
             }
@@ -527,6 +986,9 @@ impl<'a> SearchWorker<'a> {
                 alpha = score;
             }
 
+            let tried = if is_tactical(forward_move) { &mut captures_tried } else { &mut quiets_tried };
+            let _ = tried.try_push(forward_move);
+
             moves_tried += 1;
         }
 
@@ -564,7 +1026,9 @@ impl<'a> SearchWorker<'a> {
         };
 
         // Adjust mate scores to absolute bounds before saving final loop results
-        self.transposition_table.store(hash, best_score, ply, best_move, depth, flag);
+        if !excluding_root_moves {
+            self.transposition_table.store(hash, best_score, ply, best_move, depth, flag);
+        }
         SearchResult { score: best_score, best_move }
     }
 
@@ -576,18 +1040,21 @@ impl<'a> SearchWorker<'a> {
 
     // Quiescence Search 
     fn quiescence_search(&mut self, mut alpha: i32, mut beta: i32, ply: i32, 
-        depth: i32, stop_signal: &AtomicBool) -> i32 {
+        depth: i32, control: &SearchControl) -> i32 {
             
         // Nodes Processed
         self.nodes_processed += 1;
 
-        // Halt Signal
-        if self.nodes_processed & 0x3FFF == 0 && stop_signal.load(Ordering::Relaxed) {
+        // Halt Signal - Report nodes and check the limits periodically
+        if self.nodes_processed & POLL_MASK == 0 {
+            control.poll(self.thread_id as usize, self.nodes_processed);
+        }
+        if control.is_stopped() {
             return 0;
         }
 
-        // Three Move Repetition Draw
-        if self.is_three_move_repetition() {
+        // Draw by rule
+        if self.is_draw() {
             return 0;
         }
 
@@ -599,9 +1066,7 @@ impl<'a> SearchWorker<'a> {
             let retrieved_depth: i32 = tt_entry.depth as i32;
             
             if tt_entry.move_id != 0 {
-                let mut mv = ForwardMove::unpack(tt_entry.move_id);
-                mv.pv_score = -2_000_000;
-                pv_move_hint = Some(mv);
+                pv_move_hint = Some(ForwardMove::unpack(tt_entry.move_id));
             };
 
             if retrieved_depth >= depth {
@@ -650,42 +1115,41 @@ impl<'a> SearchWorker<'a> {
         let mut best_move = None;
         let mut hash_flag = HashFlag::UPPERBOUND;
 
-        // Generate strictly legal tactical moves directly onto the global stack
-        let mut gen_moves = ArrayVec::<ForwardMove, 256>::new();
-
-        if king_in_check {
-            // King IS in check: Generate all Moves
-            self.chess_board.generate_moves(&mut gen_moves, pv_move_hint, 
-                depth, &self.killer_move_table);
+        let mut move_picker = if king_in_check {
+            // King IS in check: Search all Moves
+            MovePicker::new(pv_move_hint, [None; 2], None)
         } else {
-            // King is NOT in check: Only generate captures, promotions, etc.
-            self.filter_psuedo_legal_quiescence_moves(&mut gen_moves);
-        }
+            // King is NOT in check: Only captures, promotions, etc. Losing captures are pruned by SEE
+            MovePicker::tactical(pv_move_hint)
+        };
 
         // Quiscence Search
-        for forward_move in &gen_moves {
-            // Push move (handles UCI, board state, hash, and history internally)
-            self.process_forward_move(*forward_move);
-            
-            // Psuedo legal move exposes check, undo move
-            if self.chess_board.is_previous_player_king_in_check() {
-                self.process_backward_move();
+        while let Some(forward_move) = move_picker.next_move(&mut self.chess_board, &self.move_history) {
+            // Delta Pruning - Winning the captured piece for free still leaves us below alpha
+            if !king_in_check && forward_move.move_type() != MoveFlag::PROMOTIONQUEEN
+                && static_eval + captured_value(&self.chess_board, forward_move) + DELTA_MARGIN <= alpha {
                 continue;
             }
 
-            // Move is Legal, Forward Move Time Cat
+            // Push move (handles UCI, board state, hash, and history internally)
+            // The move picker only hands out legal moves
+            self.process_forward_move(forward_move);
             legal_moves_played += 1;
 
             // Negamax search call
-            let score = -self.quiescence_search(-beta, -alpha, ply + 1, depth - 1, stop_signal);
+            let score = -self.quiescence_search(-beta, -alpha, ply + 1, depth - 1, control);
             
             // Undo Move + TimeCat
             self.process_backward_move();
 
+            if control.is_stopped() {
+                return 0;
+            }
+
             // Fail-soft updates
             if score > best_score {
                 best_score = score;
-                best_move = Some(*forward_move);
+                best_move = Some(forward_move);
 
                 if score > alpha {
                     alpha = score;
@@ -707,19 +1171,10 @@ impl<'a> SearchWorker<'a> {
         self.transposition_table.store(hash, best_score, ply, best_move, depth, hash_flag);
         best_score
     }   
+}
 
-    // Filter all Capture & Promotion Moves
-    fn filter_psuedo_legal_quiescence_moves(&mut self, 
-        gen_moves: &mut ArrayVec::<ForwardMove, 256>
-    ) {
-        self.chess_board.generate_moves(gen_moves, None, 
-            -1, &self.killer_move_table);
-        gen_moves.retain(|cmd| {
-            matches!(
-                cmd.move_type,
-                MoveFlag::PROMOTIONQUEEN | 
-                MoveFlag::CAPTURE | MoveFlag::ENPASSANT
-            )
-        });
-    }
-}
\ No newline at end of file
+// ABDADA key of a move in a position - Zero never comes up in practice, so it marks a free slot
+#[inline(always)]
+fn abdada_move_key(hash: u64, forward_move: ForwardMove) -> u64 {
+    hash ^ (forward_move.pack() as u64 + 1).wrapping_mul(0x9E37_79B9_7F4A_7C15)
+}
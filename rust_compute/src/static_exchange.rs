@@ -0,0 +1,207 @@
+use crate::bishop_mask::*;
+use crate::chess_board::*;
+use crate::king_mask::*;
+use crate::knight_mask::*;
+use crate::move_command::*;
+use crate::pawn_mask::*;
+use crate::rook_mask::*;
+
+// Exchange values (centipawns) - Same scale as the null move static eval
+pub const SEE_PAWN: i32 = 100;
+pub const SEE_KNIGHT: i32 = 300;
+pub const SEE_BISHOP: i32 = 300;
+pub const SEE_ROOK: i32 = 500;
+pub const SEE_QUEEN: i32 = 900;
+pub const SEE_KING: i32 = 20000;
+
+// Recapture order, least valuable first
+const SEE_ATTACKER_VALUES: [i32; 5] = [SEE_PAWN, SEE_KNIGHT, SEE_BISHOP, SEE_ROOK, SEE_QUEEN];
+
+pub fn see_value(piece: BoardPiece) -> i32 {
+    match piece {
+        BoardPiece::WPAWN | BoardPiece::BPAWN => SEE_PAWN,
+        BoardPiece::WKNIGHT | BoardPiece::BKNIGHT => SEE_KNIGHT,
+        BoardPiece::WBISHOP | BoardPiece::BBISHOP => SEE_BISHOP,
+        BoardPiece::WROOK | BoardPiece::BROOK => SEE_ROOK,
+        BoardPiece::WQUEEN | BoardPiece::BQUEEN => SEE_QUEEN,
+        BoardPiece::WKING | BoardPiece::BKING => SEE_KING,
+        BoardPiece::NONE => 0,
+    }
+}
+
+// Material won by the capture itself - En passant takes a pawn from an empty square
+pub fn captured_value(chess_board: &ChessBoard, forward_move: ForwardMove) -> i32 {
+    match forward_move.move_type() {
+        MoveFlag::ENPASSANT => SEE_PAWN,
+        _ => see_value(chess_board.mailbox_piece(forward_move.end_sq())),
+    }
+}
+
+// Static Exchange Evaluation - Does the exchange started by this move on its target
+// square gain at least threshold? Both sides recapture with their least valuable
+// attacker and may stop when continuing would lose; sliders behind a capturing piece
+// join in as x-rays. Pins and promotion gains are ignored, castling exchanges nothing.
+pub fn see_ge(chess_board: &ChessBoard, forward_move: ForwardMove, threshold: i32) -> bool {
+    if matches!(forward_move.move_type(), MoveFlag::KINGSIDECASTLE | MoveFlag::QUEENSIDECASTLE) {
+        return threshold <= 0;
+    }
+
+    let (from_sq, to_sq) = (forward_move.start_sq(), forward_move.end_sq());
+
+    // Best case: the capture stands
+    let mut swap = captured_value(chess_board, forward_move) - threshold;
+    if swap < 0 {
+        return false;
+    }
+
+    // Worst case: the moving piece is lost right away
+    swap = see_value(chess_board.mailbox_piece(from_sq)) - swap;
+    if swap <= 0 {
+        return true;
+    }
+
+    let mut occupied = chess_board.occupied ^ (1u64 << from_sq) ^ (1u64 << to_sq);
+    if forward_move.move_type() == MoveFlag::ENPASSANT {
+        let captured_sq = match chess_board.active_player() {
+            Side::WHITE => to_sq - 8,
+            Side::BLACK => to_sq + 8,
+        };
+        occupied ^= 1u64 << captured_sq;
+    }
+
+    let diagonal_sliders = chess_board.bishops[0] | chess_board.bishops[1]
+        | chess_board.queens[0] | chess_board.queens[1];
+    let orthogonal_sliders = chess_board.rooks[0] | chess_board.rooks[1]
+        | chess_board.queens[0] | chess_board.queens[1];
+
+    let mut attackers = attackers_to(chess_board, to_sq, occupied);
+    let mut side = chess_board.player_index(chess_board.active_player());
+
+    // 1 while the side that made the last capture is winning the exchange
+    let mut result = 1;
+
+    loop {
+        side ^= 1;
+        attackers &= occupied;
+
+        let side_attackers = attackers & chess_board.all_pieces[side];
+        if side_attackers == 0 {
+            break;
+        }
+        result ^= 1;
+
+        // Least valuable attacker recaptures - Pawn, knight, bishop, rook, queen
+        let Some((kind, attacker_bb)) = [
+            chess_board.pawns[side],
+            chess_board.knights[side],
+            chess_board.bishops[side],
+            chess_board.rooks[side],
+            chess_board.queens[side],
+        ]
+        .into_iter()
+        .map(|pieces| pieces & side_attackers)
+        .enumerate()
+        .find(|(_, pieces)| *pieces != 0) else {
+            // Only the king is left - It may only recapture if nothing defends the square
+            let defenders = attackers & !chess_board.all_pieces[side];
+            return if defenders != 0 { result ^ 1 != 0 } else { result != 0 };
+        };
+
+        swap = SEE_ATTACKER_VALUES[kind] - swap;
+        if swap < result {
+            break;
+        }
+
+        occupied ^= attacker_bb & attacker_bb.wrapping_neg();
+
+        // Sliders lined up behind the capturing piece - Pawns and bishops open diagonals,
+        // rooks files and ranks, queens both
+        if matches!(kind, 0 | 2 | 4) {
+            attackers |= bishop_attack_paths(to_sq, occupied) & diagonal_sliders;
+        }
+        if matches!(kind, 3 | 4) {
+            attackers |= rook_attack_paths(to_sq, occupied) & orthogonal_sliders;
+        }
+    }
+
+    result != 0
+}
+
+// Pieces of both sides attacking sq for the given occupancy
+fn attackers_to(chess_board: &ChessBoard, sq: usize, occupied: u64) -> u64 {
+    let sq_bb = 1u64 << sq;
+
+    (black_pawn_attacks(sq_bb) & chess_board.pawns[0])
+        | (white_pawn_attacks(sq_bb) & chess_board.pawns[1])
+        | (KNIGHT_ATTACKS[sq] & (chess_board.knights[0] | chess_board.knights[1]))
+        | (KING_ATTACKS[sq] & (chess_board.kings[0] | chess_board.kings[1]))
+        | (bishop_attack_paths(sq, occupied) & (chess_board.bishops[0] | chess_board.bishops[1]
+            | chess_board.queens[0] | chess_board.queens[1]))
+        | (rook_attack_paths(sq, occupied) & (chess_board.rooks[0] | chess_board.rooks[1]
+            | chess_board.queens[0] | chess_board.queens[1]))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::nnue_network::test_network;
+    use crate::parser::parse_forward_move_with_board;
+
+    fn board_from_fen(fen: &str) -> ChessBoard {
+        let mut board = ChessBoard::new(test_network());
+        board.load_fen(fen).unwrap();
+        board
+    }
+
+    // see_ge holds up to the exact exchange value and fails one centipawn above it
+    fn assert_see(fen: &str, uci: &str, exchange_value: i32) {
+        let board = board_from_fen(fen);
+        let forward_move = parse_forward_move_with_board(uci, &board);
+
+        assert!(see_ge(&board, forward_move, exchange_value), "{} in {} gains {}", uci, fen, exchange_value);
+        assert!(!see_ge(&board, forward_move, exchange_value + 1), "{} in {} gains only {}", uci, fen, exchange_value);
+    }
+
+    #[test]
+    fn threshold_at_zero() {
+        // Knight for knight, recaptured by a pawn
+        assert_see("6k1/8/4p3/3n4/8/4N3/8/6K1 w - - 0 1", "e3d5", 0);
+        // Undefended pawn
+        assert_see("6k1/8/8/3p4/8/4N3/8/6K1 w - - 0 1", "e3d5", SEE_PAWN);
+        // Queen takes a defended pawn
+        assert_see("6k1/8/4p3/3p4/8/8/8/3Q2K1 w - - 0 1", "d1d5", SEE_PAWN - SEE_QUEEN);
+        // Quiet move to an attacked square
+        assert_see("6k1/8/4p3/8/8/4N3/8/6K1 w - - 0 1", "e3d5", -SEE_KNIGHT);
+    }
+
+    #[test]
+    fn xray_recapture_through_a_battery() {
+        // Rook behind rook - The back rook retakes once the front one has gone
+        assert_see("3r2k1/3n4/8/8/8/8/3R4/3R2K1 w - - 0 1", "d2d7", SEE_KNIGHT);
+        // Queen behind rook
+        assert_see("3r2k1/3n4/8/8/8/8/3R4/3Q2K1 w - - 0 1", "d2d7", SEE_KNIGHT);
+        // No battery - Rook for knight
+        assert_see("3r2k1/3n4/8/8/8/8/3R4/6K1 w - - 0 1", "d2d7", SEE_KNIGHT - SEE_ROOK);
+    }
+
+    #[test]
+    fn pinned_defender_still_recaptures() {
+        // The d7 knight is pinned to its king but still counts as a defender - Pins are ignored
+        assert_see("4k3/3n4/8/1B2p3/2N5/8/8/4K3 w - - 0 1", "c4e5", SEE_PAWN - SEE_KNIGHT);
+    }
+
+    #[test]
+    fn en_passant() {
+        // Pawn for pawn
+        assert_see("6k1/2p5/8/3pP3/8/8/8/6K1 w - d6 0 1", "e5d6", 0);
+        // The captured pawn leaves d5, so the d1 rook guards d6 and the d8 rook can't retake
+        assert_see("3r2k1/8/8/3pP3/8/8/8/3R2K1 w - d6 0 1", "e5d6", SEE_PAWN);
+    }
+
+    #[test]
+    fn promotion_captures() {
+        // Only the captured piece counts, the promoted pawn is valued as a pawn
+        assert_see("r5k1/1P6/8/8/8/8/8/6K1 w - - 0 1", "b7a8q", SEE_ROOK);
+        assert_see("r5k1/1P6/1n6/8/8/8/8/6K1 w - - 0 1", "b7a8q", SEE_ROOK - SEE_PAWN);
+    }
+}
@@ -0,0 +1,113 @@
+// Core pinning and NUMA placement for the search threads - Only supported on Linux.
+// macOS does not expose thread to core affinity on Apple Silicon.
+
+// Cores the process is allowed to run on
+#[cfg(target_os = "linux")]
+pub fn allowed_cores() -> Vec<usize> {
+    unsafe {
+        let mut cpu_set: libc::cpu_set_t = std::mem::zeroed();
+        if libc::sched_getaffinity(0, std::mem::size_of::<libc::cpu_set_t>(), &mut cpu_set) != 0 {
+            return Vec::new();
+        }
+
+        (0..libc::CPU_SETSIZE as usize)
+            .filter(|core_id| libc::CPU_ISSET(*core_id, &cpu_set))
+            .collect()
+    }
+}
+
+#[cfg(not(target_os = "linux"))]
+pub fn allowed_cores() -> Vec<usize> {
+    Vec::new()
+}
+
+// Allowed cores of each NUMA node, nodes in order - Empty if the topology can't be read
+#[cfg(target_os = "linux")]
+pub fn numa_nodes() -> Vec<Vec<usize>> {
+    let allowed = allowed_cores();
+    let Ok(entries) = std::fs::read_dir("/sys/devices/system/node") else {
+        return Vec::new();
+    };
+
+    let mut nodes: Vec<(usize, Vec<usize>)> = entries
+        .filter_map(|entry| entry.ok())
+        .filter_map(|entry| {
+            let node_id = entry.file_name().to_str()?.strip_prefix("node")?.parse().ok()?;
+            let cpu_list = std::fs::read_to_string(entry.path().join("cpulist")).ok()?;
+            let cores: Vec<usize> = parse_cpu_list(&cpu_list).into_iter()
+                .filter(|core_id| allowed.contains(core_id))
+                .collect();
+            (!cores.is_empty()).then_some((node_id, cores))
+        })
+        .collect();
+
+    nodes.sort_by_key(|(node_id, _)| *node_id);
+    nodes.into_iter().map(|(_, cores)| cores).collect()
+}
+
+#[cfg(not(target_os = "linux"))]
+pub fn numa_nodes() -> Vec<Vec<usize>> {
+    Vec::new()
+}
+
+// Kernel cpu list format - "0-3,8-11"
+#[cfg(target_os = "linux")]
+fn parse_cpu_list(cpu_list: &str) -> Vec<usize> {
+    cpu_list.trim()
+        .split(',')
+        .filter_map(|range| match range.split_once('-') {
+            Some((first, last)) => Some(first.parse().ok()?..=last.parse().ok()?),
+            None => range.parse().ok().map(|core_id| core_id..=core_id),
+        })
+        .flatten()
+        .collect()
+}
+
+// (core, NUMA node) of each search thread - Empty if the cores can't be listed.
+// The cores are ordered node by node and the threads spread evenly over them, so each node
+// takes a contiguous block of threads in proportion to its cores. Beyond one thread per
+// core the threads wrap around.
+pub fn thread_placement(threads: usize) -> Vec<(usize, usize)> {
+    let mut nodes = numa_nodes();
+    if nodes.is_empty() {
+        nodes = vec![allowed_cores()];
+    }
+
+    let cores: Vec<(usize, usize)> = nodes.iter()
+        .enumerate()
+        .flat_map(|(numa_node, cores)| cores.iter().map(move |core_id| (*core_id, numa_node)))
+        .collect();
+    if cores.is_empty() {
+        return Vec::new();
+    }
+
+    (0..threads)
+        .map(|thread_id| if threads <= cores.len() {
+            cores[thread_id * cores.len() / threads]
+        } else {
+            cores[thread_id % cores.len()]
+        })
+        .collect()
+}
+
+// Returns false if the thread could not be pinned
+pub fn pin_current_thread(core_id: usize) -> bool {
+    set_current_thread_cores(&[core_id])
+}
+
+// Lets the thread run on any of the cores - Returns false if the affinity could not be set
+#[cfg(target_os = "linux")]
+pub fn set_current_thread_cores(cores: &[usize]) -> bool {
+    unsafe {
+        let mut cpu_set: libc::cpu_set_t = std::mem::zeroed();
+        for core_id in cores {
+            libc::CPU_SET(*core_id, &mut cpu_set);
+        }
+        libc::sched_setaffinity(0, std::mem::size_of::<libc::cpu_set_t>(), &cpu_set) == 0
+    }
+}
+
+#[cfg(not(target_os = "linux"))]
+pub fn set_current_thread_cores(_cores: &[usize]) -> bool {
+    false
+}
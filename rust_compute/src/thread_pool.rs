@@ -0,0 +1,205 @@
+use std::panic::{self, AssertUnwindSafe};
+use std::sync::{Arc, Condvar, Mutex, OnceLock};
+use std::thread;
+
+use crate::search_worker::*;
+use crate::thread_affinity::*;
+
+// Work for one pooled thread - Runs on the worker the thread keeps between searches
+type ScopedPoolJob<'scope> = Box<dyn FnOnce(&mut Option<SearchWorker>) + Send + 'scope>;
+type PoolJob = ScopedPoolJob<'static>;
+
+#[derive(Default)]
+struct ThreadState {
+    job: Option<PoolJob>,
+    finished: bool,
+    panicked: bool,
+    // Set for a parked thread the pool no longer needs - It exits instead of waiting
+    retired: bool,
+}
+
+// A parked search thread - Woken through its condvar when a job is posted
+#[derive(Default)]
+struct PooledThread {
+    state: Mutex<ThreadState>,
+    job_posted: Condvar,
+    job_finished: Condvar,
+}
+
+impl PooledThread {
+    fn spawn() -> Arc<Self> {
+        let pooled_thread = Arc::new(Self::default());
+
+        let thread_ref = Arc::clone(&pooled_thread);
+        thread::spawn(move || {
+            // Long-lived worker - Allocated by the first search, reset in place afterwards
+            let mut search_worker: Option<SearchWorker> = None;
+            // Affinity inherited at spawn - Restored after every job, so a search that pinned
+            // the thread doesn't leave it pinned for the next one
+            let spawn_cores = allowed_cores();
+
+            loop {
+                let job = {
+                    let mut state = thread_ref.state.lock().unwrap();
+                    loop {
+                        if let Some(job) = state.job.take() {
+                            break job;
+                        }
+                        if state.retired {
+                            return;
+                        }
+                        state = thread_ref.job_posted.wait(state).unwrap();
+                    }
+                };
+
+                let result = panic::catch_unwind(AssertUnwindSafe(|| job(&mut search_worker)));
+                if result.is_err() {
+                    // The worker may have been left mid-search
+                    search_worker = None;
+                }
+                if !spawn_cores.is_empty() {
+                    set_current_thread_cores(&spawn_cores);
+                }
+
+                let mut state = thread_ref.state.lock().unwrap();
+                state.finished = true;
+                state.panicked = result.is_err();
+                thread_ref.job_finished.notify_all();
+            }
+        });
+
+        pooled_thread
+    }
+
+    fn post(&self, job: PoolJob) {
+        let mut state = self.state.lock().unwrap();
+        state.job = Some(job);
+        state.finished = false;
+        state.panicked = false;
+        self.job_posted.notify_one();
+    }
+
+    // Only called on an idle thread - Its worker is dropped as it exits
+    fn retire(&self) {
+        let mut state = self.state.lock().unwrap();
+        state.retired = true;
+        self.job_posted.notify_one();
+    }
+
+    // Returns false if the job panicked
+    fn wait(&self) -> bool {
+        let mut state = self.state.lock().unwrap();
+        while !state.finished {
+            state = self.job_finished.wait(state).unwrap();
+        }
+        !state.panicked
+    }
+}
+
+// Search threads parked between searches, so a search doesn't pay for spawning threads
+// and allocating their workers. Concurrent searches check out separate threads, more are
+// spawned when the idle ones run out. A finished search leaves at most as many idle threads
+// as it used, so lowering Threads or a burst of concurrent searches doesn't keep the extra
+// threads and workers alive. Core pinning only lasts for the job that pinned it.
+pub struct SearchThreadPool {
+    idle_threads: Mutex<Vec<Arc<PooledThread>>>,
+}
+
+static SEARCH_THREAD_POOL: OnceLock<SearchThreadPool> = OnceLock::new();
+
+pub fn search_thread_pool() -> &'static SearchThreadPool {
+    SEARCH_THREAD_POOL.get_or_init(|| SearchThreadPool { idle_threads: Mutex::new(Vec::new()) })
+}
+
+impl SearchThreadPool {
+    // Runs every job on its own pooled thread and returns their results in order.
+    // Blocks until all jobs are done, so they may borrow from the caller like scoped threads.
+    pub fn run<T, F>(&self, jobs: Vec<F>) -> Vec<T>
+    where
+        T: Send,
+        F: FnOnce(&mut Option<SearchWorker>) -> T + Send,
+    {
+        let job_count = jobs.len();
+        let threads: Vec<Arc<PooledThread>> = {
+            let mut idle_threads = self.idle_threads.lock().unwrap();
+            let reused = idle_threads.len().min(job_count);
+            let split_at = idle_threads.len() - reused;
+            let mut threads = idle_threads.split_off(split_at);
+            threads.extend((reused..job_count).map(|_| PooledThread::spawn()));
+            threads
+        };
+
+        let results: Vec<Mutex<Option<T>>> = jobs.iter().map(|_| Mutex::new(None)).collect();
+
+        for ((pooled_thread, job), result) in threads.iter().zip(jobs).zip(&results) {
+            let job: ScopedPoolJob<'_> = Box::new(move |search_worker| {
+                *result.lock().unwrap() = Some(job(search_worker));
+            });
+
+            // SAFETY: Every posted job is waited for below before run returns, panics included,
+            // so nothing the job borrows from the caller is dropped while it is still running
+            let job: PoolJob = unsafe { std::mem::transmute(job) };
+            pooled_thread.post(job);
+        }
+
+        let all_succeeded = threads.iter()
+            .fold(true, |succeeded, pooled_thread| pooled_thread.wait() && succeeded);
+        {
+            // Threads are checked out from the back, so the longest idle ones are retired
+            let mut idle_threads = self.idle_threads.lock().unwrap();
+            idle_threads.extend(threads);
+            let surplus = idle_threads.len().saturating_sub(job_count);
+            for pooled_thread in idle_threads.drain(..surplus) {
+                pooled_thread.retire();
+            }
+        }
+
+        if !all_succeeded {
+            panic!("search thread panicked");
+        }
+
+        results.into_iter()
+            .map(|result| result.into_inner().unwrap().expect("finished search thread left no result"))
+            .collect()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::sync::Weak;
+    use std::time::{Duration, Instant};
+
+    use super::*;
+
+    fn run_jobs(pool: &SearchThreadPool, count: usize) -> Vec<usize> {
+        pool.run((0..count).map(|index| move |_: &mut Option<SearchWorker>| index).collect())
+    }
+
+    #[test]
+    fn results_come_back_in_job_order() {
+        let pool = SearchThreadPool { idle_threads: Mutex::new(Vec::new()) };
+        assert_eq!(run_jobs(&pool, 4), vec![0, 1, 2, 3]);
+        assert_eq!(run_jobs(&pool, 4), vec![0, 1, 2, 3]);
+        assert_eq!(pool.idle_threads.lock().unwrap().len(), 4);
+    }
+
+    #[test]
+    fn smaller_search_retires_surplus_threads() {
+        let pool = SearchThreadPool { idle_threads: Mutex::new(Vec::new()) };
+        run_jobs(&pool, 4);
+        let parked: Vec<Weak<PooledThread>> = pool.idle_threads.lock().unwrap()
+            .iter()
+            .map(Arc::downgrade)
+            .collect();
+
+        run_jobs(&pool, 1);
+        assert_eq!(pool.idle_threads.lock().unwrap().len(), 1);
+
+        // Retired threads drop their handle as they exit
+        let deadline = Instant::now() + Duration::from_secs(5);
+        while parked.iter().filter(|pooled_thread| pooled_thread.upgrade().is_some()).count() > 1 {
+            assert!(Instant::now() < deadline, "retired threads did not exit");
+            std::thread::sleep(Duration::from_millis(1));
+        }
+    }
+}
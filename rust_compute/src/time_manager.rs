@@ -0,0 +1,135 @@
+use std::time::Duration;
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+
+use crate::chess_game::*;
+use crate::move_command::*;
+
+// Reserved for the GUI / process round trip on every move
+pub const MOVE_OVERHEAD_MS: u64 = 30;
+
+// Assumed number of moves left in sudden death time controls
+pub const DEFAULT_MOVES_TO_GO: u64 = 30;
+
+// The hard deadline may stretch the soft deadline up to this factor
+pub const HARD_LIMIT_FACTOR: u64 = 3;
+
+// Fraction (percent) of the soft deadline used, indexed by the number of
+// consecutive iterations returning the same best move
+pub const STABILITY_SCALE: [u64; 5] = [100, 85, 70, 55, 40];
+
+// Search limits in the UCI "go" vocabulary - All times in milliseconds.
+// With no limits set the search falls back to SEARCH_TIME_LIMIT and PV_DEPTH.
+#[cfg_attr(feature = "python", pyclass(get_all, set_all))]
+#[derive(Debug, Clone, Default)]
+pub struct SearchLimits {
+    pub movetime: Option<u64>,
+    pub wtime: Option<u64>,
+    pub btime: Option<u64>,
+    pub winc: Option<u64>,
+    pub binc: Option<u64>,
+    pub movestogo: Option<u64>,
+    pub nodes: Option<usize>,
+    pub depth: Option<i32>,
+    pub infinite: bool,
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl SearchLimits {
+    #[new]
+    #[pyo3(signature = (movetime=None, wtime=None, btime=None, winc=None, binc=None,
+        movestogo=None, nodes=None, depth=None, infinite=false))]
+    #[allow(clippy::too_many_arguments)]
+    fn py_new(
+        movetime: Option<u64>,
+        wtime: Option<u64>,
+        btime: Option<u64>,
+        winc: Option<u64>,
+        binc: Option<u64>,
+        movestogo: Option<u64>,
+        nodes: Option<usize>,
+        depth: Option<i32>,
+        infinite: bool,
+    ) -> Self {
+        Self { movetime, wtime, btime, winc, binc, movestogo, nodes, depth, infinite }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("{:?}", self)
+    }
+}
+
+impl SearchLimits {
+    // Deepest iteration the search may start
+    pub fn max_depth(&self) -> i32 {
+        let default_depth = if self.infinite { MAX_DEPTH - 1 } else { PV_DEPTH };
+        self.depth.unwrap_or(default_depth).clamp(1, MAX_DEPTH - 1)
+    }
+
+    fn clock(&self, side: Side) -> Option<(u64, u64)> {
+        match side {
+            Side::WHITE => self.wtime.map(|time| (time, self.winc.unwrap_or(0))),
+            Side::BLACK => self.btime.map(|time| (time, self.binc.unwrap_or(0))),
+        }
+    }
+}
+
+// Soft deadline: do not start another iteration past it.
+// Hard deadline: abort the running iteration, polled from inside the search.
+#[derive(Debug, Clone, Copy)]
+pub struct TimeManager {
+    soft_limit: Option<Duration>,
+    hard_limit: Option<Duration>,
+}
+
+impl TimeManager {
+    pub fn new(limits: &SearchLimits, side: Side) -> Self {
+        if limits.infinite {
+            return Self { soft_limit: None, hard_limit: None };
+        }
+
+        // Fixed time per move - Use all of it
+        if let Some(movetime) = limits.movetime {
+            let budget = Duration::from_millis(movetime.saturating_sub(MOVE_OVERHEAD_MS).max(1));
+            return Self { soft_limit: None, hard_limit: Some(budget) };
+        }
+
+        // Game clock - Spread the remaining time over the moves left
+        if let Some((time_left, increment)) = limits.clock(side) {
+            let usable = time_left.saturating_sub(MOVE_OVERHEAD_MS).max(1);
+            let moves_to_go = limits.movestogo.unwrap_or(DEFAULT_MOVES_TO_GO).max(1);
+
+            let soft = (usable / moves_to_go + increment * 3 / 4).min(usable);
+            let hard = (soft * HARD_LIMIT_FACTOR).min(usable / 2).max(soft);
+
+            return Self {
+                soft_limit: Some(Duration::from_millis(soft)),
+                hard_limit: Some(Duration::from_millis(hard)),
+            };
+        }
+
+        // Node or depth limited searches run without a clock
+        if limits.nodes.is_some() || limits.depth.is_some() {
+            return Self { soft_limit: None, hard_limit: None };
+        }
+
+        // Default budget - Finish early when the best move settles
+        let budget = Duration::from_secs(SEARCH_TIME_LIMIT);
+        Self { soft_limit: Some(budget), hard_limit: Some(budget) }
+    }
+
+    pub fn hard_limit_reached(&self, elapsed: Duration) -> bool {
+        self.hard_limit.is_some_and(|hard_limit| elapsed >= hard_limit)
+    }
+
+    // A stable best move shrinks the share of the soft deadline we are willing to use
+    pub fn soft_limit_reached(&self, elapsed: Duration, best_move_stability: usize) -> bool {
+        let Some(soft_limit) = self.soft_limit else {
+            return false;
+        };
+
+        let scale = STABILITY_SCALE[best_move_stability.min(STABILITY_SCALE.len() - 1)];
+        elapsed >= soft_limit * scale as u32 / 100
+    }
+}
@@ -30,36 +30,86 @@ pub struct TtBucket {
     pub always_replace: AtomicU64,  // Slot 2 (8 bytes)
 }
 
+// Buckets per cache line
+const CLUSTER_BUCKETS: usize = 4;
+
+// Four buckets on one 64-byte aligned cache line, and a key hashes to the whole cluster -
+// Probing and storing a key touches exactly one line, so two threads only write the same
+// line when their keys land in the same cluster, never through a neighbouring bucket
+#[repr(C, align(64))]
+pub struct TtCluster {
+    buckets: [TtBucket; CLUSTER_BUCKETS],
+}
+
+// ABDADA - Slots of the table of moves currently being searched
+const SEARCHING_SLOTS: usize = 1 << 15;
+
 // Condon-Thompson transposition table using packed 128-bit buckets
 // The current implementation uses a 32 MB size cache to retain the memory within
 // Apple M4 L3 Cache - This is implementation is currently unneccessary. 
 pub struct TranspositionTable {
-    buckets: Vec<TtBucket>,
+    clusters: Vec<TtCluster>,
+    // Cluster index mask
     mask: usize,
+    // ABDADA - Position / move keys some thread is searching right now. The packed
+    // entries have no spare bits for a busy count, so the marks get their own slots.
+    searching: Vec<AtomicU64>,
 }
 
 impl TranspositionTable {
     /// Creates a flat table matching the nearest power-of-two megabytes
     pub fn new(mb: usize) -> Self {
         let size_bytes = mb * 1024 * 1024;
-        let count = size_bytes / std::mem::size_of::<TtBucket>();
+        let count = size_bytes / std::mem::size_of::<TtCluster>();
         
         // Round down to power of two for fast bitwise indexing
         let power_of_two_count = count.next_power_of_two() >> 1;
         let final_count = std::cmp::max(1, power_of_two_count);
 
-        let buckets = (0..final_count)
-            .map(|_| TtBucket {
-                depth_preferred: AtomicU64::new(0),
-                always_replace: AtomicU64::new(0),
+        let clusters = (0..final_count)
+            .map(|_| TtCluster {
+                buckets: std::array::from_fn(|_| TtBucket {
+                    depth_preferred: AtomicU64::new(0),
+                    always_replace: AtomicU64::new(0),
+                }),
             })
             .collect();
         Self {
-            buckets,
+            clusters,
             mask: final_count - 1,
+            searching: (0..SEARCHING_SLOTS).map(|_| AtomicU64::new(0)).collect(),
         }
     }
 
+    /// Wipes every entry - Only call while no search is running
+    pub fn clear(&self) {
+        for bucket in self.clusters.iter().flat_map(|cluster| &cluster.buckets) {
+            bucket.depth_preferred.store(0, Ordering::Relaxed);
+            bucket.always_replace.store(0, Ordering::Relaxed);
+        }
+        for slot in &self.searching {
+            slot.store(0, Ordering::Relaxed);
+        }
+    }
+
+    // Lossy on purpose - An overwritten mark only costs a duplicated search, a stale one a deferral
+    #[inline(always)]
+    pub fn is_searching(&self, move_key: u64) -> bool {
+        self.searching[(move_key as usize) & (SEARCHING_SLOTS - 1)].load(Ordering::Relaxed) == move_key
+    }
+
+    #[inline(always)]
+    pub fn start_searching(&self, move_key: u64) {
+        self.searching[(move_key as usize) & (SEARCHING_SLOTS - 1)].store(move_key, Ordering::Relaxed);
+    }
+
+    // Leaves the slot alone if another move took it over meanwhile
+    #[inline(always)]
+    pub fn finish_searching(&self, move_key: u64) {
+        let _ = self.searching[(move_key as usize) & (SEARCHING_SLOTS - 1)]
+            .compare_exchange(move_key, 0, Ordering::Relaxed, Ordering::Relaxed);
+    }
+
     /// Packs raw components into a 64-bit word
     #[inline(always)]
     fn pack_entry(move_id: u16, score: i16, depth: i32, flag: HashFlag, key: u64, ply: i32) -> u64 {
@@ -74,7 +124,8 @@ impl TranspositionTable {
         let tag_22 = (key >> 42) & 0x3F_FFFF; 
         let mut packed = 0u64;
         packed |= (move_id as u64) & 0xFFFF;
-        packed |= (store_score as u64) << 16;
+        // Cast through u16 so negative scores don't sign-extend over the depth / tag bits
+        packed |= ((store_score as u16) as u64) << 16;
         packed |= ((depth as u8) as u64) << 32;
         packed |= tag_22 << 40;
         packed |= (flag as u8 as u64) << 62;
@@ -121,39 +172,74 @@ impl TranspositionTable {
         None
     }
 
+    #[inline(always)]
+    fn cluster(&self, key: u64) -> &TtCluster {
+        &self.clusters[(key as usize) & self.mask]
+    }
+
+    #[inline(always)]
+    fn packed_depth(packed: u64) -> i32 {
+        ((packed >> 32) & 0xFF) as i8 as i32
+    }
+
+    #[inline(always)]
+    fn same_position(packed: u64, key: u64) -> bool {
+        packed != 0 && (packed >> 40) & 0x3F_FFFF == (key >> 42) & 0x3F_FFFF
+    }
+
     #[inline(always)]
     pub fn probe(&self, key: u64, ply: i32) -> Option<TTEntry> {
-        let index = (key as usize) & self.mask;
-        let bucket = &self.buckets[index];
-        
-        // Fetching depth_preferred pulls the entire TT_Bucket cache line into L1.
-        let dp_packed = bucket.depth_preferred.load(Ordering::Relaxed);
-        if let Some(entry) = Self::unpack_entry(dp_packed, key, ply) {
-            return Some(entry);
-        }
+        // The first load pulls the whole cluster into L1, the rest of the slots are L1 hits
+        for bucket in &self.cluster(key).buckets {
+            let dp_packed = bucket.depth_preferred.load(Ordering::Relaxed);
+            if let Some(entry) = Self::unpack_entry(dp_packed, key, ply) {
+                return Some(entry);
+            }
 
-        // Fetching always_replace is an immediate L1 hit (0 penalty)
-        let ar_packed = bucket.always_replace.load(Ordering::Relaxed);
-        if let Some(entry) = Self::unpack_entry(ar_packed, key, ply) {
-            return Some(entry);
+            let ar_packed = bucket.always_replace.load(Ordering::Relaxed);
+            if let Some(entry) = Self::unpack_entry(ar_packed, key, ply) {
+                return Some(entry);
+            }
         }
-        
+
         None
     }
 
+    // The bucket already holding the key, otherwise the one with the shallowest depth slot
+    #[inline(always)]
+    fn store_bucket(&self, key: u64) -> &TtBucket {
+        let buckets = &self.cluster(key).buckets;
+        let mut target = &buckets[0];
+        let mut target_depth = i32::MAX;
+
+        for bucket in buckets {
+            let dp_packed = bucket.depth_preferred.load(Ordering::Relaxed);
+            let ar_packed = bucket.always_replace.load(Ordering::Relaxed);
+            if Self::same_position(dp_packed, key) || Self::same_position(ar_packed, key) {
+                return bucket;
+            }
+
+            let depth = if dp_packed == 0 { i32::MIN } else { Self::packed_depth(dp_packed) };
+            if depth < target_depth {
+                target = bucket;
+                target_depth = depth;
+            }
+        }
+        target
+    }
+
     #[inline(always)]
     pub fn store(&self, key: u64, score: i32, ply: i32, 
         forward_move: Option<ForwardMove>, depth: i32, flag: HashFlag) 
     {
-        let index = (key as usize) & self.mask;
-        let bucket = &self.buckets[index];
+        let bucket = self.store_bucket(key);
 
         let move_id = forward_move.map_or(0, |mv| mv.pack()); 
         let new_packed = Self::pack_entry(move_id, score as i16, depth, flag, key, ply);
 
         // --- SLOT 1: DEPTH PREFERRED ---
         let current_dp = bucket.depth_preferred.load(Ordering::Relaxed);
-        let existing_dp_depth = ((current_dp >> 32) & 0xFF) as i8 as i32;
+        let existing_dp_depth = Self::packed_depth(current_dp);
 
         if depth >= existing_dp_depth {
             // If the new entry is deeper, overwrite depth_preferred.
@@ -165,7 +251,7 @@ impl TranspositionTable {
                 Ordering::Relaxed,
             ).is_ok() {
                 let current_ar = bucket.always_replace.load(Ordering::Relaxed);
-                let existing_ar_depth = ((current_ar >> 32) & 0xFF) as i8 as i32;
+                let existing_ar_depth = Self::packed_depth(current_ar);
 
                 // Only overwrite always_replace if our demoted data is higher quality
                 if current_dp != 0 && existing_dp_depth >= existing_ar_depth {
@@ -181,7 +267,7 @@ impl TranspositionTable {
             // --- SLOT 2: FALLBACK TO ALWAYS REPLACE ---
             // If it's too shallow for the depth slot, directly write it here.
             let current_ar = bucket.always_replace.load(Ordering::Relaxed);
-            let existing_ar_depth = ((current_ar >> 32) & 0xFF) as i8 as i32;
+            let existing_ar_depth = Self::packed_depth(current_ar);
             
             // Only store shallow entries if they are deeper than the current fallback entry
             if depth >= existing_ar_depth {
@@ -0,0 +1,419 @@
+use std::io::{self, BufRead};
+use std::sync::atomic::AtomicUsize;
+use std::sync::{Arc, Condvar, Mutex};
+
+use crate::bench::*;
+use crate::chess_board::*;
+use crate::chess_game::*;
+use crate::engine_options::*;
+use crate::nnue_network::*;
+use crate::parser::*;
+use crate::perft::*;
+use crate::pruning_params::*;
+use crate::search_control::*;
+use crate::search_handle::*;
+use crate::search_worker::*;
+use crate::time_manager::*;
+use crate::transposition_table::*;
+
+pub const ENGINE_NAME: &str = "AlanBot";
+pub const ENGINE_AUTHOR: &str = "Alan Yuan";
+
+// bestmove must be held back in ponder / infinite mode until ponderhit or stop
+struct BestMoveGate {
+    released: Mutex<bool>,
+    condvar: Condvar,
+}
+
+impl BestMoveGate {
+    fn new(released: bool) -> Self {
+        Self { released: Mutex::new(released), condvar: Condvar::new() }
+    }
+
+    fn release(&self) {
+        *self.released.lock().unwrap() = true;
+        self.condvar.notify_all();
+    }
+
+    fn wait(&self) {
+        let released = self.released.lock().unwrap();
+        let _released = self.condvar.wait_while(released, |released| !*released).unwrap();
+    }
+}
+
+struct ActiveSearch {
+    task: Arc<SearchTask>,
+    gate: Arc<BestMoveGate>,
+}
+
+// Root position of the next search - Moves are validated when the position is set
+#[derive(Clone)]
+struct UciPosition {
+    fen: String,
+    moves: Vec<String>,
+}
+
+impl UciPosition {
+    fn root_worker(
+        &self,
+        transposition_table: &Arc<TranspositionTable>,
+        nnue_network: &'static NnueNetwork,
+    ) -> Result<SearchWorker, String> {
+        let mut root_worker = SearchWorker::from_fen(Arc::clone(transposition_table), nnue_network, &self.fen)?;
+        for uci_move in &self.moves {
+            root_worker.push_uci_move(uci_move)?;
+        }
+        Ok(root_worker)
+    }
+}
+
+// Universal Chess Interface front-end for tournament tooling
+pub struct UciEngine {
+    options: EngineOptions,
+    transposition_table: Arc<TranspositionTable>,
+    // Loaded on isready / first use so setoption EvalFile can come first
+    nnue_network: Option<&'static NnueNetwork>,
+
+    position: UciPosition,
+    search: Option<ActiveSearch>,
+}
+
+impl Default for UciEngine {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl UciEngine {
+    pub fn new() -> Self {
+        let options = EngineOptions::default();
+
+        Self {
+            transposition_table: Arc::new(TranspositionTable::new(options.hash_mb)),
+            options,
+            nnue_network: None,
+
+            position: UciPosition { fen: START_FEN.to_string(), moves: Vec::new() },
+            search: None,
+        }
+    }
+
+    // Read commands from stdin until quit
+    pub fn run(&mut self) {
+        for line in io::stdin().lock().lines() {
+            let Ok(line) = line else {
+                break;
+            };
+
+            if !self.handle_command(&line) {
+                break;
+            }
+        }
+
+        self.stop_search();
+    }
+
+    // Returns false on quit
+    pub fn handle_command(&mut self, line: &str) -> bool {
+        let tokens: Vec<&str> = line.split_whitespace().collect();
+        let Some((command, args)) = tokens.split_first() else {
+            return true;
+        };
+
+        match *command {
+            "uci" => self.uci(),
+            "isready" => {
+                if let Err(err) = self.network() {
+                    println!("info string {}", err);
+                }
+                println!("readyok");
+            },
+            "setoption" => self.set_option(args),
+            "ucinewgame" => {
+                self.stop_search();
+                self.transposition_table.clear();
+            },
+            "position" => self.set_position(args),
+            "go" => self.go(args),
+            "stop" => {
+                if let Some(search) = &self.search {
+                    search.task.stop();
+                    search.gate.release();
+                }
+            },
+            "ponderhit" => {
+                if let Some(search) = &self.search {
+                    search.task.ponderhit();
+                    search.gate.release();
+                }
+            },
+            "bench" => self.bench(args),
+            "quit" => return false,
+            _ => println!("info string Unknown command: {}", line.trim()),
+        }
+
+        true
+    }
+
+    fn uci(&self) {
+        let defaults = EngineOptions::default();
+
+        println!("id name {}", ENGINE_NAME);
+        println!("id author {}", ENGINE_AUTHOR);
+        println!("option name Threads type spin default {} min 1 max {}", defaults.threads, MAX_THREADS);
+        println!("option name Hash type spin default {} min 1 max {}", defaults.hash_mb, MAX_HASH_MB);
+        println!("option name EvalFile type string default {}", defaults.nnue_path);
+        println!("option name PinThreads type check default {}", defaults.pin_threads);
+        println!("option name MultiPV type spin default {} min 1 max {}", defaults.multi_pv, MAX_MULTI_PV);
+        println!("option name Ponder type check default false");
+        println!("option name ABDADA type check default {}", defaults.abdada);
+        println!("option name Clear Hash type button");
+        for (name, min, max) in PRUNING_OPTIONS {
+            let default = defaults.pruning.get(name).unwrap_or_default();
+            println!("option name {} type spin default {} min {} max {}", name, default, min, max);
+        }
+        println!("uciok");
+    }
+
+    fn network(&mut self) -> Result<&'static NnueNetwork, String> {
+        if let Some(network) = self.nnue_network {
+            return Ok(network);
+        }
+
+        let network = NnueNetwork::load_shared(&self.options.nnue_path)
+            .map_err(|err| format!("Could not load NNUE model file {}: {}", self.options.nnue_path, err))?;
+        self.nnue_network = Some(network);
+        Ok(network)
+    }
+
+    // setoption name <name> [value <value>] - Names may contain spaces
+    fn set_option(&mut self, args: &[&str]) {
+        let value_index = args.iter().position(|token| *token == "value").unwrap_or(args.len());
+        let name = args.get(1..value_index).unwrap_or_default().join(" ");
+        let value = args.get(value_index + 1..).unwrap_or_default().join(" ");
+
+        self.stop_search();
+
+        match name.to_ascii_lowercase().as_str() {
+            // The GUI decides when to ponder - Nothing to configure
+            "ponder" => {},
+            "clear hash" => self.transposition_table.clear(),
+            _ => {
+                let previous = self.options.clone();
+                if let Err(err) = self.options.set_option(&name, &value) {
+                    println!("info string {}", err);
+                    return;
+                }
+
+                if self.options.hash_mb != previous.hash_mb {
+                    self.transposition_table = Arc::new(TranspositionTable::new(self.options.hash_mb));
+                }
+                if self.options.nnue_path != previous.nnue_path {
+                    self.nnue_network = None;
+                }
+            },
+        }
+    }
+
+    // position [startpos | fen <fen>] [moves <uci moves>]
+    fn set_position(&mut self, args: &[&str]) {
+        let moves_index = args.iter().position(|token| *token == "moves").unwrap_or(args.len());
+
+        let fen = match args.first() {
+            Some(&"startpos") => START_FEN.to_string(),
+            Some(&"fen") => args[1..moves_index].join(" "),
+            _ => {
+                println!("info string Invalid position command");
+                return;
+            },
+        };
+
+        let position = UciPosition {
+            fen,
+            moves: args.get(moves_index + 1..).unwrap_or_default()
+                .iter()
+                .map(|uci_move| uci_move.to_string())
+                .collect(),
+        };
+
+        let network = match self.network() {
+            Ok(network) => network,
+            Err(err) => {
+                println!("info string {}", err);
+                return;
+            },
+        };
+
+        self.stop_search();
+        match position.root_worker(&self.transposition_table, network) {
+            Ok(_) => self.position = position,
+            Err(err) => println!("info string {}", err),
+        }
+    }
+
+    fn go(&mut self, args: &[&str]) {
+        if let Some(&"perft") = args.first() {
+            match args.get(1).map(|depth| depth.parse::<i32>()) {
+                Some(Ok(depth)) if (0..=MAX_DEPTH).contains(&depth) => self.perft(depth),
+                _ => println!("info string Invalid perft depth, expected 0 to {}", MAX_DEPTH),
+            }
+            return;
+        }
+
+        let (limits, pondering) = parse_go(args);
+
+        let network = match self.network() {
+            Ok(network) => network,
+            Err(err) => {
+                println!("info string {}", err);
+                println!("bestmove 0000");
+                return;
+            },
+        };
+
+        self.stop_search();
+
+        let gate = Arc::new(BestMoveGate::new(!(pondering || limits.infinite)));
+        let control = Arc::new(
+            SearchControl::new(limits, pondering).with_info_callback(print_info)
+        );
+
+        let transposition_table = Arc::clone(&self.transposition_table);
+        let options = self.options.clone();
+        let position = self.position.clone();
+        let thread_control = Arc::clone(&control);
+        let thread_gate = Arc::clone(&gate);
+
+        let task = SearchTask::spawn(control, move || {
+            let nodes_processed = AtomicUsize::new(0);
+
+            // Validated by the position command
+            let mut root_worker = position.root_worker(&transposition_table, network)
+                .expect("UCI position was validated when it was set");
+
+            let outcome = search_position(
+                &transposition_table, &mut root_worker, &thread_control, &nodes_processed, &options
+            );
+
+            thread_gate.wait();
+            match (outcome.best_move, outcome.ponder_move_uci()) {
+                (Some(_), Some(ponder_move)) => {
+                    println!("bestmove {} ponder {}", outcome.best_move_uci(), ponder_move);
+                },
+                (Some(_), None) => println!("bestmove {}", outcome.best_move_uci()),
+                // Checkmate or stalemate at the root
+                (None, _) => println!("bestmove 0000"),
+            }
+
+            outcome
+        });
+
+        self.search = Some(ActiveSearch { task, gate });
+    }
+
+    // go perft <depth> - Divide output in the common "move: nodes" format
+    fn perft(&mut self, depth: i32) {
+        let network = match self.network() {
+            Ok(network) => network,
+            Err(err) => {
+                println!("info string {}", err);
+                return;
+            },
+        };
+
+        self.stop_search();
+        let root_worker = self.position.root_worker(&self.transposition_table, network)
+            .expect("UCI position was validated when it was set");
+
+        let report = perft(
+            root_worker.chess_board(), depth, self.options.threads, PERFT_HASH_MB
+        );
+        for (uci_move, nodes) in &report.divide {
+            println!("{}: {}", uci_move, nodes);
+        }
+        println!();
+        println!("Nodes searched: {}", report.nodes);
+        println!("info string perft {} time {} nps {}", report.depth, report.elapsed_ms, report.nps);
+    }
+
+    // bench [depth] [threads] - JSON report on a single line
+    fn bench(&mut self, args: &[&str]) {
+        let network = match self.network() {
+            Ok(network) => network,
+            Err(err) => {
+                println!("info string {}", err);
+                return;
+            },
+        };
+
+        self.stop_search();
+        let depth = args.first().and_then(|depth| depth.parse().ok()).unwrap_or(BENCH_DEPTH);
+        let mut options = self.options.clone();
+        if let Some(threads) = args.get(1) {
+            if let Err(err) = options.set_option("threads", threads) {
+                println!("info string {}", err);
+                return;
+            }
+        }
+
+        println!("{}", run_bench(network, &options, depth));
+    }
+
+    // Stop the running search and wait for its bestmove
+    fn stop_search(&mut self) {
+        if let Some(search) = self.search.take() {
+            search.task.stop();
+            search.gate.release();
+            search.task.wait();
+        }
+    }
+}
+
+// go [ponder] [wtime <ms>] [btime <ms>] [winc <ms>] [binc <ms>] [movestogo <n>]
+//    [depth <n>] [nodes <n>] [movetime <ms>] [infinite]
+fn parse_go(args: &[&str]) -> (SearchLimits, bool) {
+    let mut limits = SearchLimits::default();
+    let mut pondering = false;
+
+    let mut tokens = args.iter();
+    while let Some(token) = tokens.next() {
+        let mut next_value = || tokens.next().and_then(|value| value.parse::<i64>().ok());
+
+        match *token {
+            "ponder" => pondering = true,
+            "infinite" => limits.infinite = true,
+            // Clocks can go negative when a GUI overshoots
+            "wtime" => limits.wtime = next_value().map(|ms| ms.max(0) as u64),
+            "btime" => limits.btime = next_value().map(|ms| ms.max(0) as u64),
+            "winc" => limits.winc = next_value().map(|ms| ms.max(0) as u64),
+            "binc" => limits.binc = next_value().map(|ms| ms.max(0) as u64),
+            "movestogo" => limits.movestogo = next_value().map(|moves| moves.max(1) as u64),
+            "movetime" => limits.movetime = next_value().map(|ms| ms.max(0) as u64),
+            "depth" => limits.depth = next_value().map(|depth| depth.clamp(1, MAX_DEPTH as i64) as i32),
+            "nodes" => limits.nodes = next_value().map(|nodes| nodes.max(1) as usize),
+            _ => {},
+        }
+    }
+
+    (limits, pondering)
+}
+
+fn print_info(info: &SearchInfo) {
+    let elapsed_ms = info.elapsed.as_millis().max(1);
+    let nps = info.nodes as u128 * 1000 / elapsed_ms;
+    let pv: Vec<String> = info.pv.iter().map(|mv| parse_uci(*mv)).collect();
+
+    println!("info depth {} multipv {} score {} nodes {} nps {} time {} pv {}",
+        info.depth, info.multipv, uci_score(info.score), info.nodes, nps, info.elapsed.as_millis(), pv.join(" "));
+}
+
+// Centipawns, or moves to mate from the side to move
+fn uci_score(score: i32) -> String {
+    if score >= MATE_THRESHOLD {
+        format!("mate {}", (MATE_VALUE - score + 1) / 2)
+    } else if score <= -MATE_THRESHOLD {
+        format!("mate -{}", (MATE_VALUE + score) / 2)
+    } else {
+        format!("cp {}", score)
+    }
+}
@@ -0,0 +1,54 @@
+import pytest
+
+rust_compute = pytest.importorskip("rust_compute")
+# The crate directory imports as a namespace package when the extension isn't built
+if not hasattr(rust_compute, "ChessGame"):
+    pytest.skip("rust_compute extension is not built", allow_module_level=True)
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+MATED_FEN = "7k/6Q1/6K1/8/8/8/8/8 b - - 0 1"
+
+INVALID_FENS = [
+    "",
+    "rnbqkbnr/pppppppp/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBKKBNR w kq - 0 1",
+    "4k3/8/8/8/8/8/8/r3K3 b - - 0 1",
+    "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e4 0 1",
+    "4k3/8/8/8/8/8/8/4K3 w - - 151 90",
+]
+
+
+@pytest.fixture(scope="module")
+def game():
+    rust_compute.init_attack_tables()
+    try:
+        return rust_compute.ChessGame()
+    except OSError as err:
+        pytest.skip(f"NNUE model not available: {err}")
+
+
+def test_set_position_fen_sets_the_root(game):
+    game.set_position_fen(KIWIPETE_FEN)
+    assert game.position_fen() == KIWIPETE_FEN
+    game.set_position_fen(START_FEN)
+
+
+@pytest.mark.parametrize("fen", INVALID_FENS)
+def test_set_position_fen_rejects_invalid_fen(game, fen):
+    game.set_position_fen(START_FEN)
+    with pytest.raises(ValueError):
+        game.set_position_fen(fen)
+    assert game.position_fen() == START_FEN
+
+
+def test_search_fens_reports_the_invalid_index(game):
+    with pytest.raises(ValueError, match="FEN 1"):
+        game.search_fens([START_FEN, INVALID_FENS[1]], rust_compute.SearchLimits(depth=1))
+
+
+def test_search_fens_returns_none_without_legal_moves(game):
+    best_moves = game.search_fens([START_FEN, MATED_FEN], rust_compute.SearchLimits(depth=1))
+    assert len(best_moves) == 2
+    assert best_moves[0] is not None
+    assert best_moves[1] is None
@@ -76,6 +76,12 @@ class ChessBoardViewModel():
                     self.takeOpponentTurn
                 ))
 
+            # Game Over - Abandon the Engine's Ponder Search
+            if self.chessGameModel.gameState != GameState.PLAYING:
+                self.threadpool.start(Worker(
+                    self.chessGameModel.stopPondering
+                ))
+
     def takeOpponentTurn(self):
         try:
             # Compute Opponent Move
@@ -92,6 +98,10 @@ class ChessBoardViewModel():
                 self.chessGameModel.gameState, 
                 self.chessGameModel.gamePlayerTurn
             )
+
+            # Think on the Human Player's Time
+            if self.chessGameModel.gameState == GameState.PLAYING and not self.computerTurn():
+                self.chessGameModel.startPondering()
         except Exception:
             # This force-prints the full error to your console
             traceback.print_exc() 